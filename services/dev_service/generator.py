@@ -424,8 +424,9 @@ def _parse_response(raw: str) -> CodeResult:
         code = ""
 
     if code.startswith("```"):
-        lines = code.split("\n")
-        code = "\n".join(lines[1:])
+        # Drop the opening fence line by slicing instead of splitting every line
+        nl = code.find("\n")
+        code = code[nl + 1 :] if nl != -1 else ""
         if code.endswith("```"):
             code = code[:-3].strip()
 
@@ -245,31 +245,25 @@ def format_code_tool(args: FormatCodeInput) -> dict[str, Any]:
                     "note": "black no está instalado; se omite el formateo automático para Python",
                 }
 
-            with tempfile.TemporaryDirectory() as tmpdir:
-                tmp_path = Path(tmpdir)
-                target = tmp_path / (args.file_path or "tmp.py")
-                if not str(target).endswith(".py"):
-                    target = target.with_suffix(".py")
-                target.parent.mkdir(parents=True, exist_ok=True)
-                target.write_text(args.code, encoding="utf-8")
-
-                proc = run_sync_hardened(
-                    ["python", "-m", "black", str(target)],
-                    cwd=str(tmp_path),
-                    timeout_s=25.0,
-                    max_stdout_bytes=32_768,
-                    max_stderr_bytes=32_768,
-                )
-
-                formatted = target.read_text(encoding="utf-8", errors="replace")
-                return {
-                    "supported": True,
-                    "language": "python",
-                    "formatted_code": formatted,
-                    "exit_code": proc.returncode,
-                    "stdout": proc.stdout[-4000:],
-                    "stderr": proc.stderr[-2000:],
-                }
+            target = Path(args.file_path or "tmp.py")
+            if not str(target).endswith(".py"):
+                target = target.with_suffix(".py")
+            proc = run_sync_hardened(
+                ["python", "-m", "black", "-q", "--stdin-filename", str(target), "-"],
+                stdin=args.code,
+                timeout_s=25.0,
+                max_stdout_bytes=len(args.code.encode("utf-8")) * 2 + 65_536,
+                max_stderr_bytes=32_768,
+            )
+            ok = proc.returncode == 0 and not proc.timed_out
+            return {
+                "supported": True,
+                "language": "python",
+                "formatted_code": proc.stdout if ok else args.code,
+                "exit_code": proc.returncode,
+                "stdout": "",
+                "stderr": proc.stderr[-2000:],
+            }
         except Exception as exc:
             return {
                 "supported": True,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json as json_lib
 import logging
 from datetime import datetime
@@ -117,9 +118,11 @@ async def build_plan_detail_json_response(
     runtime: GatewayRuntime, plan_id: str,
 ) -> JSONResponse:
     try:
-        metrics_data = _extract_metrics_data(await aggregate_plan_metrics(runtime, plan_id))
-        tasks_data = await _safe_fetch_tasks(runtime, plan_id)
-        events_data = await _safe_fetch_plan_events(runtime, plan_id)
+        metrics_resp, (tasks_data, events_data) = await asyncio.gather(
+            aggregate_plan_metrics(runtime, plan_id),
+            _safe_fetch_plan_overview(runtime, plan_id),
+        )
+        metrics_data = _extract_metrics_data(metrics_resp)
 
         detail = _build_plan_detail_json(plan_id, metrics_data, tasks_data, events_data)
         return JSONResponse(content=detail, status_code=200)
@@ -155,26 +158,27 @@ def _extract_metrics_data(metrics_resp: dict[str, Any] | JSONResponse) -> dict[s
         return {}
 
 
-async def _safe_fetch_tasks(runtime: GatewayRuntime, plan_id: str) -> list[dict[str, Any]]:
-    try:
-        tasks_http = await runtime.http_client.get(
-            f"{runtime.cfg.memory_service_url}/tasks/{plan_id}"
-        )
-        data = tasks_http.json() if tasks_http.status_code == 200 else []
-        return data if isinstance(data, list) else []
-    except Exception:
-        return []
-
-
-async def _safe_fetch_plan_events(
+async def _safe_fetch_plan_overview(
     runtime: GatewayRuntime,
     plan_id: str,
-) -> list[dict[str, Any]]:
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Tasks and events of the plan via memory_service's single overview call."""
     try:
-        events_data, _ = await _fetch_events(runtime, plan_id=plan_id, limit=500)
-        return events_data
+        resp = await runtime.http_client.get(
+            f"{runtime.cfg.memory_service_url}/plan/{plan_id}/overview",
+            params={"events_limit": 500},
+        )
+        data = resp.json() if resp.status_code == 200 else {}
     except Exception:
-        return []
+        return [], []
+    if not isinstance(data, dict):
+        return [], []
+    tasks = data.get("tasks")
+    events = data.get("events")
+    return (
+        tasks if isinstance(tasks, list) else [],
+        events if isinstance(events, list) else [],
+    )
 
 
 def _aggregate_token_usage(
@@ -19,5 +19,5 @@ class GatewayRuntime:
     cfg: GatewayConfig
     manager: ConnectionManager
     pending_approvals: dict[str, PrApprovalPayload] = field(default_factory=dict)
-    plan_idem_cache: dict[str, tuple[dict, float]] = field(default_factory=dict)
+    plan_idem_cache: dict[bytes, tuple[dict, float]] = field(default_factory=dict)
     approvals_rate_limit_counters: dict[str, list[float]] = field(default_factory=dict)
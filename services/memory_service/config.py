@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 
-from shared.utils.env import env_str
+from shared.utils.env import env_bool, env_int, env_str
 
 
 @dataclass(frozen=True)
@@ -13,6 +14,9 @@ class MemoryConfig:
     redis_url: str
     rabbitmq_url: str
     log_level: str
+    qdrant_prefer_grpc: bool = True
+    qdrant_grpc_port: int = 6334
+    redis_max_connections: int = 64
 
     @classmethod
     def from_env(cls) -> MemoryConfig:
@@ -22,4 +26,33 @@ class MemoryConfig:
             redis_url=os.environ["REDIS_URL"],
             rabbitmq_url=os.environ["RABBITMQ_URL"],
             log_level=env_str("LOG_LEVEL", "INFO"),
+            qdrant_prefer_grpc=env_bool("QDRANT_PREFER_GRPC", True),
+            qdrant_grpc_port=env_int("QDRANT_GRPC_PORT", 6334),
+            redis_max_connections=env_int("MEMORY_REDIS_MAX_CONNECTIONS", 64),
         )
+
+
+@dataclass(frozen=True)
+class EmbedConfig:
+    model: str
+    dim: int
+    api_key: str = field(default="", repr=False)
+
+    @classmethod
+    def from_env(cls) -> EmbedConfig:
+        return cls(
+            model=env_str("EMBEDDING_MODEL", "text-embedding-3-small"),
+            dim=env_int("EMBEDDING_DIM", 384),
+            api_key=(
+                os.environ.get("EMBEDDING_API_KEY")
+                or os.environ.get("LLM_API_KEY")
+                or os.environ.get("OPENAI_API_KEY")
+                or ""
+            ),
+        )
+
+
+@lru_cache(maxsize=1)
+def embed_config() -> EmbedConfig:
+    """Embedding settings, read from the environment once per process."""
+    return EmbedConfig.from_env()
@@ -2,9 +2,24 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-
-from sqlalchemy import DateTime, Integer, String, Text, text
+import hashlib
+from datetime import datetime
+
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import Insert as PgInsert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import Insert as SqliteInsert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -18,22 +33,56 @@ class Base(DeclarativeBase):
     pass
 
 
+def event_id_hash(event_id: str) -> int:
+    """Signed 64-bit key for `event_id` (first 8 bytes of its MD5).
+
+    Mirrors `_EVENT_ID_HASH_SQL` so existing rows can be backfilled in SQL.
+    """
+    digest = hashlib.md5(event_id.encode("utf-8"), usedforsecurity=False).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+_EVENT_ID_HASH_SQL = "('x' || substr(md5(event_id), 1, 16))::bit(64)::bigint"
+
+_PAYLOAD_TO_BYTEA_SQL = """
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'event_log' AND column_name = 'payload' AND data_type = 'text'
+    ) THEN
+        ALTER TABLE event_log
+            ALTER COLUMN payload TYPE BYTEA USING convert_to(payload, 'UTF8');
+    END IF;
+END $$
+"""
+
+
 class EventLog(Base):
     __tablename__ = "event_log"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    event_id: Mapped[str] = mapped_column(String(64), unique=True, index=True)
-    event_type: Mapped[str] = mapped_column(String(64), index=True)
+    event_id: Mapped[str] = mapped_column(String(64))
+    event_id_hash: Mapped[int] = mapped_column(BigInteger, unique=True, index=True)
+    event_type: Mapped[str] = mapped_column(String(64))
     producer: Mapped[str] = mapped_column(String(128))
     idempotency_key: Mapped[str] = mapped_column(String(128), index=True)
-    payload: Mapped[str] = mapped_column(Text)
-    plan_id: Mapped[str] = mapped_column(String(64), index=True, default="")
+    # zstd-compressed JSON (see store._encode_payload)
+    payload: Mapped[bytes] = mapped_column(LargeBinary)
+    plan_id: Mapped[str] = mapped_column(String(64), default="")
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
     )
 
 
+# get_events filters by event_type and/or plan_id and reads newest first: with
+# (col, id DESC) the rows come out of the index already ordered, no sort node.
+# payload is not INCLUDEd: it is unbounded and would overflow btree tuples.
+Index("ix_event_log_type_id_desc", EventLog.event_type, EventLog.id.desc())
+Index("ix_event_log_plan_id_desc", EventLog.plan_id, EventLog.id.desc())
+
+
 class TaskState(Base):
     __tablename__ = "task_state"
 
@@ -46,8 +95,8 @@ class TaskState(Base):
     qa_attempt: Mapped[int] = mapped_column(Integer, default=0)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        server_onupdate=func.now(),
     )
 
 
@@ -76,11 +125,64 @@ async def init_db(database_url: str) -> None:
                 await conn.execute(
                     text("ALTER TABLE event_log ADD COLUMN IF NOT EXISTS plan_id VARCHAR(64)")
                 )
+        except Exception:
+            pass
+        try:
+            async with _engine.begin() as conn:
+                await conn.execute(
+                    text(
+                        "CREATE INDEX IF NOT EXISTS ix_event_log_type_id_desc "
+                        "ON event_log (event_type, id DESC)"
+                    )
+                )
+                await conn.execute(
+                    text(
+                        "CREATE INDEX IF NOT EXISTS ix_event_log_plan_id_desc "
+                        "ON event_log (plan_id, id DESC)"
+                    )
+                )
+                await conn.execute(text("DROP INDEX IF EXISTS ix_event_log_event_type"))
+                await conn.execute(text("DROP INDEX IF EXISTS ix_event_log_plan_id"))
+        except Exception:
+            pass
+        # Dedup lookups go through the 8-byte event_id_hash instead of the 64-char event_id
+        try:
+            async with _engine.begin() as conn:
+                await conn.execute(
+                    text("ALTER TABLE event_log ADD COLUMN IF NOT EXISTS event_id_hash BIGINT")
+                )
+                await conn.execute(
+                    text(
+                        f"UPDATE event_log SET event_id_hash = {_EVENT_ID_HASH_SQL} "
+                        "WHERE event_id_hash IS NULL"
+                    )
+                )
+                await conn.execute(
+                    text(
+                        "CREATE UNIQUE INDEX IF NOT EXISTS ix_event_log_event_id_hash "
+                        "ON event_log (event_id_hash)"
+                    )
+                )
+                await conn.execute(text("DROP INDEX IF EXISTS ix_event_log_event_id"))
+        except Exception:
+            pass
+        # Timestamps are filled in by the database instead of bound from Python
+        try:
+            async with _engine.begin() as conn:
+                await conn.execute(
+                    text("ALTER TABLE event_log ALTER COLUMN created_at SET DEFAULT now()")
+                )
                 await conn.execute(
-                    text("CREATE INDEX IF NOT EXISTS ix_event_log_plan_id ON event_log (plan_id)")
+                    text("ALTER TABLE task_state ALTER COLUMN updated_at SET DEFAULT now()")
                 )
         except Exception:
             pass
+        # payload moved from TEXT to BYTEA; legacy rows keep their JSON as raw bytes
+        try:
+            async with _engine.begin() as conn:
+                await conn.execute(text(_PAYLOAD_TO_BYTEA_SQL))
+        except Exception:
+            pass
 
 
 async def close_db() -> None:
@@ -89,6 +191,13 @@ async def close_db() -> None:
         await _engine.dispose()
 
 
+def conflict_insert(model: type[Base]) -> PgInsert | SqliteInsert:
+    """INSERT for the active dialect, exposing `on_conflict_do_*` (PostgreSQL/SQLite)."""
+    if _engine is not None and _engine.dialect.name == "sqlite":
+        return sqlite_insert(model)
+    return pg_insert(model)
+
+
 def get_session() -> AsyncSession:
     if _session_factory is None:
         raise RuntimeError("Database not initialized. Call init_db() first.")
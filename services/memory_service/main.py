@@ -6,14 +6,17 @@ import asyncio
 from contextlib import asynccontextmanager
 from typing import Any
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+import orjson
+from fastapi import FastAPI, HTTPException, Query, Response
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from services.memory_service.config import MemoryConfig
 from services.memory_service.database import close_db, init_db
 from services.memory_service.store import MemoryStore
+from shared.contracts.events import BaseEvent, EventType
 from shared.logging.logger import setup_logging
 from shared.middleware.correlation import install_correlation_middleware
+from shared.observability.metrics import redis_pool_connections
 from shared.observability.routing import register_health_metrics_routes
 
 SERVICE_NAME = "memory_service"
@@ -23,6 +26,18 @@ _STARTUP_RETRIES = int(__import__("os").environ.get("MEMORY_STARTUP_RETRIES", "1
 _STARTUP_DELAY_SEC = float(__import__("os").environ.get("MEMORY_STARTUP_DELAY_SEC", "3"))
 
 
+def _register_pool_metrics(s: MemoryStore) -> None:
+    """Sample Redis pool saturation at scrape time."""
+    for state in ("in_use", "available"):
+
+        def _sample(state: str = state) -> float:
+            return s.redis_pool_stats()[state]
+
+        redis_pool_connections.labels(service=SERVICE_NAME, state=state).set_function(
+            _sample
+        )
+
+
 @asynccontextmanager
 async def lifespan(application: FastAPI):
     global store
@@ -34,8 +49,15 @@ async def lifespan(application: FastAPI):
         try:
             logger.info("Initializing database (attempt %d/%d)", attempt, _STARTUP_RETRIES)
             await init_db(cfg.database_url)
-            store = MemoryStore(qdrant_url=cfg.qdrant_url, redis_url=cfg.redis_url)
+            store = MemoryStore(
+                qdrant_url=cfg.qdrant_url,
+                redis_url=cfg.redis_url,
+                prefer_grpc=cfg.qdrant_prefer_grpc,
+                grpc_port=cfg.qdrant_grpc_port,
+                redis_max_connections=cfg.redis_max_connections,
+            )
             await store.initialize()
+            _register_pool_metrics(store)
             logger.info("Memory store ready")
             last_error = None
             break
@@ -77,38 +99,91 @@ def _get_store() -> MemoryStore:
         raise HTTPException(status_code=503, detail="Store not initialized")
     return store
 
+_PAYLOAD_ADAPTER: TypeAdapter[dict[str, Any]] = TypeAdapter(dict[str, Any])
+
+
+def _json_response(content: Any) -> Response:
+    """Serialize with orjson so stored payload fragments are emitted verbatim."""
+    return Response(content=orjson.dumps(content), media_type="application/json")
+
+
 class StoreEventRequest(BaseModel):
     event_id: str
-    event_type: str
+    event_type: EventType
     producer: str
     idempotency_key: str
-    payload: dict[str, Any]
+    # Either a JSON object or that object already serialized as a JSON string.
+    # The string form is persisted as-is, skipping a re-encode in the store.
+    payload: dict[str, Any] | str
 
 
-@app.post("/events")
-async def store_event(req: StoreEventRequest):
-    from shared.contracts.events import BaseEvent, EventType
+_BULK_EVENTS_MAX = 1000
 
+
+def _to_event(req: StoreEventRequest) -> tuple[BaseEvent, bytes | None]:
+    raw_payload: bytes | None = None
+    if isinstance(req.payload, str):
+        raw_payload = req.payload.encode("utf-8")
+        try:
+            payload = _PAYLOAD_ADAPTER.validate_json(raw_payload)
+        except ValidationError as exc:
+            raise HTTPException(
+                status_code=422, detail="payload must be a JSON object"
+            ) from exc
+    else:
+        payload = req.payload
     event = BaseEvent(
         event_id=req.event_id,
-        event_type=EventType(req.event_type),
+        event_type=req.event_type,
         producer=req.producer,
         idempotency_key=req.idempotency_key,
-        payload=req.payload,
+        payload=payload,
     )
+    return event, raw_payload
+
+
+@app.post("/events")
+async def store_event(req: StoreEventRequest):
+    event, raw_payload = _to_event(req)
     s = _get_store()
-    stored = await s.store_event(event)
+    stored = await s.store_event(event, raw_payload=raw_payload)
     return {"stored": stored, "event_id": req.event_id}
 
 
+@app.post("/events/bulk")
+async def store_events_bulk(reqs: list[StoreEventRequest]):
+    """Store a JSON array of events in one transaction; `results[i]` answers `reqs[i]`."""
+    if len(reqs) > _BULK_EVENTS_MAX:
+        raise HTTPException(
+            status_code=422, detail=f"at most {_BULK_EVENTS_MAX} events per request"
+        )
+    events = [_to_event(req) for req in reqs]
+    s = _get_store()
+    stored = await s.store_events(events)
+    return {
+        "results": [
+            {"stored": flag, "event_id": req.event_id}
+            for req, flag in zip(reqs, stored, strict=True)
+        ]
+    }
+
+
 @app.get("/events")
 async def list_events(
     event_type: str | None = None,
     plan_id: str | None = None,
     limit: int = 50,
+    raw: bool = False,
 ):
+    """With `raw=true`, each row carries `payload_raw` (JSON text) instead of `payload`."""
     s = _get_store()
-    return await s.get_events(event_type=event_type, plan_id=plan_id, limit=limit)
+    events = await s.get_events(
+        event_type=event_type,
+        plan_id=plan_id,
+        limit=limit,
+        payload_as="text" if raw else "fragment",
+    )
+    return _json_response(events)
 
 class UpdateTaskRequest(BaseModel):
     task_id: str
@@ -140,6 +215,21 @@ async def get_tasks(plan_id: str):
     s = _get_store()
     return await s.get_tasks(plan_id)
 
+
+@app.get("/plan/{plan_id}/overview")
+async def plan_overview(plan_id: str, events_limit: int = 500):
+    """Tasks and events of a plan in one call (preferred path for dashboards).
+
+    Both reads run concurrently, so latency is the slower of the two instead
+    of their sum plus an extra HTTP round-trip.
+    """
+    s = _get_store()
+    tasks, events = await asyncio.gather(
+        s.get_tasks(plan_id),
+        s.get_events(plan_id=plan_id, limit=events_limit, payload_as="fragment"),
+    )
+    return _json_response({"plan_id": plan_id, "tasks": tasks, "events": events})
+
 class CacheSetRequest(BaseModel):
     key: str
     value: str
@@ -162,6 +252,29 @@ async def cache_get(key: str):
     return {"key": key, "value": value}
 
 
+class CacheSetManyRequest(BaseModel):
+    items: dict[str, str]
+    ttl: int = 3600
+
+
+class CacheGetManyRequest(BaseModel):
+    keys: list[str]
+
+
+@app.post("/cache/batch")
+async def cache_set_many(req: CacheSetManyRequest):
+    s = _get_store()
+    await s.cache_set_many(req.items, req.ttl)
+    return {"cached": len(req.items)}
+
+
+@app.post("/cache/batch/get")
+async def cache_get_many(req: CacheGetManyRequest):
+    """Missing keys map to null instead of producing a 404."""
+    s = _get_store()
+    return {"values": await s.cache_get_many(req.keys)}
+
+
 class SemanticSearchRequest(BaseModel):
     query: str
     plan_id: str | None = None
@@ -169,6 +282,13 @@ class SemanticSearchRequest(BaseModel):
     limit: int = 5
 
 
+class SemanticSearchBatchRequest(BaseModel):
+    queries: list[str]
+    plan_id: str | None = None
+    event_types: list[str] = []
+    limit: int = 5
+
+
 class FailurePatternsResponse(BaseModel):
     module: str
     qa_failed: int = 0
@@ -189,6 +309,30 @@ async def semantic_search(req: SemanticSearchRequest):
     return {"results": results}
 
 
+@app.post("/semantic/search/batch")
+async def semantic_search_batch(req: SemanticSearchBatchRequest):
+    """Several semantic queries sharing filters; `results[i]` answers `queries[i]`."""
+    s = _get_store()
+    results = await s.semantic_search_many(
+        queries=req.queries,
+        plan_id=req.plan_id,
+        event_types=req.event_types,
+        limit=req.limit,
+    )
+    return {"results": results}
+
+
+@app.post("/semantic/reindex")
+async def semantic_reindex(
+    batch_size: int = Query(256, ge=1, le=4096),
+    parallel: int = Query(4, ge=1, le=32),
+):
+    """Rebuild the Qdrant index from the event log (e.g. after recreating the collection)."""
+    s = _get_store()
+    indexed = await s.bulk_reindex_events(batch_size=batch_size, parallel=parallel)
+    return {"indexed": indexed}
+
+
 @app.get("/patterns/failures")
 async def failure_patterns(limit: int = 200):
     """Devuelve patrones agregados de fallos históricos (qa.failed, security.blocked)."""
@@ -2,94 +2,416 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
 import logging
 import os
+import time
+from collections.abc import Callable
 from datetime import datetime, timezone
-from math import log1p
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
+import httpx
+import numpy as np
+import orjson
 import redis.asyncio as aioredis
+import zstandard
 from qdrant_client import AsyncQdrantClient
 from qdrant_client.models import (
     Distance,
     FieldCondition,
     Filter,
+    MatchAny,
     MatchValue,
+    OptimizersConfigDiff,
+    PayloadSchemaType,
     PointStruct,
+    QuantizationSearchParams,
+    QueryRequest,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    ScoredPoint,
+    SearchParams,
     VectorParams,
 )
-from sqlalchemy import select
+from sqlalchemy import Select, bindparam, func, select
 
+from services.memory_service.config import embed_config
 from services.memory_service.database import (
     EventLog,
     TaskState,
+    conflict_insert,
+    event_id_hash,
     get_session,
 )
 from shared.contracts.events import BaseEvent, EventType
+from shared.http.client import create_async_http_client
 from shared.llm_adapter.tool_loop_budget import semantic_index_dedup_key
 
 logger = logging.getLogger(__name__)
 
 QDRANT_COLLECTION = "admadc_code_memory"
-EMBEDDING_DIM = int(os.environ.get("EMBEDDING_DIM", "384"))
+EMBEDDING_DIM = embed_config().dim
+
+# Concurrent _embed_text callers are coalesced into one embeddings.create call
+_EMBED_BATCH_MAX = int(os.environ.get("MEMORY_EMBED_BATCH_MAX", "64"))
+_EMBED_BATCH_WINDOW_SEC = (
+    float(os.environ.get("MEMORY_EMBED_BATCH_WINDOW_MS", "10")) / 1000.0
+)
+_EMBED_CACHE_TTL_SEC = int(os.environ.get("MEMORY_EMBED_CACHE_TTL_SEC", "86400"))
+
+# Indexed points are upserted in batches by a background worker
+_UPSERT_BATCH_MAX = int(os.environ.get("MEMORY_UPSERT_BATCH_MAX", "32"))
+_UPSERT_FLUSH_SEC = float(os.environ.get("MEMORY_UPSERT_FLUSH_MS", "200")) / 1000.0
+
+# bulk_reindex_events pauses HNSW indexing and restores this threshold (KB)
+_INDEXING_THRESHOLD_KB = int(os.environ.get("MEMORY_QDRANT_INDEXING_THRESHOLD", "20000"))
+
+# Event types that _event_to_index_text turns into searchable text
+_INDEXED_EVENT_TYPES = (
+    EventType.PLAN_CREATED,
+    EventType.PIPELINE_CONCLUSION,
+    EventType.QA_FAILED,
+    EventType.SECURITY_BLOCKED,
+    EventType.QA_PASSED,
+    EventType.SECURITY_APPROVED,
+)
+
+# Payload fields used by semantic_search filters and heuristic ranking
+_PAYLOAD_INDEXES: dict[str, PayloadSchemaType] = {
+    "plan_id": PayloadSchemaType.KEYWORD,
+    "event_type": PayloadSchemaType.KEYWORD,
+    "producer": PayloadSchemaType.KEYWORD,
+    "created_at": PayloadSchemaType.DATETIME,
+    "importance": PayloadSchemaType.FLOAT,
+    "impact": PayloadSchemaType.FLOAT,
+}
+
+# int8 vectors (4x smaller) are kept in RAM for the HNSW pass; the top
+# `limit * oversampling` candidates are rescored against the original vectors
+_QUANTIZATION = ScalarQuantization(
+    scalar=ScalarQuantizationConfig(type=ScalarType.INT8, always_ram=True),
+)
+_SEARCH_PARAMS = SearchParams(
+    quantization=QuantizationSearchParams(
+        rescore=True,
+        oversampling=float(os.environ.get("MEMORY_QDRANT_OVERSAMPLING", "2.0")),
+    ),
+)
+
+try:
+    import blake3
+except ImportError:  # blake3 is in requirements.txt; keep dev setups working
+    blake3 = None  # type: ignore[assignment]
 
 if TYPE_CHECKING:
     from openai import AsyncOpenAI
 
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_ZSTD_COMPRESSOR = zstandard.ZstdCompressor(level=3)
+_ZSTD_DECOMPRESSOR = zstandard.ZstdDecompressor()
+
+
+def _encode_payload(payload: dict[str, Any], raw: bytes | None = None) -> bytes:
+    """Compress an event payload for `EventLog.payload`.
+
+    `raw` is the payload already serialized as JSON; when given it is stored
+    verbatim instead of re-encoding `payload`.
+    """
+    return _ZSTD_COMPRESSOR.compress(raw if raw is not None else orjson.dumps(payload))
+
+
+def _payload_json(stored: bytes) -> bytes:
+    """JSON bytes of a stored payload; rows migrated from TEXT hold plain JSON."""
+    if stored[:4] == _ZSTD_MAGIC:
+        return _ZSTD_DECOMPRESSOR.decompress(stored)
+    return stored
+
+
+def _decode_payload(stored: bytes) -> dict[str, Any]:
+    return orjson.loads(_payload_json(stored))
+
+
+_PAYLOAD_READERS: dict[str, Callable[[bytes], Any]] = {
+    "dict": _decode_payload,
+    "text": lambda stored: _payload_json(stored).decode("utf-8"),
+    "fragment": lambda stored: orjson.Fragment(_payload_json(stored)),
+}
+
+
+def _events_stmt(by_type: bool, by_plan: bool) -> Select:
+    # Plain column rows: no ORM instances or identity-map bookkeeping per event
+    stmt = select(
+        EventLog.event_id,
+        EventLog.event_type,
+        EventLog.producer,
+        EventLog.payload,
+        EventLog.created_at,
+        EventLog.plan_id,
+    )
+    if by_type:
+        stmt = stmt.where(EventLog.event_type == bindparam("event_type"))
+    if by_plan:
+        stmt = stmt.where(EventLog.plan_id == bindparam("plan_id"))
+    return stmt.order_by(EventLog.id.desc()).limit(bindparam("lim"))
+
+
+# Statements are built once so each request only binds parameters; SQLAlchemy's
+# compiled cache and asyncpg's prepared statement cache do the rest.
+_STMT_EVENTS = {
+    (by_type, by_plan): _events_stmt(by_type, by_plan)
+    for by_type in (False, True)
+    for by_plan in (False, True)
+}
+_STMT_FAILURE_EVENTS = (
+    select(EventLog.event_type, EventLog.payload)
+    .where(
+        EventLog.event_type.in_(
+            [EventType.QA_FAILED.value, EventType.SECURITY_BLOCKED.value]
+        )
+    )
+    .order_by(EventLog.id.desc())
+    .limit(bindparam("lim"))
+)
+_STMT_INDEXABLE_EVENTS_PAGE = (
+    select(EventLog)
+    .where(
+        EventLog.event_type.in_([t.value for t in _INDEXED_EVENT_TYPES]),
+        EventLog.id > bindparam("after_id"),
+    )
+    .order_by(EventLog.id)
+    .limit(bindparam("lim"))
+)
+_STMT_TASKS_BY_PLAN = select(
+    TaskState.task_id,
+    TaskState.plan_id,
+    TaskState.status,
+    TaskState.file_path,
+    TaskState.code,
+    TaskState.repo_url,
+    TaskState.qa_attempt,
+).where(TaskState.plan_id == bindparam("plan_id"))
+
 
 class MemoryStore:
 
-    def __init__(self, qdrant_url: str, redis_url: str) -> None:
-        self._qdrant = AsyncQdrantClient(url=qdrant_url, check_compatibility=False)
-        self._redis = aioredis.from_url(redis_url, decode_responses=True)
-        self._embed_model = os.environ.get(
-            "EMBEDDING_MODEL", "text-embedding-3-small"
+    def __init__(
+        self,
+        qdrant_url: str,
+        redis_url: str,
+        *,
+        prefer_grpc: bool = False,
+        grpc_port: int = 6334,
+        redis_max_connections: int = 64,
+    ) -> None:
+        # gRPC multiplexes Qdrant calls over one HTTP/2 channel per client
+        self._qdrant = AsyncQdrantClient(
+            url=qdrant_url,
+            prefer_grpc=prefer_grpc,
+            grpc_port=grpc_port,
+            check_compatibility=False,
         )
-        self._embed_api_key = (
-            os.environ.get("EMBEDDING_API_KEY")
-            or os.environ.get("LLM_API_KEY")
-            or os.environ.get("OPENAI_API_KEY")
-            or ""
+        self._redis = aioredis.from_url(
+            redis_url,
+            decode_responses=True,
+            max_connections=redis_max_connections,
+            socket_keepalive=True,
+            health_check_interval=30,
         )
+        embed_cfg = embed_config()
+        self._embed_model = embed_cfg.model
+        self._embed_cache_prefix = f"emb:v2:{embed_cfg.model}:{embed_cfg.dim}:"
+        # None means hash-based embeddings (no API key or no openai package)
         self._embed_client: AsyncOpenAI | None = None
+        self._embed_http: httpx.AsyncClient | None = None
+        if embed_cfg.api_key:
+            try:
+                from openai import AsyncOpenAI
+            except ImportError:
+                logger.warning(
+                    "openai package not available, falling back to hash-based embeddings"
+                )
+            else:
+                # One pooled keep-alive client: no TLS handshake per embedding batch,
+                # and concurrent batches multiplex over HTTP/2 when h2 is installed
+                self._embed_http = create_async_http_client(
+                    default_timeout=30.0,
+                    timeout_env_var="EMBEDDING_REQUEST_TIMEOUT",
+                    inject_correlation_headers=False,
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_connections=64, max_keepalive_connections=64
+                    ),
+                )
+                self._embed_client = AsyncOpenAI(
+                    api_key=embed_cfg.api_key, http_client=self._embed_http
+                )
+        self._embed_pending: list[tuple[str, asyncio.Future[list[float]]]] = []
+        self._embed_timer: asyncio.TimerHandle | None = None
+        self._embed_batches: set[asyncio.Task[None]] = set()
+        self._upsert_queue: asyncio.Queue[PointStruct] = asyncio.Queue()
+        self._upsert_worker: asyncio.Task[None] | None = None
 
     async def initialize(self) -> None:
         collections = await self._qdrant.get_collections()
         names = [c.name for c in collections.collections]
         if QDRANT_COLLECTION not in names:
+            # Vectors are unit-normalized before upsert, so DOT ranks like COSINE
+            # without Qdrant re-normalizing on every distance evaluation
             await self._qdrant.create_collection(
                 collection_name=QDRANT_COLLECTION,
                 vectors_config=VectorParams(
                     size=EMBEDDING_DIM,
-                    distance=Distance.COSINE,
+                    distance=Distance.DOT,
                 ),
+                quantization_config=_QUANTIZATION,
             )
             logger.info("Created Qdrant collection %s", QDRANT_COLLECTION)
+        else:
+            await self._check_existing_collection()
+        # Also runs for existing collections; Qdrant treats a re-create as a no-op
+        for field, schema in _PAYLOAD_INDEXES.items():
+            try:
+                await self._qdrant.create_payload_index(
+                    collection_name=QDRANT_COLLECTION,
+                    field_name=field,
+                    field_schema=schema,
+                )
+            except Exception:
+                logger.warning(
+                    "Could not create Qdrant payload index on %s", field, exc_info=True
+                )
+
+    async def _check_existing_collection(self) -> None:
+        """Enable quantization on older collections and flag a legacy distance.
+
+        Quantization can be added in place; the distance cannot, so collections
+        created with COSINE must be recreated to switch to DOT.
+        """
+        try:
+            info = await self._qdrant.get_collection(QDRANT_COLLECTION)
+            vectors = info.config.params.vectors
+            distance = vectors.distance if isinstance(vectors, VectorParams) else None
+        except Exception:
+            logger.debug("Could not inspect Qdrant collection config", exc_info=True)
+            return
+        if info.config.quantization_config is None:
+            try:
+                await self._qdrant.update_collection(
+                    collection_name=QDRANT_COLLECTION,
+                    quantization_config=_QUANTIZATION,
+                )
+                logger.info("Enabled int8 quantization on %s", QDRANT_COLLECTION)
+            except Exception:
+                logger.warning(
+                    "Could not enable quantization on %s",
+                    QDRANT_COLLECTION,
+                    exc_info=True,
+                )
+        if distance is not None and distance != Distance.DOT:
+            logger.warning(
+                "Qdrant collection %s uses %s distance; drop it and reindex events "
+                "to use DOT on normalized vectors",
+                QDRANT_COLLECTION,
+                distance,
+            )
+
+    def redis_pool_stats(self) -> dict[str, int]:
+        """Connections currently checked out of / idle in the Redis pool."""
+        pool = self._redis.connection_pool
+        return {
+            "in_use": len(getattr(pool, "_in_use_connections", ())),
+            "available": len(getattr(pool, "_available_connections", ())),
+        }
 
     async def close(self) -> None:
+        self._start_embed_batch()
+        if self._embed_batches:
+            await asyncio.gather(*self._embed_batches, return_exceptions=True)
+        if self._upsert_worker is not None:
+            try:
+                await asyncio.wait_for(self._upsert_queue.join(), timeout=10.0)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "Dropping %d unflushed Qdrant points on shutdown",
+                    self._upsert_queue.qsize(),
+                )
+            self._upsert_worker.cancel()
+        if self._embed_http is not None:
+            await self._embed_http.aclose()
         await self._qdrant.close()
         await self._redis.close()
 
-    async def store_event(self, event: BaseEvent) -> bool:
-        """Persist an event. Returns False if duplicate (idempotency)."""
+    async def store_event(
+        self, event: BaseEvent, raw_payload: bytes | None = None
+    ) -> bool:
+        """Persist an event. Returns False if duplicate (idempotency).
+
+        `raw_payload` is `event.payload` as received JSON, stored without re-encoding.
+        """
+        stmt = (
+            conflict_insert(EventLog)
+            .values(self._event_row(event, raw_payload))
+            .on_conflict_do_nothing(index_elements=[EventLog.event_id_hash])
+            .returning(EventLog.id)
+        )
         async with get_session() as session:
-            existing = await session.execute(
-                select(EventLog).where(EventLog.event_id == event.event_id)
-            )
-            if existing.scalar_one_or_none():
-                return False
-
-            row = EventLog(
-                event_id=event.event_id,
-                event_type=event.event_type.value,
-                producer=event.producer,
-                idempotency_key=event.idempotency_key,
-                payload=json.dumps(event.payload),
-                plan_id=str(event.payload.get("plan_id", "")),
-            )
-            session.add(row)
+            inserted = (await session.execute(stmt)).scalar_one_or_none()
             await session.commit()
+        if inserted is None:
+            return False
+        await self._index_stored_event(event)
+        return True
+
+    async def store_events(
+        self, events: list[tuple[BaseEvent, bytes | None]]
+    ) -> list[bool]:
+        """Persist many events with one multi-row INSERT and one commit.
+
+        Returns one flag per input, False for duplicates (already stored, or
+        repeated earlier in the same batch), like `store_event`.
+        """
+        rows: dict[int, dict[str, Any]] = {}
+        for event, raw_payload in events:
+            row = self._event_row(event, raw_payload)
+            rows.setdefault(row["event_id_hash"], row)
+        if not rows:
+            return []
+        stmt = (
+            conflict_insert(EventLog)
+            .values(list(rows.values()))
+            .on_conflict_do_nothing(index_elements=[EventLog.event_id_hash])
+            .returning(EventLog.event_id_hash)
+        )
+        async with get_session() as session:
+            pending = set((await session.execute(stmt)).scalars().all())
+            await session.commit()
+
+        stored: list[bool] = []
+        for event, _ in events:
+            key = event_id_hash(event.event_id)
+            if key in pending:
+                pending.discard(key)
+                stored.append(True)
+                await self._index_stored_event(event)
+            else:
+                stored.append(False)
+        return stored
+
+    @staticmethod
+    def _event_row(event: BaseEvent, raw_payload: bytes | None) -> dict[str, Any]:
+        return {
+            "event_id": event.event_id,
+            "event_id_hash": event_id_hash(event.event_id),
+            "event_type": event.event_type.value,
+            "producer": event.producer,
+            "idempotency_key": event.idempotency_key,
+            "payload": _encode_payload(event.payload, raw_payload),
+            "plan_id": str(event.payload.get("plan_id", "")),
+        }
+
+    async def _index_stored_event(self, event: BaseEvent) -> None:
         try:
             await self._index_event_for_search(event)
         except Exception:
@@ -97,28 +419,36 @@ class MemoryStore:
                 "Failed to index event %s for semantic search",
                 event.event_id[:8],
             )
-        return True
 
     async def get_events(
         self,
         event_type: str | None = None,
         plan_id: str | None = None,
         limit: int = 50,
+        payload_as: Literal["dict", "text", "fragment"] = "dict",
     ) -> list[dict[str, Any]]:
+        """Newest events first.
+
+        `payload_as` picks the payload form: a decoded dict, its JSON text under
+        `payload_raw`, or an `orjson.Fragment` that `orjson.dumps` splices into a
+        response without decoding and re-encoding it.
+        """
+        params: dict[str, Any] = {"lim": limit}
+        if event_type:
+            params["event_type"] = event_type
+        if plan_id:
+            params["plan_id"] = plan_id
+        stmt = _STMT_EVENTS[(bool(event_type), bool(plan_id))]
         async with get_session() as session:
-            stmt = select(EventLog).order_by(EventLog.id.desc()).limit(limit)
-            if event_type:
-                stmt = stmt.where(EventLog.event_type == event_type)
-            if plan_id:
-                stmt = stmt.where(EventLog.plan_id == plan_id)
-            result = await session.execute(stmt)
-            rows = result.scalars().all()
+            result = await session.execute(stmt, params)
+            rows = result.all()
+            payload_key = "payload_raw" if payload_as == "text" else "payload"
             return [
                 {
                     "event_id": r.event_id,
                     "event_type": r.event_type,
                     "producer": r.producer,
-                    "payload": json.loads(r.payload),
+                    payload_key: _PAYLOAD_READERS[payload_as](r.payload),
                     "created_at": r.created_at.isoformat() if r.created_at else None,
                     "plan_id": r.plan_id,
                 }
@@ -131,26 +461,15 @@ class MemoryStore:
     ) -> list[dict[str, Any]]:
         """Aggregate historical QA/security failures by module."""
         async with get_session() as session:
-            stmt = (
-                select(EventLog)
-                .where(
-                    EventLog.event_type.in_(
-                        [
-                            EventType.QA_FAILED.value,
-                            EventType.SECURITY_BLOCKED.value,
-                        ]
-                    )
-                )
-                .order_by(EventLog.id.desc())
-                .limit(limit_per_kind * 2)
+            result = await session.execute(
+                _STMT_FAILURE_EVENTS, {"lim": limit_per_kind * 2}
             )
-            result = await session.execute(stmt)
-            rows = result.scalars().all()
+            rows = result.all()
 
         patterns: dict[str, dict[str, Any]] = {}
         for r in rows:
             try:
-                payload = json.loads(r.payload)
+                payload = _decode_payload(r.payload)
             except Exception:
                 continue
             file_path = str(payload.get("file_path", "") or "")
@@ -216,7 +535,8 @@ class MemoryStore:
                 existing.repo_url = repo_url or existing.repo_url
                 if qa_attempt is not None:
                     existing.qa_attempt = qa_attempt
-                existing.updated_at = datetime.now(timezone.utc)
+                # server_onupdate only marks the column; the UPDATE must set it
+                existing.updated_at = func.now()
             else:
                 session.add(
                     TaskState(
@@ -234,28 +554,142 @@ class MemoryStore:
     async def get_tasks(self, plan_id: str) -> list[dict[str, Any]]:
         async with get_session() as session:
             result = await session.execute(
-                select(TaskState).where(TaskState.plan_id == plan_id)
+                _STMT_TASKS_BY_PLAN, {"plan_id": plan_id}
             )
-            rows = result.scalars().all()
-            return [
-                {
-                    "task_id": r.task_id,
-                    "plan_id": r.plan_id,
-                    "status": r.status,
-                    "file_path": r.file_path,
-                    "code": r.code,
-                    "repo_url": r.repo_url,
-                    "qa_attempt": getattr(r, "qa_attempt", 0),
-                }
-                for r in rows
-            ]
+            return [row._asdict() for row in result]
 
     async def store_embedding(
         self, point_id: str, vector: list[float], payload: dict[str, Any]
     ) -> None:
-        await self._qdrant.upsert(
+        """Queue a point for the background upserter (see `_drain_upserts`)."""
+        if self._upsert_worker is None:
+            self._upsert_worker = asyncio.create_task(self._drain_upserts())
+        await self._upsert_queue.put(
+            PointStruct(id=point_id, vector=vector, payload=payload)
+        )
+
+    async def _drain_upserts(self) -> None:
+        """Upsert queued points in batches of up to `_UPSERT_BATCH_MAX`."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._upsert_queue.get()]
+            deadline = loop.time() + _UPSERT_FLUSH_SEC
+            while len(batch) < _UPSERT_BATCH_MAX:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._upsert_queue.get(), remaining)
+                    )
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self._qdrant.upsert(
+                    collection_name=QDRANT_COLLECTION,
+                    points=batch,
+                    wait=False,
+                )
+            except Exception:
+                logger.exception("Failed to upsert %d points into Qdrant", len(batch))
+            finally:
+                for _ in batch:
+                    self._upsert_queue.task_done()
+
+    async def bulk_reindex_events(
+        self, batch_size: int = 256, parallel: int = 4
+    ) -> int:
+        """Rebuild the semantic index from the event log; returns points written.
+
+        HNSW indexing is paused (`indexing_threshold=0`) while points are
+        upserted so the graph is built once at the end rather than rebalanced
+        after every batch. Up to `parallel` upserts are in flight at a time.
+        """
+        # Checked before indexing is paused: a bad value must not leave it off
+        if batch_size < 1 or parallel < 1:
+            raise ValueError("batch_size and parallel must be >= 1")
+        await self._qdrant.update_collection(
             collection_name=QDRANT_COLLECTION,
-            points=[PointStruct(id=point_id, vector=vector, payload=payload)],
+            optimizers_config=OptimizersConfigDiff(indexing_threshold=0),
+        )
+        in_flight: set[asyncio.Task[Any]] = set()
+        indexed = 0
+        after_id = 0
+        try:
+            while True:
+                async with get_session() as session:
+                    result = await session.execute(
+                        _STMT_INDEXABLE_EVENTS_PAGE,
+                        {"after_id": after_id, "lim": batch_size},
+                    )
+                    rows = result.scalars().all()
+                if not rows:
+                    break
+                after_id = rows[-1].id
+
+                events: list[tuple[BaseEvent, str, dict[str, Any]]] = []
+                for r in rows:
+                    try:
+                        event = self._event_from_row(r)
+                    except Exception:
+                        logger.warning("Skipping unreadable event %s", r.event_id[:8])
+                        continue
+                    text, importance, impact, extra = self._event_to_index_text(event)
+                    if text.strip():
+                        payload = self._index_payload(
+                            event, text, importance, impact, extra
+                        )
+                        events.append((event, text, payload))
+                if not events:
+                    continue
+
+                vectors = await self._embed_texts([text for _, text, _ in events])
+                points = [
+                    PointStruct(id=event.event_id, vector=vector, payload=payload)
+                    for (event, _, payload), vector in zip(events, vectors, strict=True)
+                ]
+                if len(in_flight) >= parallel:
+                    done, in_flight = await asyncio.wait(
+                        in_flight, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        task.result()
+                in_flight.add(
+                    asyncio.create_task(
+                        self._qdrant.upsert(
+                            collection_name=QDRANT_COLLECTION,
+                            points=points,
+                            wait=False,
+                        )
+                    )
+                )
+                indexed += len(points)
+            if in_flight:
+                await asyncio.gather(*in_flight)
+        finally:
+            for task in in_flight:
+                task.cancel()
+            await self._qdrant.update_collection(
+                collection_name=QDRANT_COLLECTION,
+                optimizers_config=OptimizersConfigDiff(
+                    indexing_threshold=_INDEXING_THRESHOLD_KB
+                ),
+            )
+        logger.info("Reindexed %d events into %s", indexed, QDRANT_COLLECTION)
+        return indexed
+
+    @staticmethod
+    def _event_from_row(row: EventLog) -> BaseEvent:
+        created_at = row.created_at or datetime.now(timezone.utc)
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        return BaseEvent(
+            event_id=row.event_id,
+            event_type=EventType(row.event_type),
+            timestamp=created_at.isoformat(),
+            producer=row.producer,
+            idempotency_key=row.idempotency_key or "",
+            payload=_decode_payload(row.payload),
         )
 
     async def search_similar(
@@ -265,6 +699,7 @@ class MemoryStore:
             collection_name=QDRANT_COLLECTION,
             query=vector,
             limit=limit,
+            search_params=_SEARCH_PARAMS,
         )
         return [
             {"id": str(r.id), "score": r.score, "payload": r.payload}
@@ -284,6 +719,32 @@ class MemoryStore:
         )
         return result is None
 
+    async def cache_set_many(self, items: dict[str, str], ttl: int = 3600) -> None:
+        """`cache_set` for many keys in one Redis round-trip."""
+        if not items:
+            return
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.set(key, value, ex=ttl)
+            await pipe.execute()
+
+    async def cache_get_many(self, keys: list[str]) -> dict[str, str | None]:
+        """`cache_get` for many keys with a single MGET."""
+        if not keys:
+            return {}
+        values = await self._redis.mget(keys)
+        return dict(zip(keys, values, strict=True))
+
+    async def idempotency_check_many(self, keys: list[str]) -> list[bool]:
+        """`idempotency_check` for many keys in one round-trip, in input order."""
+        if not keys:
+            return []
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.set(f"idem:{key}", "1", nx=True, ex=86400)
+            results = await pipe.execute()
+        return [r is None for r in results]
+
     async def semantic_search(
         self,
         query: str,
@@ -299,61 +760,170 @@ class MemoryStore:
             query=vector,
             limit=limit,
             query_filter=qdrant_filter,
+            search_params=_SEARCH_PARAMS,
         )
+        return self._rank_points(results.points)
 
-        now = datetime.now(timezone.utc)
-        scored: list[dict[str, Any]] = []
-        for point in results.points:
-            payload = point.payload or {}
-            base_score = float(point.score or 0.0)
-            heuristic = self._compute_heuristic_score(
-                base_score=base_score,
-                payload=payload,
-                now=now,
-            )
-            scored.append(
-                {
-                    "id": str(point.id),
-                    "score": base_score,
-                    "heuristic_score": heuristic,
-                    "payload": payload,
-                }
-            )
+    async def semantic_search_many(
+        self,
+        queries: list[str],
+        plan_id: str | None = None,
+        event_types: list[str] | None = None,
+        limit: int = 5,
+    ) -> list[list[dict[str, Any]]]:
+        """`semantic_search` for several queries: one embedding call, one Qdrant batch."""
+        if not queries:
+            return []
+        vectors = await self._embed_texts(queries)
+        qdrant_filter = self._build_qdrant_filter(plan_id=plan_id, event_types=event_types or [])
+        responses = await self._qdrant.query_batch_points(
+            collection_name=QDRANT_COLLECTION,
+            requests=[
+                QueryRequest(
+                    query=vector,
+                    filter=qdrant_filter,
+                    limit=limit,
+                    params=_SEARCH_PARAMS,
+                    with_payload=True,
+                )
+                for vector in vectors
+            ],
+        )
+        return [self._rank_points(resp.points) for resp in responses]
 
-        scored.sort(key=lambda x: x["heuristic_score"], reverse=True)
-        return scored
+    def _rank_points(self, points: list[ScoredPoint]) -> list[dict[str, Any]]:
+        """Attach heuristic scores to Qdrant hits and sort by them."""
+        if not points:
+            return []
+        payloads = [point.payload or {} for point in points]
+        base_scores = np.fromiter(
+            (float(point.score or 0.0) for point in points),
+            dtype=np.float64,
+            count=len(points),
+        )
+        heuristic = self._heuristic_scores(base_scores, payloads, time.time())
+        return [
+            {
+                "id": str(points[i].id),
+                "score": float(base_scores[i]),
+                "heuristic_score": float(heuristic[i]),
+                "payload": payloads[i],
+            }
+            for i in np.argsort(-heuristic, kind="stable")
+        ]
 
     async def _embed_text(self, text: str) -> list[float]:
         """Encode text into a Qdrant-compatible embedding vector."""
         if not text.strip():
             return [0.0] * EMBEDDING_DIM
 
-        if not self._embed_api_key:
+        if self._embed_client is None:
             return self._hash_to_vector(text, EMBEDDING_DIM)
 
+        fut: asyncio.Future[list[float]] = asyncio.get_running_loop().create_future()
+        self._embed_pending.append((text, fut))
+        if len(self._embed_pending) >= _EMBED_BATCH_MAX:
+            self._start_embed_batch()
+        elif self._embed_timer is None:
+            self._embed_timer = asyncio.get_running_loop().call_later(
+                _EMBED_BATCH_WINDOW_SEC, self._start_embed_batch
+            )
+        return await fut
+
+    def _start_embed_batch(self) -> None:
+        """Hand every pending `_embed_text` caller to one `_embed_texts` call."""
+        if self._embed_timer is not None:
+            self._embed_timer.cancel()
+            self._embed_timer = None
+        batch, self._embed_pending = self._embed_pending, []
+        if not batch:
+            return
+        task = asyncio.create_task(self._run_embed_batch(batch))
+        self._embed_batches.add(task)
+        task.add_done_callback(self._embed_batches.discard)
+
+    async def _run_embed_batch(
+        self, batch: list[tuple[str, asyncio.Future[list[float]]]]
+    ) -> None:
         try:
-            from openai import AsyncOpenAI
+            vectors = await self._embed_texts([text for text, _ in batch])
+        except Exception as exc:
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(exc)
+            return
+        for (_, fut), vector in zip(batch, vectors, strict=True):
+            if not fut.done():
+                fut.set_result(vector)
+
+    async def _embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """Encode many texts with one embeddings API call, memoized in Redis."""
+        out: list[list[float] | None] = [None] * len(texts)
+        todo: list[int] = []
+        for i, text in enumerate(texts):
+            if not text.strip():
+                out[i] = [0.0] * EMBEDDING_DIM
+            elif self._embed_client is None:
+                out[i] = self._hash_to_vector(text, EMBEDDING_DIM)
+            else:
+                todo.append(i)
+        if not todo:
+            return [v for v in out if v is not None]
+
+        keys = {i: self._embedding_cache_key(texts[i]) for i in todo}
+        try:
+            cached = await self._redis.mget([keys[i] for i in todo])
         except Exception:
-            logger.warning(
-                "openai package not available, falling back to hash-based embeddings"
-            )
-            return self._hash_to_vector(text, EMBEDDING_DIM)
+            logger.debug("Embedding cache read failed", exc_info=True)
+            cached = [None] * len(todo)
+        misses: list[int] = []
+        for i, hit in zip(todo, cached, strict=True):
+            if hit is None:
+                misses.append(i)
+            else:
+                out[i] = orjson.loads(hit)
+
+        if misses:
+            vectors, from_api = await self._embed_via_api([texts[i] for i in misses])
+            for i, vector in zip(misses, vectors, strict=True):
+                out[i] = vector
+            # Hash fallbacks from a failed API call must not outlive the outage
+            if from_api:
+                try:
+                    async with self._redis.pipeline(transaction=False) as pipe:
+                        for i in misses:
+                            pipe.set(keys[i], orjson.dumps(out[i]), ex=_EMBED_CACHE_TTL_SEC)
+                        await pipe.execute()
+                except Exception:
+                    logger.debug("Embedding cache write failed", exc_info=True)
 
+        return [v if v is not None else [0.0] * EMBEDDING_DIM for v in out]
+
+    async def _embed_via_api(self, texts: list[str]) -> tuple[list[list[float]], bool]:
+        """Embed `texts`; the flag is False when hash-based fallbacks were returned."""
         if self._embed_client is None:
-            self._embed_client = AsyncOpenAI(api_key=self._embed_api_key)
+            return [self._hash_to_vector(t, EMBEDDING_DIM) for t in texts], False
 
         try:
             resp = await self._embed_client.embeddings.create(
                 model=self._embed_model,
-                input=[text],
+                input=texts,
             )
-            embedding = resp.data[0].embedding
-            if len(embedding) != EMBEDDING_DIM:
-                return self._resize_vector(embedding, EMBEDDING_DIM)
-            return embedding
         except Exception:
             logger.exception("Embedding API call failed, using hash-based embedding")
-            return self._hash_to_vector(text, EMBEDDING_DIM)
+            return [self._hash_to_vector(t, EMBEDDING_DIM) for t in texts], False
+
+        vectors: list[list[float]] = []
+        for item in sorted(resp.data, key=lambda d: d.index):
+            embedding = item.embedding
+            if len(embedding) != EMBEDDING_DIM:
+                embedding = self._resize_vector(embedding, EMBEDDING_DIM)
+            vectors.append(self._normalize_vector(embedding))
+        return vectors, True
+
+    def _embedding_cache_key(self, text: str) -> str:
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return self._embed_cache_prefix + digest
 
     async def _index_event_for_search(self, event: BaseEvent) -> None:
         """Index selected events into the semantic vector store."""
@@ -378,19 +948,30 @@ class MemoryStore:
                 logger.debug("Semantic index dedup check failed", exc_info=True)
 
         vector = await self._embed_text(text)
+        payload = self._index_payload(event, text, importance, impact, extra_payload)
+        await self.store_embedding(event.event_id, vector, payload)
+
+    def _index_payload(
+        self,
+        event: BaseEvent,
+        text: str,
+        importance: float,
+        impact: float,
+        extra_payload: dict[str, Any],
+    ) -> dict[str, Any]:
         payload: dict[str, Any] = {
             "text": text,
             "event_type": event.event_type.value,
             "producer": event.producer,
             "plan_id": event.payload.get("plan_id", ""),
             "created_at": event.timestamp,
+            "created_at_epoch": self._iso_to_epoch(event.timestamp),
             "importance": importance,
             "impact": impact,
             "access_count": 0,
         }
         payload.update(extra_payload)
-
-        await self.store_embedding(event.event_id, vector, payload)
+        return payload
 
     def _event_to_index_text(
         self,
@@ -456,66 +1037,99 @@ class MemoryStore:
                 )
             )
         if event_types:
-            if len(event_types) == 1:
-                conditions.append(
-                    FieldCondition(
-                        key="event_type",
-                        match=MatchValue(value=event_types[0]),
-                    )
-                )
-            else:
-                conditions.append(
-                    FieldCondition(
-                        key="event_type",
-                        match=MatchValue(value=event_types[0]),
-                    )
+            conditions.append(
+                FieldCondition(
+                    key="event_type",
+                    match=MatchAny(any=list(event_types)),
                 )
+            )
 
         if not conditions:
             return None
         return Filter(must=list(conditions))
 
-    def _compute_heuristic_score(
+    def _heuristic_scores(
         self,
-        base_score: float,
-        payload: dict[str, Any],
-        now: datetime,
-    ) -> float:
+        base_scores: np.ndarray,
+        payloads: list[dict[str, Any]],
+        now_epoch: float,
+    ) -> np.ndarray:
         """Combine vector similarity with importance/impact/recency/frequency heuristics."""
-        importance = float(payload.get("importance", 0.5))
-        impact = float(payload.get("impact", 0.0))
-        access_count = int(payload.get("access_count", 0))
-
-        created_at_str = payload.get("created_at") or ""
-        last_used_str = payload.get("last_used_at") or created_at_str
-
-        recency_boost = 0.0
-        if last_used_str:
-            try:
-                last_used = datetime.fromisoformat(
-                    last_used_str.replace("Z", "+00:00")
-                )
-                age_seconds = max((now - last_used).total_seconds(), 0.0)
-                recency_boost = 1.0 / (1.0 + age_seconds / 3600.0)
-            except Exception:
-                recency_boost = 0.0
+        n = len(payloads)
+        importance = np.fromiter(
+            (float(p.get("importance", 0.5)) for p in payloads), dtype=np.float64, count=n
+        )
+        impact = np.fromiter(
+            (float(p.get("impact", 0.0)) for p in payloads), dtype=np.float64, count=n
+        )
+        access_count = np.fromiter(
+            (max(int(p.get("access_count", 0)), 0) for p in payloads),
+            dtype=np.float64,
+            count=n,
+        )
+        last_used = np.fromiter(
+            (
+                np.nan if (epoch := self._last_used_epoch(p)) is None else epoch
+                for p in payloads
+            ),
+            dtype=np.float64,
+            count=n,
+        )
 
-        freq_boost = min(1.0, log1p(max(access_count, 0)) / 3.0)
+        age_seconds = np.maximum(now_epoch - last_used, 0.0)
+        recency_boost = np.where(
+            np.isnan(last_used), 0.0, 1.0 / (1.0 + age_seconds / 3600.0)
+        )
+        freq_boost = np.minimum(1.0, np.log1p(access_count) / 3.0)
 
         return (
-            base_score * (1.0 + 0.4 * importance + 0.3 * impact)
+            base_scores * (1.0 + 0.4 * importance + 0.3 * impact)
             + 0.2 * recency_boost
             + 0.1 * freq_boost
         )
 
+    @staticmethod
+    def _last_used_epoch(payload: dict[str, Any]) -> float | None:
+        """Epoch seconds for recency; points indexed before `created_at_epoch` get parsed."""
+        if "last_used_at" not in payload:
+            epoch = payload.get("created_at_epoch")
+            if isinstance(epoch, (int, float)):
+                return float(epoch)
+        return MemoryStore._iso_to_epoch(
+            payload.get("last_used_at") or payload.get("created_at") or ""
+        )
+
+    @staticmethod
+    def _iso_to_epoch(stamp: str) -> float | None:
+        if not stamp:
+            return None
+        try:
+            return datetime.fromisoformat(stamp).timestamp()
+        except (TypeError, ValueError):
+            return None
+
     @staticmethod
     def _hash_to_vector(text: str, dim: int) -> list[float]:
-        """Build deterministic pseudo-embedding fallback from hashing."""
-        import hashlib
+        """Build deterministic pseudo-embedding fallback from hashing.
 
-        h = hashlib.sha256(text.encode("utf-8")).digest()
-        raw = (h * ((dim // len(h)) + 1))[:dim]
-        return [b / 255.0 for b in raw]
+        BLAKE3's extendable output yields all `dim` bytes in one call; without
+        it, a SHA-256 digest is tiled (vectors then differ between the two).
+        """
+        data = text.encode("utf-8")
+        if blake3 is not None:
+            raw = blake3.blake3(data).digest(length=dim)
+        else:
+            h = hashlib.sha256(data).digest()
+            raw = (h * ((dim // len(h)) + 1))[:dim]
+        vec = np.frombuffer(raw, dtype=np.uint8).astype(np.float32)
+        return MemoryStore._normalize_vector(vec)
+
+    @staticmethod
+    def _normalize_vector(vec: list[float] | np.ndarray) -> list[float]:
+        """Scale to unit length so DOT distance equals cosine similarity."""
+        arr = np.asarray(vec, dtype=np.float32)
+        arr = arr / max(float(np.linalg.norm(arr)), 1e-12)
+        return arr.tolist()
 
     @staticmethod
     def _resize_vector(vec: list[float], dim: int) -> list[float]:
@@ -524,10 +1138,8 @@ class MemoryStore:
             return [0.0] * dim
         if len(vec) == dim:
             return vec
+        arr = np.asarray(vec, dtype=np.float32)
         if len(vec) > dim:
-            stride = len(vec) / dim
-            return [vec[int(i * stride)] for i in range(dim)]
-        out: list[float] = []
-        while len(out) < dim:
-            out.extend(vec)
-        return out[:dim]
+            idx = (np.arange(dim) * (len(vec) / dim)).astype(np.int64)
+            return arr[idx].tolist()
+        return np.tile(arr, dim // len(vec) + 1)[:dim].tolist()
@@ -6,9 +6,11 @@ import logging
 from typing import Any
 
 import httpx
+import orjson
 
 from shared.llm_adapter import LLMProvider
 from shared.prompt_locale import natural_language_rules_for_locale
+from shared.utils import post_json
 
 logger = logging.getLogger(__name__)
 
@@ -43,9 +45,10 @@ async def _post_semantic_search(
     limit: int,
 ) -> list[dict[str, Any]]:
     try:
-        resp = await client.post(
+        resp = await post_json(
+            client,
             "/semantic/search",
-            json={
+            {
                 "query": query,
                 "plan_id": plan_id,
                 "event_types": [],
@@ -53,7 +56,7 @@ async def _post_semantic_search(
             },
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
         raw = data.get("results") or []
         return raw if isinstance(raw, list) else []
     except Exception:
@@ -3,15 +3,18 @@
 from __future__ import annotations
 
 import asyncio
+import io
 import logging
 import os
 import time
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 from typing import Any, cast
 from uuid import uuid4
 
 import httpx
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
@@ -19,11 +22,13 @@ from services.meta_planner.ask_agent import run_ask_agent
 from services.meta_planner.config import PlannerConfig
 from services.meta_planner.deps import MetaPlannerDeps
 from services.meta_planner.planner import (
+    TASK_LIST_ADAPTER,
     decompose_tasks,
     decompose_tasks_with_tool_loop,
 )
 from services.meta_planner.tools import build_planner_tool_registry
 from shared.contracts.events import (
+    BaseEvent,
     EventType,
     PlanCreatedPayload,
     PlanRequestedPayload,
@@ -33,7 +38,7 @@ from shared.contracts.events import (
     task_assigned,
 )
 from shared.http.client import create_async_http_client
-from shared.llm_adapter import get_llm_provider
+from shared.llm_adapter import LLMProvider, get_llm_provider
 from shared.logging.logger import setup_logging
 from shared.middleware.correlation import install_correlation_middleware
 from shared.observability.metrics import (
@@ -42,14 +47,15 @@ from shared.observability.metrics import (
     tasks_completed,
 )
 from shared.observability.routing import register_health_metrics_routes
-from shared.observability.tokens import emit_token_usage_event
+from shared.observability.tokens import token_usage_event
 from shared.plan_idempotency import plan_idempotency_key_meta_planner
+from shared.plan_progress import plan_progress_client, set_plan_task_total
 from shared.tools import ToolRegistry, execute_tool
 from shared.utils import (
     EventBus,
     guarded_http_get,
     maybe_agent_delay,
-    store_event,
+    store_events,
     subscribe_typed_event,
 )
 from shared.utils.lifecycle import connect_event_bus, shutdown_runtime
@@ -60,13 +66,99 @@ event_bus: EventBus = cast(EventBus, None)
 http_client: httpx.AsyncClient = cast(httpx.AsyncClient, None)
 cfg: PlannerConfig = cast(PlannerConfig, None)
 tool_registry: ToolRegistry = cast(ToolRegistry, None)
+llm_provider: LLMProvider | None = None
+# Pooled Redis client for the plan progress counters (None without Redis)
+plan_progress_redis: Any | None = None
 
 _IDEM_TTL_SECONDS = int(os.environ.get("PLAN_IDEM_TTL_SECONDS", "30"))
-_plan_idem_cache: dict[str, tuple[str, dict, float]] = {}
+_IDEM_TTL_NS = _IDEM_TTL_SECONDS * 1_000_000_000
+_IDEM_CACHE_MAX = int(os.environ.get("PLAN_IDEM_CACHE_MAX", "1024"))
+# LRU order (oldest first); capped and swept from the head on every insert
+_plan_idem_cache: OrderedDict[bytes, tuple[str, bytes, int]] = OrderedDict()
 _MAX_AUTO_REPLANS_PER_ORIGINAL_PLAN = int(
     os.environ.get("MAX_AUTO_REPLANS_PER_ORIGINAL_PLAN", "1")
 )
 _replans_per_original_plan: dict[str, int] = {}
+# plan.created/task.assigned persistence runs in background workers so the
+# memory_service round-trip stays off the POST /plan response path
+_PERSIST_WORKERS = int(os.environ.get("META_PLANNER_PERSIST_WORKERS", "2"))
+_PERSIST_QUEUE_MAX = int(os.environ.get("META_PLANNER_PERSIST_QUEUE_MAX", "256"))
+_persist_queue: asyncio.Queue[list[BaseEvent]] | None = None
+_persist_workers: list[asyncio.Task[None]] = []
+
+
+def _get_llm() -> LLMProvider:
+    """Provider resolved on first use (a bad config fails the request, not startup)."""
+    global llm_provider
+    if llm_provider is None:
+        llm_provider = get_llm_provider(provider_name=cfg.llm_provider)
+    return llm_provider
+
+
+async def _persist_events(events: list[BaseEvent]) -> None:
+    """Queue events for memory_service; stores inline if workers are not running."""
+    if _persist_queue is None:
+        await store_events(
+            http_client,
+            events,
+            logger=logger,
+            error_message="Failed to store event %s in memory_service",
+        )
+        return
+    # Blocks only when the queue is full, which bounds memory under backpressure
+    await _persist_queue.put(events)
+
+
+async def _persist_worker(queue: asyncio.Queue[list[BaseEvent]]) -> None:
+    while True:
+        events = await queue.get()
+        try:
+            await store_events(
+                http_client,
+                events,
+                logger=logger,
+                error_message="Failed to store event %s in memory_service",
+            )
+        except Exception:
+            logger.exception("Background persistence of %d events failed", len(events))
+        finally:
+            queue.task_done()
+
+
+def _start_persist_workers() -> None:
+    global _persist_queue
+    _persist_queue = asyncio.Queue(maxsize=_PERSIST_QUEUE_MAX)
+    _persist_workers.extend(
+        asyncio.create_task(_persist_worker(_persist_queue))
+        for _ in range(max(1, _PERSIST_WORKERS))
+    )
+
+
+async def _stop_persist_workers(timeout: float = 10.0) -> None:
+    """Flush queued events (bounded wait), then stop the workers."""
+    global _persist_queue
+    queue, _persist_queue = _persist_queue, None
+    if queue is not None:
+        try:
+            await asyncio.wait_for(queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Dropping %d unpersisted event batches on shutdown", queue.qsize()
+            )
+    for task in _persist_workers:
+        task.cancel()
+    await asyncio.gather(*_persist_workers, return_exceptions=True)
+    _persist_workers.clear()
+
+
+def _remember_plan(key: bytes, plan_id: str, body: bytes, now: int) -> None:
+    _plan_idem_cache[key] = (plan_id, body, now)
+    _plan_idem_cache.move_to_end(key)
+    while _plan_idem_cache:
+        oldest_at = next(iter(_plan_idem_cache.values()))[2]
+        if len(_plan_idem_cache) <= _IDEM_CACHE_MAX and now - oldest_at < _IDEM_TTL_NS:
+            break
+        _plan_idem_cache.popitem(last=False)
 
 
 def _error_response(status_code: int, detail: str, **extra: Any) -> JSONResponse:
@@ -130,16 +222,30 @@ def _summarise_planner_memory(
 
 @asynccontextmanager
 async def lifespan(application: FastAPI):
-    global event_bus, http_client, cfg, tool_registry
+    global event_bus, http_client, cfg, tool_registry, plan_progress_redis
     logger = setup_logging(SERVICE_NAME)
 
     cfg = PlannerConfig.from_env()
+    plan_progress_redis = plan_progress_client(cfg.redis_url)
+    # Shared by every memory_service call; HTTP/2 lets concurrent calls
+    # multiplex instead of queuing on a few HTTP/1.1 connections
     http_client = create_async_http_client(
         base_url=cfg.memory_service_url,
         default_timeout=10.0,
+        connect_timeout=2.0,
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=128,
+            max_keepalive_connections=64,
+            keepalive_expiry=60.0,
+        ),
     )
 
-    tool_registry = build_planner_tool_registry(memory_service_url=cfg.memory_service_url)
+    _start_persist_workers()
+
+    tool_registry = build_planner_tool_registry(
+        memory_service_url=cfg.memory_service_url, http_client=http_client
+    )
 
     event_bus = await connect_event_bus(cfg.rabbitmq_url)
 
@@ -155,7 +261,11 @@ async def lifespan(application: FastAPI):
     logger.info("Meta Planner ready (with replanning support)")
     yield
 
+    await _stop_persist_workers()
     await shutdown_runtime(logger=logger, event_bus=event_bus, http_client=http_client)
+    if plan_progress_redis is not None:
+        await plan_progress_redis.aclose()
+        plan_progress_redis = None
 
 
 app = FastAPI(
@@ -198,16 +308,17 @@ class AskResponse(BaseModel):
 @app.post("/plan", response_model=PlanResponse)
 async def create_plan(req: PlanRequest):
     key = plan_idempotency_key_meta_planner(req.model_dump())
-    now = time.monotonic()
+    now = time.monotonic_ns()
     if key in _plan_idem_cache:
-        cached_plan_id, cached_resp, cached_at = _plan_idem_cache[key]
-        if now - cached_at < _IDEM_TTL_SECONDS:
+        cached_plan_id, cached_body, cached_at = _plan_idem_cache[key]
+        if now - cached_at < _IDEM_TTL_NS:
+            _plan_idem_cache.move_to_end(key)
             logger.info(
                 "Idempotent plan request (same key within %ds), returning cached plan %s",
                 _IDEM_TTL_SECONDS,
                 cached_plan_id[:8],
             )
-            return cached_resp
+            return Response(content=cached_body, media_type="application/json")
         else:
             del _plan_idem_cache[key]
 
@@ -219,8 +330,10 @@ async def create_plan(req: PlanRequest):
             mode=req.mode or "normal",
             user_locale=getattr(req, "user_locale", None) or "en",
         )
-        _plan_idem_cache[key] = (result["plan_id"], result, now)
-        return result
+        # Serialized once; idempotent replays return these bytes untouched
+        body = orjson.dumps(result)
+        _remember_plan(key, result["plan_id"], body, now)
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         err_str = str(e)
         is_rate_limit = (
@@ -255,7 +368,7 @@ async def agent_ask(req: AskRequest):
     if not q:
         return _error_response(400, "question must be non-empty")
     try:
-        llm = get_llm_provider(provider_name=cfg.llm_provider)
+        llm = _get_llm()
         answer, sources, pt, ct = await run_ask_agent(
             llm,
             memory_client=http_client,
@@ -291,7 +404,7 @@ async def _execute_plan(
     user_locale: str = "en",
 ) -> dict:
     with agent_execution_time.labels(service=SERVICE_NAME, operation="plan").time():
-        llm = get_llm_provider(provider_name=cfg.llm_provider)
+        llm = _get_llm()
         memory_context = await _fetch_memory_context(prompt)
         if cfg.enable_tool_loop and tool_registry is not None:
             plan_result, prompt_tokens, completion_tokens = (
@@ -341,54 +454,50 @@ async def _execute_plan(
         plan_event = plan_created(SERVICE_NAME, plan_payload)
         plan_id = plan_payload.plan_id
 
-        await emit_token_usage_event(
+        # Persisted with the plan batch below, off the request path
+        tok_event = token_usage_event(
             service_name=SERVICE_NAME,
             plan_id=plan_id,
             prompt_tokens=prompt_tokens,
             completion_tokens=completion_tokens,
-            http_client=http_client,
-            logger=logger,
-            error_message="Failed to store event %s in memory_service",
-        )
-
-        await event_bus.publish(plan_event)
-        await store_event(
-            http_client,
-            plan_event,
-            logger=logger,
-            error_message="Failed to store event %s in memory_service",
         )
 
-        for spec in task_specs:
-            ta_payload = TaskAssignedPayload(
-                plan_id=plan_id,
-                task=spec,
-                repo_url=repo_url,
-                plan_reasoning=plan_result.reasoning,
-                mode=plan_payload.mode,
-                user_locale=user_locale,
-            )
-            ta_event = task_assigned(SERVICE_NAME, ta_payload)
-            await event_bus.publish(ta_event)
-            await store_event(
-                http_client,
-                ta_event,
-                logger=logger,
-                error_message="Failed to store event %s in memory_service",
+        ta_events = [
+            task_assigned(
+                SERVICE_NAME,
+                TaskAssignedPayload(
+                    plan_id=plan_id,
+                    task=spec,
+                    repo_url=repo_url,
+                    plan_reasoning=plan_result.reasoning,
+                    mode=plan_payload.mode,
+                    user_locale=user_locale,
+                ),
             )
+            for spec in task_specs
+        ]
+        # Registered before any task can reach QA; lets QA skip the PR readiness
+        # check until the plan's last task passes
+        await set_plan_task_total(plan_progress_redis, plan_id, len(task_specs))
+        # One confirm round-trip for the whole plan; plan.created goes first
+        await event_bus.publish_batch([plan_event, *ta_events])
+
+        to_store = [tok_event] if tok_event is not None else []
+        await _persist_events([*to_store, plan_event, *ta_events])
 
         tasks_completed.labels(service=SERVICE_NAME).inc()
-        logger.info(
-            "Plan %s created with %d tasks. Reasoning: %.60r",
-            plan_id[:8],
-            len(task_specs),
-            plan_result.reasoning,
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Plan %s created with %d tasks. Reasoning: %.60r",
+                plan_id[:8],
+                len(task_specs),
+                plan_result.reasoning,
+            )
 
     return {
         "plan_id": plan_id,
         "task_count": len(task_specs),
-        "tasks": [t.model_dump() for t in task_specs],
+        "tasks": TASK_LIST_ADAPTER.dump_python(task_specs),
     }
 
 async def _consume_plan_requests() -> None:
@@ -454,9 +563,22 @@ async def _handle_plan_revision(payload: PlanRevisionPayload) -> None:
         )
         return
 
-    original_prompt, original_reasoning, revision_locale = (
-        await _fetch_original_plan_prompt(original_plan_id)
+    # Independent memory_service reads; the repo URL is simply unused if the
+    # original prompt turns out to be missing
+    prompt_result, repo_result = await asyncio.gather(
+        _fetch_original_plan_prompt(original_plan_id),
+        _infer_repo_url_for_plan(original_plan_id),
+        return_exceptions=True,
     )
+    if isinstance(prompt_result, BaseException):
+        logger.warning(
+            "Fetching original plan.created for %s failed: %r",
+            original_plan_id[:8],
+            prompt_result,
+        )
+        prompt_result = ("", "", "en")
+    original_prompt, original_reasoning, revision_locale = prompt_result
+    repo_url = "" if isinstance(repo_result, BaseException) else repo_result
     if not original_prompt:
         logger.warning(
             "Could not find original plan.prompt for plan %s; skipping replanning",
@@ -464,38 +586,9 @@ async def _handle_plan_revision(payload: PlanRevisionPayload) -> None:
         )
         return
 
-    augmented_prompt_lines = [
-        original_prompt.strip(),
-        "",
-        "---",
-        f"A replanning agent analysed the previous execution of plan {original_plan_id[:8]} "
-        f"and suggested revising the plan.",
-        f"Severity: {payload.severity or 'medium'}",
-    ]
-    target_groups = getattr(payload, "target_group_ids", []) or []
-    if target_groups:
-        augmented_prompt_lines.append("Scope limitation:")
-        augmented_prompt_lines.append(
-            "Only replan the following modules/groups; keep the rest of the project "
-            "and tasks unchanged as much as possible:"
-        )
-        for g in target_groups:
-            augmented_prompt_lines.append(f"- {g}")
-    if payload.reason:
-        augmented_prompt_lines.append(f"Replanner reason: {payload.reason}")
-    if original_reasoning:
-        augmented_prompt_lines.append(
-            f"Original planner reasoning (for context, may be outdated): {original_reasoning}"
-        )
-    if payload.suggestions:
-        augmented_prompt_lines.append("")
-        augmented_prompt_lines.append("Replanner suggestions:")
-        for s in payload.suggestions:
-            augmented_prompt_lines.append(f"- {s}")
-
-    augmented_prompt = "\n".join(augmented_prompt_lines)
-
-    repo_url = await _infer_repo_url_for_plan(original_plan_id)
+    augmented_prompt = _build_revision_prompt(
+        original_prompt, original_reasoning, payload
+    )
 
     logger.info(
         "Auto-replanning for original plan %s -> new plan %s (severity=%s)",
@@ -514,6 +607,41 @@ async def _handle_plan_revision(payload: PlanRevisionPayload) -> None:
     _replans_per_original_plan[original_plan_id] = current_replans + 1
 
 
+def _build_revision_prompt(
+    original_prompt: str,
+    original_reasoning: str,
+    payload: PlanRevisionPayload,
+) -> str:
+    """Original prompt plus the replanner's verdict, scope and suggestions."""
+    buf = io.StringIO()
+    buf.write(original_prompt.strip())
+    buf.write(
+        "\n\n---\n"
+        f"A replanning agent analysed the previous execution of plan "
+        f"{payload.original_plan_id[:8]} and suggested revising the plan.\n"
+        f"Severity: {payload.severity or 'medium'}"
+    )
+    target_groups = getattr(payload, "target_group_ids", []) or []
+    if target_groups:
+        buf.write(
+            "\nScope limitation:\n"
+            "Only replan the following modules/groups; keep the rest of the project "
+            "and tasks unchanged as much as possible:\n- "
+        )
+        buf.write("\n- ".join(target_groups))
+    if payload.reason:
+        buf.write(f"\nReplanner reason: {payload.reason}")
+    if original_reasoning:
+        buf.write(
+            "\nOriginal planner reasoning (for context, may be outdated): "
+            f"{original_reasoning}"
+        )
+    if payload.suggestions:
+        buf.write("\n\nReplanner suggestions:\n- ")
+        buf.write("\n- ".join(payload.suggestions))
+    return buf.getvalue()
+
+
 async def _fetch_original_plan_prompt(
     plan_id: str,
 ) -> tuple[str, str, str]:
@@ -4,9 +4,13 @@ from __future__ import annotations
 
 import json
 import logging
+import re
 from dataclasses import dataclass
 from typing import Any
 
+import orjson
+from pydantic import TypeAdapter
+
 from shared.contracts.events import TaskSpec
 from shared.llm_adapter import LLMProvider, LLMResponse
 from shared.llm_adapter.models import LLMRequest
@@ -26,6 +30,7 @@ from shared.observability.metrics import (
 from shared.prompt_locale import natural_language_rules_for_locale
 from shared.tools import ToolRegistry, execute_tool
 from shared.tools.models import ToolExecutionResult
+from shared.utils.prompt_template import PreparsedTemplate
 
 logger = logging.getLogger(__name__)
 
@@ -132,6 +137,10 @@ User request:
 )
 
 
+# Parsed once so each plan call skips rescanning the multi-kilobyte template
+_PLANNING_PROMPT = PreparsedTemplate(PLANNING_PROMPT_TEMPLATE)
+
+
 PLANNER_TOOL_LOOP_SYSTEM = (
     """You are a senior software architect (PLANNER) in a multi-agent CI pipeline.
 
@@ -174,7 +183,7 @@ async def decompose_tasks(
     user_locale: str = "en",
 ) -> tuple[PlanResult, int, int]:
     """Call the LLM to break a user prompt into TaskSpecs with reasoning. Returns (result, prompt_tokens, completi..."""
-    prompt = PLANNING_PROMPT_TEMPLATE.format(
+    prompt = _PLANNING_PROMPT.render(
         prompt=user_prompt,
         memory_context=memory_context.strip() or "None.",
         response_language_rules=natural_language_rules_for_locale(user_locale),
@@ -200,9 +209,9 @@ async def decompose_tasks(
             llm_tokens.labels(service=SERVICE_NAME, direction="completion").inc(ct2)
         reasoning, tasks, _ = _parse_response(response2.content)
     logger.info(
-        "Decomposed prompt into %d tasks. Reasoning: %s",
+        "Decomposed prompt into %d tasks. Reasoning: %.80s",
         len(tasks),
-        reasoning[:80],
+        reasoning,
     )
     return PlanResult(tasks=tasks, reasoning=reasoning), pt, ct
 
@@ -346,9 +355,9 @@ async def decompose_tasks_with_tool_loop(
             service=SERVICE_NAME, outcome="completed"
         ).inc()
         logger.info(
-            "Planner tool-loop decomposed into %d tasks. Reasoning: %s",
+            "Planner tool-loop decomposed into %d tasks. Reasoning: %.80s",
             len(tasks),
-            reasoning[:80],
+            reasoning,
         )
         return PlanResult(tasks=tasks, reasoning=reasoning), total_pt, total_ct
 
@@ -361,6 +370,18 @@ async def decompose_tasks_with_tool_loop(
     return PlanResult(tasks=tasks, reasoning=reasoning), total_pt, total_ct
 
 
+# One validator call for the whole task list instead of one TaskSpec() per item
+# Shared with main.py so the process builds a single list[TaskSpec] validator
+TASK_LIST_ADAPTER = TypeAdapter(list[TaskSpec])
+
+# "REASONING: ... TASKS: ..." split at the first TASKS: (the section is optional)
+_SECTIONS_RE = re.compile(
+    r"REASONING:(?P<reasoning>.*?)(?:TASKS:(?P<tasks>.*))?\Z", re.DOTALL
+)
+# ```lang ... ``` block; the body stops before an optional closing fence
+_FENCED_RE = re.compile(r"```[^\n]*(?:\n|\Z)(?P<body>.*?)(?:```)?\Z", re.DOTALL)
+
+
 def _parse_response(raw: str) -> tuple[str, list[TaskSpec], bool]:
     """Parse LLM output into (reasoning, TaskSpec list, json_ok)."""
     if not (raw or "").strip():
@@ -368,35 +389,33 @@ def _parse_response(raw: str) -> tuple[str, list[TaskSpec], bool]:
     reasoning = ""
     tasks_raw = raw.strip()
 
-    if "REASONING:" in raw:
-        parts = raw.split("TASKS:", 1)
-        reasoning_part = parts[0].replace("REASONING:", "").strip()
-        reasoning = reasoning_part
-        tasks_raw = parts[1].strip() if len(parts) > 1 else "[]"
+    sections = _SECTIONS_RE.search(raw)
+    if sections is not None:
+        reasoning = sections["reasoning"].strip()
+        tasks = sections["tasks"]
+        tasks_raw = tasks.strip() if tasks is not None else "[]"
 
-    cleaned = tasks_raw.strip()
-    if cleaned.startswith("```"):
-        lines = cleaned.split("\n")
-        cleaned = "\n".join(lines[1:])
-        if cleaned.endswith("```"):
-            cleaned = cleaned[:-3].strip()
+    fenced = _FENCED_RE.match(tasks_raw)
+    cleaned = fenced["body"].strip() if fenced is not None else tasks_raw
 
     try:
-        items = json.loads(cleaned)
+        items = orjson.loads(cleaned)
         if isinstance(items, list):
-            specs = [
-                TaskSpec(
-                    description=item.get("description", ""),
-                    file_path=item.get("file_path", "unknown.py"),
-                    language=item.get("language", "python"),
-                    edit_scope=item.get("edit_scope", "file"),
-                    group_id=item.get("group_id", "") or "",
-                )
-                for item in items
-                if isinstance(item, dict)
-            ]
+            specs = TASK_LIST_ADAPTER.validate_python(
+                [
+                    {
+                        "description": item.get("description", ""),
+                        "file_path": item.get("file_path", "unknown.py"),
+                        "language": item.get("language", "python"),
+                        "edit_scope": item.get("edit_scope", "file"),
+                        "group_id": item.get("group_id", "") or "",
+                    }
+                    for item in items
+                    if isinstance(item, dict)
+                ]
+            )
             return reasoning, specs, bool(specs)
-    except (json.JSONDecodeError, TypeError):
+    except (orjson.JSONDecodeError, TypeError):
         logger.warning("Failed to parse LLM task list as JSON, creating fallback task")
 
     return (
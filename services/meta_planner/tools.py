@@ -3,9 +3,11 @@ from __future__ import annotations
 from typing import Any
 
 import httpx
+import orjson
 from pydantic import Field
 
 from shared.tools import ToolDefinition, ToolInput, ToolRegistry
+from shared.utils import post_json
 
 
 class SemanticMemoryInput(ToolInput):
@@ -58,24 +60,29 @@ class FailurePatternsInput(ToolInput):
     )
 
 
-async def semantic_memory_tool(args: SemanticMemoryInput, base_url: str) -> dict[str, Any]:
+async def semantic_memory_tool(
+    args: SemanticMemoryInput, client: httpx.AsyncClient
+) -> dict[str, Any]:
     """Wrapper de alto nivel sobre /semantic/search del memory_service."""
-    async with httpx.AsyncClient(base_url=base_url, timeout=10.0) as client:
-        resp = await client.post(
-            "/semantic/search",
-            json={
-                "query": args.query,
-                "plan_id": args.plan_id,
-                "event_types": args.event_types,
-                "limit": args.limit,
-            },
-        )
-        resp.raise_for_status()
-        data = resp.json()
-    return {"results": data.get("results", [])}
+    resp = await post_json(
+        client,
+        "/semantic/search",
+        {
+            "query": args.query,
+            "plan_id": args.plan_id,
+            "event_types": args.event_types,
+            "limit": args.limit,
+        },
+    )
+    resp.raise_for_status()
+    data = orjson.loads(resp.content)
+    # memory_service already caps hits at `limit`; the slice guards older servers
+    return {"results": (data.get("results") or [])[: args.limit]}
 
 
-async def query_events_tool(args: QueryEventsInput, base_url: str) -> dict[str, Any]:
+async def query_events_tool(
+    args: QueryEventsInput, client: httpx.AsyncClient
+) -> dict[str, Any]:
     """Wrapper tipado sobre /events del memory_service."""
     params: dict[str, Any] = {"limit": args.limit}
     if args.event_type:
@@ -83,22 +90,22 @@ async def query_events_tool(args: QueryEventsInput, base_url: str) -> dict[str,
     if args.plan_id:
         params["plan_id"] = args.plan_id
 
-    async with httpx.AsyncClient(base_url=base_url, timeout=10.0) as client:
-        resp = await client.get("/events", params=params)
-        resp.raise_for_status()
-        data = resp.json()
+    resp = await client.get("/events", params=params)
+    resp.raise_for_status()
+    data = orjson.loads(resp.content)
     return {"events": data}
 
 
-async def failure_patterns_tool(args: FailurePatternsInput, base_url: str) -> dict[str, Any]:
+async def failure_patterns_tool(
+    args: FailurePatternsInput, client: httpx.AsyncClient
+) -> dict[str, Any]:
     """Wrapper sobre /patterns/failures del memory_service."""
-    async with httpx.AsyncClient(base_url=base_url, timeout=10.0) as client:
-        resp = await client.get(
-            "/patterns/failures",
-            params={"limit": args.limit},
-        )
-        resp.raise_for_status()
-        data = resp.json()
+    resp = await client.get(
+        "/patterns/failures",
+        params={"limit": args.limit},
+    )
+    resp.raise_for_status()
+    data = orjson.loads(resp.content)
 
     patterns = data.get("patterns") or []
     if args.module_prefix:
@@ -112,18 +119,32 @@ async def failure_patterns_tool(args: FailurePatternsInput, base_url: str) -> di
     return {"patterns": patterns}
 
 
-def build_planner_tool_registry(memory_service_url: str) -> ToolRegistry:
-    """Construye un ToolRegistry con herramientas de memoria para meta_planner."""
+def build_planner_tool_registry(
+    memory_service_url: str,
+    http_client: httpx.AsyncClient | None = None,
+) -> ToolRegistry:
+    """
+    Construye un ToolRegistry con herramientas de memoria para meta_planner.
+
+    Todas las herramientas comparten un único cliente HTTP (el del servicio si se
+    pasa `http_client`, que lo cierra en su shutdown) para reutilizar conexiones
+    en lugar de abrir una por llamada.
+    """
     registry = ToolRegistry()
+    client = http_client or httpx.AsyncClient(
+        base_url=memory_service_url,
+        timeout=httpx.Timeout(10.0),
+        limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30.0),
+    )
 
     async def _semantic_wrapper(args: SemanticMemoryInput) -> dict[str, Any]:
-        return await semantic_memory_tool(args, base_url=memory_service_url)
+        return await semantic_memory_tool(args, client=client)
 
     async def _events_wrapper(args: QueryEventsInput) -> dict[str, Any]:
-        return await query_events_tool(args, base_url=memory_service_url)
+        return await query_events_tool(args, client=client)
 
     async def _patterns_wrapper(args: FailurePatternsInput) -> dict[str, Any]:
-        return await failure_patterns_tool(args, base_url=memory_service_url)
+        return await failure_patterns_tool(args, client=client)
 
     registry.register(
         ToolDefinition(
@@ -17,7 +17,7 @@ DANGEROUS_PATTERNS: list[str] = [
 ]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QAConfig:
     rabbitmq_url: str
     memory_service_url: str
@@ -35,6 +35,8 @@ class QAConfig:
     enable_java_lint: bool
     enable_tool_loop: bool
     tool_loop_max_steps: int
+    response_cache: bool
+    response_cache_ttl: int
 
     @classmethod
     def from_env(cls) -> QAConfig:
@@ -58,4 +60,6 @@ class QAConfig:
             enable_java_lint=env_bool("QA_ENABLE_JAVA_LINT"),
             enable_tool_loop=env_bool("QA_ENABLE_TOOL_LOOP"),
             tool_loop_max_steps=env_int("QA_TOOL_LOOP_MAX_STEPS", 8),
+            response_cache=env_bool("QA_RESPONSE_CACHE"),
+            response_cache_ttl=env_int("QA_RESPONSE_CACHE_TTL", 3600),
         )
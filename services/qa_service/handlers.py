@@ -6,8 +6,14 @@ from dataclasses import dataclass
 from typing import Any
 
 import httpx
+import orjson
 
 from services.qa_service.config import QAConfig
+from services.qa_service.review_cache import (
+    get_cached_review,
+    review_cache_key,
+    store_cached_review,
+)
 from services.qa_service.reviewer import (
     ReviewResult,
     review_code,
@@ -33,6 +39,7 @@ from shared.observability.metrics import (
     tasks_failed,
 )
 from shared.observability.tokens import emit_token_usage_event
+from shared.plan_progress import mark_task_qa_passed
 from shared.policies import (
     ProjectPolicy,
     effective_mode,
@@ -47,12 +54,15 @@ from shared.prompt_locale import (
 from shared.tools import ToolRegistry, execute_tool
 from shared.utils import (
     EventBus,
+    IdempotencyStore,
     build_repo_style_hints,
     build_short_term_memory_window,
     infer_framework_hint,
+    post_json,
     short_term_memory_event_limit,
     store_event,
 )
+from shared.utils.ttl_cache import TTLCache
 
 
 @dataclass
@@ -62,10 +72,22 @@ class QADeps:
     http_client: httpx.AsyncClient
     event_bus: EventBus
     tool_registry: ToolRegistry | None
-    dev_reasoning_cache: dict[str, str]
-    qa_reasoning_cache: dict[str, str]
+    dev_reasoning_cache: TTLCache[str]
+    qa_reasoning_cache: TTLCache[str]
     pr_requested_plan_ids: set[str]
     project_policy: ProjectPolicy | None = None
+    # plan_id -> (event limit, window); shared across events so bursts for one plan fetch once
+    short_term_memory_cache: TTLCache[tuple[int, str]] | None = None
+    # LLM verdicts for byte-identical resubmissions; None unless QA_RESPONSE_CACHE is on
+    review_cache: TTLCache[ReviewResult] | None = None
+    # Cross-replica claim so only one QA worker publishes a plan's pr.requested
+    pr_claim_store: IdempotencyStore | None = None
+    pr_claim_ttl: int = 86400
+
+
+def _shared_redis(deps: QADeps) -> Any | None:
+    """The claim store's pooled Redis client, reused by the verdict cache and plan progress."""
+    return deps.pr_claim_store.redis if deps.pr_claim_store is not None else None
 
 
 async def handle_code_review(payload: CodeGeneratedPayload, deps: QADeps) -> None:
@@ -86,12 +108,23 @@ async def handle_code_review(payload: CodeGeneratedPayload, deps: QADeps) -> Non
     prompt_tokens = 0
     completion_tokens = 0
 
+    # Prefetch the plan's short-term memory while the linters run; it is only
+    # needed for the LLM review and is cancelled when save mode skips that. The
+    # mock provider answers from the code and file path alone, so skip the fetch
+    stm_task: asyncio.Task[str] | None = None
+    if deps.cfg.llm_provider.lower() != "mock":
+        stm_task = asyncio.create_task(_build_short_term_memory(plan_id, deps))
+
     with agent_execution_time.labels(service="qa_service", operation="code_review").time():
-        static_issues = await _run_static_lint(
-            code=payload.code,
-            file_path=payload.file_path,
-            language=payload.language,
-            deps=deps,
+        module = _infer_module_from_path(payload.file_path)
+        static_issues, is_hot_module = await asyncio.gather(
+            _run_static_lint(
+                code=payload.code,
+                file_path=payload.file_path,
+                language=payload.language,
+                deps=deps,
+            ),
+            _is_hot_module(module, deps),
         )
         if static_issues:
             static_report = _summarise_static_report(static_issues)
@@ -101,8 +134,6 @@ async def handle_code_review(payload: CodeGeneratedPayload, deps: QADeps) -> Non
                 "security tools (ruff, Bandit, Semgrep, ESLint/javac if enabled)."
             )
 
-        module = _infer_module_from_path(payload.file_path)
-        is_hot_module = await _is_hot_module(module, deps)
         user_locale = getattr(payload, "user_locale", None) or "en"
 
         raw_mode = getattr(payload, "mode", "normal") or "normal"
@@ -117,11 +148,28 @@ async def handle_code_review(payload: CodeGeneratedPayload, deps: QADeps) -> Non
         )
         default_mode = (deps.project_policy or {}).get("default_mode", "normal")
         mode = effective_mode(raw_mode, path_policy, default_mode)
-        if (
+        save_mode_pass = (
             mode in {"save", "ahorro"}
             and not _has_severe_static_issues(static_issues)
             and not is_hot_module
-        ):
+        )
+        review_key = None
+        cached_review = None
+        if deps.review_cache is not None and not save_mode_pass:
+            review_key = review_cache_key(
+                code=payload.code,
+                file_path=payload.file_path,
+                language=payload.language,
+                task_description=f"Generate {payload.language} code for {payload.file_path}",
+                dev_reasoning=dev_reasoning,
+                user_locale=user_locale,
+                mode=mode,
+                is_hot_module=is_hot_module,
+            )
+            cached_review = await get_cached_review(
+                review_key, deps.review_cache, _shared_redis(deps)
+            )
+        if save_mode_pass:
             auto_reason = (
                 "Approved in save mode: linters and security tools did not find "
                 "high-severity issues. PASS is allowed without running the full "
@@ -134,12 +182,21 @@ async def handle_code_review(payload: CodeGeneratedPayload, deps: QADeps) -> Non
             )
             prompt_tokens = 0
             completion_tokens = 0
+            if stm_task is not None:
+                stm_task.cancel()
+        elif cached_review is not None:
+            deps.logger.info("Reusing cached QA verdict for unchanged task %s", task_id[:8])
+            result = cached_review
+            prompt_tokens = 0
+            completion_tokens = 0
+            if stm_task is not None:
+                stm_task.cancel()
         else:
             llm = get_llm_provider(
                 provider_name=deps.cfg.llm_provider,
                 redis_url=deps.cfg.redis_url,
             )
-            short_term_memory = await _build_short_term_memory(plan_id, deps)
+            short_term_memory = await stm_task if stm_task is not None else ""
             repo_context = ""
             if not deps.cfg.enable_tool_loop:
                 repo_context = await _build_repo_context(
@@ -209,6 +266,14 @@ async def handle_code_review(payload: CodeGeneratedPayload, deps: QADeps) -> Non
                     short_term_memory=qa_context,
                     static_analysis_report=static_report,
                 )
+            if review_key is not None and deps.review_cache is not None:
+                await store_cached_review(
+                    review_key,
+                    result,
+                    deps.review_cache,
+                    _shared_redis(deps),
+                    deps.cfg.response_cache_ttl,
+                )
 
     await emit_token_usage_event(
         service_name="qa_service",
@@ -229,7 +294,9 @@ async def handle_code_review(payload: CodeGeneratedPayload, deps: QADeps) -> Non
     if is_hot_module and severity_hint in {"low", "medium"}:
         severity_hint = "high"
 
-    qa_payload = QAResultPayload(
+    # Every field comes from the payload validated at bus ingress or from our own
+    # review result, so skip re-validating it; qa_passed/qa_failed only dump it.
+    qa_payload = QAResultPayload.model_construct(
         plan_id=plan_id,
         task_id=task_id,
         passed=result.passed,
@@ -257,21 +324,26 @@ async def handle_code_review(payload: CodeGeneratedPayload, deps: QADeps) -> Non
         tasks_completed.labels(service="qa_service").inc()
 
         qa_event = qa_passed("qa_service", qa_payload)
-        await deps.event_bus.publish(qa_event)
-        await store_event(
-            deps.http_client,
-            qa_event,
-            logger=deps.logger,
-            error_message="Failed to store event %s",
-        )
-
-        await _update_task_state(
-            deps.http_client,
-            task_id,
-            plan_id,
-            "qa_passed",
+        await asyncio.gather(
+            deps.event_bus.publish(qa_event),
+            store_event(
+                deps.http_client,
+                qa_event,
+                logger=deps.logger,
+                error_message="Failed to store event %s",
+            ),
+            _update_task_state(
+                deps.http_client,
+                task_id,
+                plan_id,
+                "qa_passed",
+            ),
         )
-        await _check_plan_ready_for_pr(plan_id, deps)
+        # Counted only after the task update landed, so whoever sees the plan
+        # complete also sees every qa_passed status in memory_service
+        all_passed = await mark_task_qa_passed(_shared_redis(deps), plan_id, task_id)
+        if all_passed is not False:
+            await _check_plan_ready_for_pr(plan_id, deps)
     else:
         deps.logger.warning(
             "QA FAILED for task %s (attempt %d): %s",
@@ -302,6 +374,10 @@ async def handle_code_review(payload: CodeGeneratedPayload, deps: QADeps) -> Non
                 "qa_failed",
             )
 
+    # This review just added events to the plan; the next one must see them
+    if deps.short_term_memory_cache is not None:
+        deps.short_term_memory_cache.pop(plan_id, None)
+
 
 _QA_RETRY_DOC_MAX = 7200
 _QA_RETRY_REASONING_MAX = 2000
@@ -397,7 +473,7 @@ async def _check_plan_ready_for_pr(plan_id: str, deps: QADeps) -> None:
 
         resp = await deps.http_client.get(f"/tasks/{plan_id}")
         resp.raise_for_status()
-        all_tasks = resp.json()
+        all_tasks = orjson.loads(resp.content)
 
         if not all_tasks:
             return
@@ -429,6 +505,16 @@ async def _check_plan_ready_for_pr(plan_id: str, deps: QADeps) -> None:
                 )
             )
 
+        # Two concurrent passes (or replicas) can both see every task qa_passed;
+        # only the one that wins the claim publishes
+        if plan_id in deps.pr_requested_plan_ids:
+            return
+        if deps.pr_claim_store is not None and not await deps.pr_claim_store.try_claim(
+            f"qa_service.pr_requested:{plan_id}", deps.pr_claim_ttl
+        ):
+            deps.logger.info("pr.requested for plan %s already claimed", plan_id[:8])
+            deps.pr_requested_plan_ids.add(plan_id)
+            return
         deps.pr_requested_plan_ids.add(plan_id)
         repo_url = next((t.get("repo_url", "") for t in all_tasks), "")
         pr_payload = PRRequestedPayload(
@@ -443,6 +529,10 @@ async def _check_plan_ready_for_pr(plan_id: str, deps: QADeps) -> None:
         )
         pr_event = pr_requested("qa_service", pr_payload)
         await deps.event_bus.publish(pr_event)
+        # The chained reasoning is consumed once, by this pr.requested
+        for t in all_tasks:
+            deps.dev_reasoning_cache.pop(t["task_id"], None)
+            deps.qa_reasoning_cache.pop(t["task_id"], None)
         await store_event(
             deps.http_client,
             pr_event,
@@ -471,7 +561,7 @@ async def _infer_plan_metadata(plan_id: str, deps: QADeps) -> tuple[str, str]:
         )
         if resp.status_code != 200:
             return "normal", "en"
-        events = resp.json()
+        events = orjson.loads(resp.content)
         if not isinstance(events, list) or not events:
             return "normal", "en"
         evt = events[0] or {}
@@ -489,17 +579,18 @@ async def _infer_plan_metadata(plan_id: str, deps: QADeps) -> tuple[str, str]:
 
 def _build_chain_reasoning(
     task_id: str,
-    dev_reasoning_cache: dict[str, str],
-    qa_reasoning_cache: dict[str, str],
+    dev_reasoning_cache: TTLCache[str],
+    qa_reasoning_cache: TTLCache[str],
 ) -> str:
     dev = dev_reasoning_cache.get(task_id, "")
     qa = qa_reasoning_cache.get(task_id, "")
-    parts: list[str] = []
+    if dev and qa:
+        return f"[Developer] {dev}\n[QA Reviewer] {qa}"
     if dev:
-        parts.append(f"[Developer] {dev}")
+        return f"[Developer] {dev}"
     if qa:
-        parts.append(f"[QA Reviewer] {qa}")
-    return "\n".join(parts)
+        return f"[QA Reviewer] {qa}"
+    return ""
 
 
 async def _update_task_state(
@@ -519,7 +610,7 @@ async def _update_task_state(
         }
         if qa_attempt is not None:
             body["qa_attempt"] = qa_attempt
-        resp = await http_client.post("/tasks", json=body)
+        resp = await post_json(http_client, "/tasks", body)
         if resp.status_code >= 400:
             logging.getLogger(__name__).warning(
                 "Failed to update task state in memory_service (task_id=%s, plan_id=%s, status=%s): HTTP %s",
@@ -548,6 +639,11 @@ async def _build_short_term_memory(
     if limit is None:
         limit = short_term_memory_event_limit()
 
+    cache = deps.short_term_memory_cache
+    cached = cache.get(plan_id) if cache is not None else None
+    if cached is not None and cached[0] == limit:
+        return cached[1]
+
     try:
         result = await execute_tool(
             deps.tool_registry,
@@ -568,10 +664,10 @@ async def _build_short_term_memory(
             if isinstance(payload.get("events"), list)
             else []
         )
-        if not events:
-            return ""
-
-        return build_short_term_memory_window(events, limit=limit)
+        window = build_short_term_memory_window(events, limit=limit) if events else ""
+        if cache is not None:
+            cache[plan_id] = (limit, window)
+        return window
     except Exception:
         deps.logger.exception(
             "Error while building QA short-term memory for plan %s",
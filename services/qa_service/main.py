@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 from contextlib import asynccontextmanager
 from typing import cast
 
@@ -12,6 +13,7 @@ from fastapi import FastAPI
 
 from services.qa_service.config import QAConfig
 from services.qa_service.handlers import QADeps, handle_code_review
+from services.qa_service.reviewer import ReviewResult
 from services.qa_service.tools import build_qa_tool_registry
 from shared.contracts.events import CodeGeneratedPayload, EventType
 from shared.http.client import create_async_http_client
@@ -19,31 +21,70 @@ from shared.logging.logger import setup_logging
 from shared.middleware.correlation import install_correlation_middleware
 from shared.observability.routing import register_health_metrics_routes
 from shared.tools import ToolRegistry
-from shared.utils import EventBus, maybe_agent_delay, subscribe_typed_event
+from shared.utils import (
+    EventBus,
+    IdempotencyStore,
+    maybe_agent_delay,
+    subscribe_typed_event,
+)
 from shared.utils.lifecycle import connect_event_bus, shutdown_runtime
+from shared.utils.ttl_cache import TTLCache
 
 SERVICE_NAME = "qa_service"
 event_bus: EventBus = cast(EventBus, None)
 http_client: httpx.AsyncClient = cast(httpx.AsyncClient, None)
 cfg: QAConfig = cast(QAConfig, None)
 tool_registry: ToolRegistry = cast(ToolRegistry, None)
-
-_dev_reasoning_cache: dict[str, str] = {}
-_qa_reasoning_cache: dict[str, str] = {}
+idempotency_store: IdempotencyStore = cast(IdempotencyStore, None)
+
+# A review is cancelled after this long, releasing its claim so it can be retried
+_REVIEW_TIMEOUT = float(os.environ.get("QA_REVIEW_TIMEOUT_SEC", "600"))
+# Redeliveries of a code.generated still under review wait for the claim; it
+# outlives the review timeout only by a margin, so a dead holder blocks briefly
+_REVIEW_CLAIM_TTL = int(_REVIEW_TIMEOUT) + 60
+# A plan's pr.requested is claimed once across replicas; the marker also records it
+_PR_CLAIM_TTL = int(os.environ.get("QA_PR_CLAIM_TTL", "86400"))
+
+# Reasoning is kept only until the plan's pr.requested is built; the bounds stop
+# abandoned plans from pinning one entry per task for the process lifetime
+_REASONING_CACHE_SIZE = int(os.environ.get("QA_REASONING_CACHE_SIZE", "10000"))
+_REASONING_CACHE_TTL = float(os.environ.get("QA_REASONING_CACHE_TTL", "3600"))
+_dev_reasoning_cache: TTLCache[str] = TTLCache(_REASONING_CACHE_SIZE, _REASONING_CACHE_TTL)
+_qa_reasoning_cache: TTLCache[str] = TTLCache(_REASONING_CACHE_SIZE, _REASONING_CACHE_TTL)
 _pr_requested_plan_ids: set[str] = set()
+# Short-lived per-plan memo of the short-term memory window (GET /events + formatting)
+_short_term_memory_cache: TTLCache[tuple[int, str]] = TTLCache(
+    int(os.environ.get("QA_STM_CACHE_SIZE", "1024")),
+    float(os.environ.get("QA_STM_CACHE_TTL", "15")),
+)
+# In-process tier of the QA_RESPONSE_CACHE verdict cache (Redis is the shared tier)
+_review_cache: TTLCache[ReviewResult] = TTLCache(
+    int(os.environ.get("QA_RESPONSE_CACHE_SIZE", "512")),
+    float(os.environ.get("QA_RESPONSE_CACHE_TTL", "3600")),
+)
 
 @asynccontextmanager
 async def lifespan(application: FastAPI):
-    global event_bus, http_client, cfg, tool_registry
+    global event_bus, http_client, cfg, tool_registry, idempotency_store
     logger = setup_logging(SERVICE_NAME)
 
     cfg = QAConfig.from_env()
+    # One pooled client for every memory_service call; HTTP/2 is used where the
+    # server negotiates it, otherwise the tuned keep-alive pool still applies
     http_client = create_async_http_client(
         base_url=cfg.memory_service_url,
         default_timeout=30.0,
+        connect_timeout=5.0,
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=200,
+            max_keepalive_connections=100,
+            keepalive_expiry=60.0,
+        ),
     )
 
-    tool_registry = build_qa_tool_registry()
+    tool_registry = build_qa_tool_registry(http_client)
+    idempotency_store = IdempotencyStore(redis_url=cfg.redis_url)
 
     event_bus = await connect_event_bus(cfg.rabbitmq_url)
 
@@ -55,7 +96,12 @@ async def lifespan(application: FastAPI):
     )
     yield
 
-    await shutdown_runtime(logger=logger, event_bus=event_bus, http_client=http_client)
+    await shutdown_runtime(
+        logger=logger,
+        event_bus=event_bus,
+        http_client=http_client,
+        idempotency_store=idempotency_store,
+    )
 
 
 app = FastAPI(
@@ -80,8 +126,12 @@ async def _consume_code_generated() -> None:
             dev_reasoning_cache=_dev_reasoning_cache,
             qa_reasoning_cache=_qa_reasoning_cache,
             pr_requested_plan_ids=_pr_requested_plan_ids,
+            short_term_memory_cache=_short_term_memory_cache,
+            review_cache=_review_cache if cfg.response_cache else None,
+            pr_claim_store=idempotency_store,
+            pr_claim_ttl=_PR_CLAIM_TTL,
         )
-        await handle_code_review(payload, deps)
+        await asyncio.wait_for(handle_code_review(payload, deps), _REVIEW_TIMEOUT)
 
     await subscribe_typed_event(
         event_bus=event_bus,
@@ -89,8 +139,9 @@ async def _consume_code_generated() -> None:
         routing_keys=[EventType.CODE_GENERATED.value],
         payload_model=CodeGeneratedPayload,
         on_payload=on_payload,
-        redis_url=cfg.redis_url,
+        idempotency_store=idempotency_store,
         max_retries=3,
+        claim_ttl=_REVIEW_CLAIM_TTL,
     )
 
 
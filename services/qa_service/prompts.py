@@ -9,32 +9,11 @@ Assume that:
 - Static analysis tools (ruff, Bandit, Semgrep, ESLint, javac, etc.) are available and may be run by the pipeline.
 - Auto-formatting tools (such as black for Python or prettier/eslint --fix for JS/TS) are available when you explicitly recommend them.
 
-The developer agent that wrote this code provided the following reasoning:
----
-DEVELOPER'S REASONING:
-{dev_reasoning}
----
-
-You also have access to:
+After these instructions you receive the developer's reasoning, the code, the task description and:
 - A short memory window of recent events and decisions for this plan (previous QA results, security decisions, pipeline conclusions, etc.).
 - A STATIC ANALYSIS REPORT summarising issues reported by tools (linters, security scanners, Semgrep, etc.).
 Use these contexts only if they are relevant to your review; otherwise you may ignore them.
 
-SHORT-TERM MEMORY:
-{short_term_memory}
-
-STATIC ANALYSIS REPORT:
-{static_analysis_report}
-
-Now review the following {language} code intended for file `{file_path}`:
-
-```{language}
-{code}
-```
-
-The original task description was:
-{description}
-
 If the code clearly belongs to a known framework, apply additional checks:
 - For FastAPI/Django/Flask APIs (Python): pay special attention to request/response models, validation, auth,
   error handling and HTTP status codes.
@@ -52,9 +31,6 @@ You must:
 8. Staff-engineer perspective: flag unnecessary coupling, misleading names, abstraction leaks, harmful duplication, and designs that force wide edits for small extensions.
 9. Spec / acceptance alignment: if the task description embeds or references concrete acceptance criteria, SPEC excerpts, or CRITICAL test intent, verify the implementation satisfies them; obvious gaps on CRITICAL behaviour should bias toward VERDICT = FAIL.
 
-You must also evaluate the code against the following QA rules for the {language} language:
-{qa_rules_block}
-
 Severity levels:
 - blocker: MUST cause VERDICT = FAIL if clearly violated.
 - error: should usually cause VERDICT = FAIL unless fully justified.
@@ -62,9 +38,6 @@ Severity levels:
 
 If you believe any blocker rule is clearly violated, you MUST return VERDICT: FAIL, even if the rest looks fine.
 
-RESPONSE LANGUAGE:
-{response_language_rules}
-
 IMPORTANT:
 - Keep all section headers and labels (REASONING, VERDICT, ISSUES, REQUIRED_CHANGES, OPTIONAL_IMPROVEMENTS) EXACTLY as specified below.
 - Use plain text only (no markdown lists other than the requested bullets).
@@ -92,6 +65,35 @@ OPTIONAL_IMPROVEMENTS:
 - <optional improvement 1 (small refactor, style, minor perf, etc.)>
 - <optional improvement 2>
 (write "OPTIONAL_IMPROVEMENTS: none" if you have no optional suggestions)
+
+You must also evaluate the code against the following QA rules for the {language} language:
+{qa_rules_block}
+
+RESPONSE LANGUAGE:
+{response_language_rules}
+
+The developer agent that wrote this code provided the following reasoning:
+---
+DEVELOPER'S REASONING:
+{dev_reasoning}
+---
+
+SHORT-TERM MEMORY:
+{short_term_memory}
+
+STATIC ANALYSIS REPORT:
+{static_analysis_report}
+
+Now review the following {language} code intended for file `{file_path}`:
+
+```{language}
+{code}
+```
+
+The original task description was:
+{description}
+
+Respond now in the exact format specified above.
 """
 
 
@@ -117,19 +119,7 @@ Assume that:
 - Static analysis tools (ruff, Bandit, Semgrep, ESLint, javac, etc.) are available and may be run by the pipeline.
 - Auto-formatting tools (such as black for Python or prettier/eslint --fix for JS/TS) are available when you explicitly recommend them.
 
-Analyse the following {language} code intended for file `{file_path}`:
-
-```{language}
-{code}
-```
-
-The original task description was:
-{description}
-
-You also receive a STATIC ANALYSIS REPORT summarising issues reported by tools (linters, security scanners, Semgrep, etc.):
-
-STATIC ANALYSIS REPORT:
-{static_analysis_report}
+After these instructions you receive the code, the task description and a STATIC ANALYSIS REPORT summarising issues reported by tools (linters, security scanners, Semgrep, etc.).
 
 You must:
 1. Check that the code implements the described task correctly, including edge cases and error conditions.
@@ -140,9 +130,6 @@ You must:
 6. Staff-engineer perspective: flag unnecessary coupling, misleading names, abstraction leaks, harmful duplication, and designs that force wide edits for small extensions.
 7. Spec / acceptance alignment: if the task description embeds or references concrete acceptance criteria, SPEC excerpts, or CRITICAL test intent, verify the implementation satisfies them; obvious gaps on CRITICAL behaviour should bias toward VERDICT = FAIL.
 
-You must also evaluate the code against the following QA rules for the {language} language:
-{qa_rules_block}
-
 Severity levels:
 - blocker: MUST cause VERDICT = FAIL if clearly violated.
 - error: should usually cause VERDICT = FAIL unless fully justified.
@@ -150,9 +137,6 @@ Severity levels:
 
 If you believe any blocker rule is clearly violated, you MUST return VERDICT: FAIL, even if the rest looks fine.
 
-RESPONSE LANGUAGE:
-{response_language_rules}
-
 IMPORTANT:
 - Keep all section headers and labels (REASONING, VERDICT, ISSUES, REQUIRED_CHANGES, OPTIONAL_IMPROVEMENTS) EXACTLY as specified below.
 - Use plain text only (no markdown lists other than the requested bullets).
@@ -178,5 +162,25 @@ OPTIONAL_IMPROVEMENTS:
 - <optional improvement 1 (small refactor, style, minor perf, etc.)>
 - <optional improvement 2>
 (write "OPTIONAL_IMPROVEMENTS: none" if you have no optional suggestions)
+
+You must also evaluate the code against the following QA rules for the {language} language:
+{qa_rules_block}
+
+RESPONSE LANGUAGE:
+{response_language_rules}
+
+Analyse the following {language} code intended for file `{file_path}`:
+
+```{language}
+{code}
+```
+
+The original task description was:
+{description}
+
+STATIC ANALYSIS REPORT:
+{static_analysis_report}
+
+Respond now in the exact format specified above.
 """
 
@@ -0,0 +1,84 @@
+"""
+Cache of LLM review verdicts for byte-identical resubmissions (QA_RESPONSE_CACHE).
+
+Keyed by the reviewed code and its task, not by the full prompt: the short-term
+memory and static report change between attempts even when the code does not,
+so the prompt-level LLM cache misses exactly the retries this one catches.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from typing import Any
+
+import orjson
+
+from services.qa_service.reviewer import ReviewResult
+from shared.utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+def review_cache_key(
+    *,
+    code: str,
+    file_path: str,
+    language: str,
+    task_description: str,
+    dev_reasoning: str,
+    user_locale: str,
+    mode: str,
+    is_hot_module: bool,
+) -> str:
+    # Mode and hot-module status pick the review depth, so a verdict from a
+    # laxer review is never reused once the module turns hot
+    h = hashlib.blake2b(digest_size=16)
+    for part in (
+        code,
+        file_path,
+        language,
+        task_description,
+        dev_reasoning,
+        user_locale,
+        mode,
+        "hot" if is_hot_module else "",
+    ):
+        h.update(part.encode("utf-8", "surrogatepass"))
+        h.update(b"\0")
+    return f"qa:review:{h.hexdigest()}"
+
+
+async def get_cached_review(
+    key: str, local: TTLCache[ReviewResult], redis: Any | None
+) -> ReviewResult | None:
+    """In-process first, then Redis (if available); any Redis error counts as a miss."""
+    cached = local.get(key)
+    if cached is not None or redis is None:
+        return cached
+    try:
+        raw = await redis.get(key)
+        if raw is None:
+            return None
+        result = ReviewResult(**orjson.loads(raw))
+    except Exception:
+        logger.warning("QA review cache read failed for %s", key, exc_info=True)
+        return None
+    local[key] = result
+    return result
+
+
+async def store_cached_review(
+    key: str,
+    result: ReviewResult,
+    local: TTLCache[ReviewResult],
+    redis: Any | None,
+    ttl: int,
+) -> None:
+    local[key] = result
+    if redis is None:
+        return
+    try:
+        await redis.set(key, orjson.dumps(result), ex=ttl)
+    except Exception:
+        logger.warning("QA review cache write failed for %s", key, exc_info=True)
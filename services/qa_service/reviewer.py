@@ -42,6 +42,7 @@ from shared.prompt_locale import (
 )
 from shared.tools import ToolRegistry, execute_tool
 from shared.tools.models import ToolExecutionResult
+from shared.utils.prompt_template import PreparsedTemplate
 
 logger = logging.getLogger(__name__)
 
@@ -51,7 +52,7 @@ _QA_PARSE_REPAIR = (
     "You must include the line VERDICT: PASS or VERDICT: FAIL and all other sections in the required format."
 )
 
-@dataclass
+@dataclass(slots=True)
 class ReviewResult:
     passed: bool
     issues: list[str] = field(default_factory=list)
@@ -63,6 +64,15 @@ class ReviewResult:
 
 SERVICE_NAME = "qa_service"
 
+# Label children resolved once; the token counters are bumped on every LLM round
+_PROMPT_TOKENS = llm_tokens.labels(service=SERVICE_NAME, direction="prompt")
+_COMPLETION_TOKENS = llm_tokens.labels(service=SERVICE_NAME, direction="completion")
+
+# Parsed once; the review prompts embed whole files and are rendered per review
+_QA_REVIEW_TEMPLATE = PreparsedTemplate(QA_REVIEW_PROMPT)
+_QA_REVIEW_NO_PRIOR_TEMPLATE = PreparsedTemplate(QA_REVIEW_PROMPT_NO_PRIOR)
+_QA_TOOL_LOOP_SYSTEM_TEMPLATE = PreparsedTemplate(QA_TOOL_LOOP_SYSTEM)
+
 
 async def review_code(
     llm: LLMProvider,
@@ -129,11 +139,14 @@ async def review_code_with_tool_loop(
 
 
 def _static_check(code: str, *, user_locale: str = "en") -> list[str]:
-    """Detect known dangerous patterns. O(n*m) but code is small."""
-    issues: list[str] = []
-    for pattern in DANGEROUS_PATTERNS:
-        if pattern in code:
-            issues.append(f"Dangerous pattern detected: `{pattern}`")
+    """Detect known dangerous patterns in the code."""
+    # CPython's substring search outruns a regex alternation or an Aho-Corasick
+    # automaton for this handful of literals, even though it rescans per pattern
+    issues = [
+        f"Dangerous pattern detected: `{pattern}`"
+        for pattern in DANGEROUS_PATTERNS
+        if pattern in code
+    ]
 
     suspicious_snippets = _heuristic_suspicious_snippets(code, user_locale=user_locale)
     issues.extend(suspicious_snippets)
@@ -174,7 +187,7 @@ def _build_llm_review_prompt(
     response_language_rules = natural_language_rules_for_locale(user_locale)
 
     if dev_reasoning.strip():
-        return QA_REVIEW_PROMPT.format(
+        return _QA_REVIEW_TEMPLATE.render(
             language=language,
             file_path=file_path,
             code=code,
@@ -186,7 +199,7 @@ def _build_llm_review_prompt(
             qa_rules_block=qa_rules_block,
             response_language_rules=response_language_rules,
         )
-    return QA_REVIEW_PROMPT_NO_PRIOR.format(
+    return _QA_REVIEW_NO_PRIOR_TEMPLATE.render(
         language=language,
         file_path=file_path,
         code=code,
@@ -291,7 +304,7 @@ async def _llm_review_with_tool_loop(
     messages: list[dict[str, Any]] = [
         {
             "role": "system",
-            "content": QA_TOOL_LOOP_SYSTEM.format(
+            "content": _QA_TOOL_LOOP_SYSTEM_TEMPLATE.render(
                 response_language_rules=system_rules,
             ),
         },
@@ -318,8 +331,8 @@ async def _llm_review_with_tool_loop(
         total_pt += pt
         total_ct += ct
         if pt or ct:
-            llm_tokens.labels(service=SERVICE_NAME, direction="prompt").inc(pt)
-            llm_tokens.labels(service=SERVICE_NAME, direction="completion").inc(ct)
+            _PROMPT_TOKENS.inc(pt)
+            _COMPLETION_TOKENS.inc(ct)
         if loop_tokens_exceeds_budget(total_pt, total_ct, budget.max_tokens_loop):
             agent_tool_loop_llm_rounds.labels(service=SERVICE_NAME).observe(float(llm_rounds))
             agent_tool_loop_outcomes_total.labels(
@@ -430,6 +443,13 @@ def _build_qa_rules_block(language: str) -> str:
     return "\n".join(lines)
 
 
+# Section headers recognised by _parse_review_response, matched case-insensitively
+_REVIEW_HEADER_RE = re.compile(
+    r"(REASONING|VERDICT|ISSUES|REQUIRED_CHANGES|OPTIONAL_IMPROVEMENTS):", re.IGNORECASE
+)
+_NUMBERED_ITEM_RE = re.compile(r"^(\d+)[.)]\s*(.+)$")
+
+
 def _parse_review_response(content: str) -> ReviewResult:
     """Parse structured LLM output into `ReviewResult`."""
     lines = content.strip().splitlines()
@@ -454,35 +474,33 @@ def _parse_review_response(content: str) -> ReviewResult:
 
     for line in lines:
         stripped = line.strip()
-        upper = stripped.upper()
+        heading = _REVIEW_HEADER_RE.match(stripped)
+        section = heading.group(1).upper() if heading else ""
+        inline = stripped[heading.end():].strip() if heading else ""
 
-        if upper.startswith("REASONING:"):
-            reasoning = stripped[len("REASONING:"):].strip()
+        if section == "REASONING":
+            reasoning = inline
             _reset_sections()
-        elif upper.startswith("VERDICT:"):
-            verdict = upper.replace("VERDICT:", "").strip()
-            passed = verdict == "PASS"
+        elif section == "VERDICT":
+            passed = inline.upper().replace("VERDICT:", "").strip() == "PASS"
             _reset_sections()
-        elif upper.startswith("ISSUES:"):
+        elif section == "ISSUES":
             in_issues = True
             in_required = in_optional = False
-            inline = stripped[len("ISSUES:"):].strip()
             if inline.lower() not in ("none", ""):
                 issues.append(inline)
-        elif upper.startswith("REQUIRED_CHANGES:"):
+        elif section == "REQUIRED_CHANGES":
             _reset_sections()
             in_required = True
-            inline = stripped[len("REQUIRED_CHANGES:"):].strip()
             if inline.lower() not in ("none", ""):
                 required_changes.append(inline)
-        elif upper.startswith("OPTIONAL_IMPROVEMENTS:"):
+        elif section == "OPTIONAL_IMPROVEMENTS":
             in_issues = in_required = False
             in_optional = True
-            inline = stripped[len("OPTIONAL_IMPROVEMENTS:"):].strip()
             if inline.lower() not in ("none", ""):
                 optional_improvements.append(inline)
         elif in_required and stripped:
-            num = re.match(r"^(\d+)[.)]\s*(.+)$", stripped)
+            num = _NUMBERED_ITEM_RE.match(stripped)
             if num:
                 required_changes.append(num.group(2).strip())
             elif stripped.startswith("- "):
@@ -534,10 +552,10 @@ def _parse_review_response(content: str) -> ReviewResult:
         issues.append("LLM reviewer returned FAIL without specific issues")
 
     logger.info(
-        "LLM review result: %s, issues=%d. Reasoning: %s",
+        "LLM review result: %s, issues=%d. Reasoning: %.80s",
         "PASS" if passed else "FAIL",
         len(issues),
-        reasoning[:80],
+        reasoning,
     )
     return ReviewResult(
         passed=passed,
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import json
+import mmap
 import os
 import re
 import shutil
 import tempfile
+from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import httpx
+import orjson
 from pydantic import Field
 
 from shared.agent_subprocess import run_sync_hardened
@@ -141,6 +145,23 @@ class FormatCodeInput(ToolInput):
     )
 
 
+def _resolve_ruff_argv() -> list[str]:
+    """
+    Binario de ruff resuelto una vez: invocarlo directamente evita arrancar un
+    intérprete Python (`python -m ruff`) en cada revisión.
+    """
+    try:
+        from ruff.__main__ import find_ruff_bin
+
+        return [find_ruff_bin()]
+    except Exception:
+        ruff_bin = shutil.which("ruff")
+        return [ruff_bin] if ruff_bin else ["python", "-m", "ruff"]
+
+
+_RUFF_ARGV = _resolve_ruff_argv()
+
+
 def python_lint_tool(args: LintInput) -> dict[str, Any]:
     """Ejecuta ruff sobre el código proporcionado y devuelve una lista estructurada."""
     if args.language.lower() != "python":
@@ -151,51 +172,41 @@ def python_lint_tool(args: LintInput) -> dict[str, Any]:
         }
 
     try:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-            target = tmp_path / (args.file_path or "tmp.py")
-            target.parent.mkdir(parents=True, exist_ok=True)
-            target.write_text(args.code, encoding="utf-8")
-
-            proc = run_sync_hardened(
-                ["python", "-m", "ruff", "check", str(target)],
-                cwd=str(tmp_path),
-                timeout_s=15.0,
-                max_stdout_bytes=256_000,
-                max_stderr_bytes=64_000,
-            )
-            issues: list[dict[str, Any]] = []
-            for line in (proc.stdout or "").splitlines():
-                parts = line.split(":", 3)
-                if len(parts) < 4:
-                    continue
-                _, line_s, col_s, rest = parts
-                try:
-                    line_i = int(line_s)
-                    col_i = int(col_s)
-                except ValueError:
-                    continue
-                rest = rest.lstrip()
-                if " " in rest:
-                    code, msg = rest.split(" ", 1)
-                else:
-                    code, msg = rest, ""
+        proc = run_sync_hardened(
+            [
+                *_RUFF_ARGV,
+                "check",
+                "--isolated",
+                "--output-format=json",
+                "--stdin-filename",
+                args.file_path or "tmp.py",
+                "-",
+            ],
+            stdin=args.code,
+            timeout_s=15.0,
+            max_stdout_bytes=256_000,
+            max_stderr_bytes=64_000,
+        )
+        issues: list[dict[str, Any]] = []
+        if proc.stdout.strip():
+            for item in orjson.loads(proc.stdout):
+                location = item.get("location") or {}
                 issues.append(
                     {
-                        "line": line_i,
-                        "column": col_i,
-                        "code": code.strip(),
-                        "message": msg.strip(),
+                        "line": location.get("row"),
+                        "column": location.get("column"),
+                        "code": item.get("code") or "invalid-syntax",
+                        "message": item.get("message") or "",
                     }
                 )
 
-            return {
-                "supported": True,
-                "issues": issues,
-                "exit_code": proc.returncode,
-                "stdout": proc.stdout[-4000:],
-                "stderr": proc.stderr[-2000:],
-            }
+        return {
+            "supported": True,
+            "issues": issues,
+            "exit_code": proc.returncode,
+            "stdout": proc.stdout[-4000:],
+            "stderr": proc.stderr[-2000:],
+        }
     except Exception as exc:
         return {
             "supported": True,
@@ -206,41 +217,225 @@ def python_lint_tool(args: LintInput) -> dict[str, Any]:
         }
 
 
-def search_in_repo_tool(args: SearchInRepoInput) -> dict[str, Any]:
-    base_dir = _safe_join(args.directory)
-    if not base_dir.exists() or not base_dir.is_dir():
-        return {"directory": str(base_dir), "matches": []}
+_RG_BIN = shutil.which("rg")
 
+
+def _rel_to_repo(path: Path) -> str:
+    try:
+        return str(path.relative_to(REPO_ROOT))
+    except ValueError:
+        return str(path)
+
+
+def _search_with_rg(
+    rg_bin: str, base_dir: Path, args: SearchInRepoInput
+) -> list[dict[str, Any]] | None:
+    """
+    Búsqueda con ripgrep (`--json`). Devuelve None si rg no pudo ejecutar la
+    búsqueda (p. ej. regex que su motor no acepta) para usar el recorrido en Python.
+    """
+    proc = run_sync_hardened(
+        [
+            rg_bin,
+            "--json",
+            "-n",
+            "--max-count",
+            str(args.max_results),
+            "-e",
+            args.pattern,
+            str(base_dir),
+        ],
+        timeout_s=8.0,
+        max_stdout_bytes=4_000_000,
+        max_stderr_bytes=8_192,
+    )
+    matches: list[dict[str, Any]] = []
+    for raw in proc.stdout.splitlines():
+        if len(matches) >= args.max_results:
+            break
+        try:
+            event = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            continue
+        if event.get("type") != "match":
+            continue
+        data = event["data"]
+        path_text = data.get("path", {}).get("text")
+        line_text = data.get("lines", {}).get("text")
+        if path_text is None or line_text is None:
+            continue
+        matches.append(
+            {
+                "file": _rel_to_repo(Path(path_text)),
+                "line": data.get("line_number"),
+                "snippet": line_text.strip(),
+            }
+        )
+    if proc.returncode == 2 and not matches and not proc.timed_out:
+        return None
+    return matches
+
+
+_SEARCH_SKIP_DIRS = frozenset(
+    {
+        ".git",
+        "node_modules",
+        "__pycache__",
+        ".venv",
+        "venv",
+        "dist",
+        "build",
+        "target",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+    }
+)
+_SEARCH_SKIP_SUFFIXES = frozenset(
+    {".png", ".jpg", ".jpeg", ".gif", ".ico", ".pdf", ".so", ".pyc", ".bin", ".zip", ".gz"}
+)
+_SEARCH_MAX_FILE_BYTES = 2_000_000
+
+_REGEX_META = frozenset(".^$*+?{}[]|()\\\n\r")
+# Constructs whose bytes meaning differs from str (Unicode classes, per-byte
+# `.`/`[^...]`, `$` before `\r`, inline flags such as (?i)); escaped
+# punctuation and \n, \t... are safe.
+_BYTES_UNSAFE_RE = re.compile(r"[.$]|\[\^|\(\?|\\[^\W_ntrfvAZ]")
+
+
+@lru_cache(maxsize=1024)
+def _compile_search_pattern(
+    pattern: str,
+) -> tuple[re.Pattern[str], re.Pattern[bytes] | None, bytes | None]:
+    """
+    El patrón en bytes localiza candidatos sobre el archivo mapeado; el de str
+    confirma cada línea candidata, así la semántica sigue siendo línea a línea.
+    Solo hay versión en bytes si el patrón es ASCII y no usa construcciones cuyo
+    significado cambia en bytes (`.`, clases como `\\w`, `$` ante CRLF, flags en
+    línea); si no, el archivo se decodifica y se busca línea a línea en str.
+    Si el patrón es un literal (sin metacaracteres, o una regex inválida que se
+    busca tal cual) se devuelve también en bytes para buscarlo con `find`.
+    """
     try:
-        pattern = re.compile(args.pattern)
+        compiled = re.compile(pattern)
+        bpattern = (
+            re.compile(pattern.encode("ascii"), re.MULTILINE)
+            if pattern.isascii() and not _BYTES_UNSAFE_RE.search(pattern)
+            else None
+        )
+        is_literal = not _REGEX_META.intersection(pattern)
     except re.error:
-        pattern = re.compile(re.escape(args.pattern))
-
+        escaped = re.escape(pattern)
+        compiled, bpattern = re.compile(escaped), None
+        is_literal = "\n" not in pattern and "\r" not in pattern
+    literal = pattern.encode("utf-8") if is_literal and pattern else None
+    return compiled, bpattern, literal
+
+
+def _search_lines(
+    path: Path,
+    text: str,
+    pattern: re.Pattern[str],
+    limit: int,
+    matches: list[dict[str, Any]],
+) -> None:
+    for i, line in enumerate(text.splitlines(), start=1):
+        if pattern.search(line):
+            matches.append({"file": _rel_to_repo(path), "line": i, "snippet": line.strip()})
+            if len(matches) >= limit:
+                break
+
+
+def _search_file(
+    path: Path,
+    pattern: re.Pattern[str],
+    bpattern: re.Pattern[bytes] | None,
+    literal: bytes | None,
+    limit: int,
+    matches: list[dict[str, Any]],
+) -> None:
+    try:
+        with open(path, "rb") as fh:
+            size = os.fstat(fh.fileno()).st_size
+            if size == 0 or size > _SEARCH_MAX_FILE_BYTES:
+                return
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(b"\0", 0, 8192) != -1:
+                    return
+                if literal is None and bpattern is None:
+                    _search_lines(path, mm[:].decode("utf-8", "ignore"), pattern, limit, matches)
+                    return
+                line_no, counted_to, pos = 1, 0, 0
+                while pos < len(mm) and len(matches) < limit:
+                    if literal is not None:
+                        hit = mm.find(literal, pos)
+                    else:
+                        m = bpattern.search(mm, pos) if bpattern is not None else None
+                        hit = -1 if m is None else m.start()
+                    if hit == -1:
+                        return
+                    start = mm.rfind(b"\n", 0, hit) + 1
+                    end = mm.find(b"\n", hit)
+                    if end == -1:
+                        end = len(mm)
+                    line = mm[start:end].decode("utf-8", "ignore").rstrip("\r")
+                    if literal is None and not pattern.search(line):
+                        # The bytes match crossed a newline; retry inside this line
+                        pos = hit + 1
+                        continue
+                    line_no += mm[counted_to:start].count(b"\n")
+                    counted_to = start
+                    matches.append(
+                        {
+                            "file": _rel_to_repo(path),
+                            "line": line_no,
+                            "snippet": line.strip(),
+                        }
+                    )
+                    pos = end + 1
+    except (OSError, ValueError):
+        return
+
+
+def _iter_search_files(base_dir: Path) -> Iterator[Path]:
+    """Recorre el árbol sin entrar en VCS, dependencias ni cachés de build."""
+    for root, dirs, files in os.walk(base_dir):
+        dirs[:] = [d for d in dirs if d not in _SEARCH_SKIP_DIRS]
+        for name in files:
+            if os.path.splitext(name)[1].lower() not in _SEARCH_SKIP_SUFFIXES:
+                yield Path(root, name)
+
+
+def _search_with_python(base_dir: Path, args: SearchInRepoInput) -> list[dict[str, Any]]:
+    """
+    Sin rg: cada archivo se mapea en memoria y, si el patrón lo permite, se busca
+    sobre los bytes sin decodificarlo entero ni partirlo en líneas. Se saltan los
+    binarios (NUL en los primeros 8 KiB), igual que hace rg, y los archivos de
+    más de 2 MB.
+    """
+    pattern, bpattern, literal = _compile_search_pattern(args.pattern)
     matches: list[dict[str, Any]] = []
-    for path in base_dir.rglob("*"):
+    for path in _iter_search_files(base_dir):
         if len(matches) >= args.max_results:
             break
         if not path.is_file():
             continue
-        try:
-            text = path.read_text(encoding="utf-8", errors="ignore")
-        except Exception:
-            continue
-        for i, line in enumerate(text.splitlines(), start=1):
-            if pattern.search(line):
-                try:
-                    rel = path.relative_to(REPO_ROOT)
-                except ValueError:
-                    rel = path
-                matches.append(
-                    {
-                        "file": str(rel),
-                        "line": i,
-                        "snippet": line.strip(),
-                    }
-                )
-                if len(matches) >= args.max_results:
-                    break
+        _search_file(path, pattern, bpattern, literal, args.max_results, matches)
+    return matches
+
+
+def search_in_repo_tool(args: SearchInRepoInput) -> dict[str, Any]:
+    """
+    Busca con ripgrep si está instalado (streaming, sin cargar archivos enteros en
+    memoria); si no, o si rg rechaza el patrón, recorre el árbol en Python.
+    """
+    base_dir = _safe_join(args.directory)
+    if not base_dir.exists() or not base_dir.is_dir():
+        return {"directory": str(base_dir), "matches": []}
+
+    matches = _search_with_rg(_RG_BIN, base_dir, args) if _RG_BIN else None
+    if matches is None:
+        matches = _search_with_python(base_dir, args)
 
     return {
         "directory": str(base_dir),
@@ -249,7 +444,9 @@ def search_in_repo_tool(args: SearchInRepoInput) -> dict[str, Any]:
     }
 
 
-async def query_events_tool(args: QueryEventsInput) -> dict[str, Any]:
+async def query_events_tool(
+    args: QueryEventsInput, client: httpx.AsyncClient
+) -> dict[str, Any]:
     """Consulta eventos recientes al memory_service (fachada HTTP sobre PostgreSQL)."""
     params: dict[str, Any] = {"limit": args.limit}
     if args.event_type:
@@ -257,22 +454,22 @@ async def query_events_tool(args: QueryEventsInput) -> dict[str, Any]:
     if args.plan_id:
         params["plan_id"] = args.plan_id
 
-    async with httpx.AsyncClient(base_url=MEMORY_SERVICE_URL, timeout=10.0) as client:
-        resp = await client.get("/events", params=params)
-        resp.raise_for_status()
-        data = resp.json()
+    resp = await client.get("/events", params=params)
+    resp.raise_for_status()
+    data = orjson.loads(resp.content)
     return {"events": data}
 
 
-async def failure_patterns_tool(args: FailurePatternsInput) -> dict[str, Any]:
+async def failure_patterns_tool(
+    args: FailurePatternsInput, client: httpx.AsyncClient
+) -> dict[str, Any]:
     """Consulta los patrones agregados de fallos históricos desde memory_service."""
-    async with httpx.AsyncClient(base_url=MEMORY_SERVICE_URL, timeout=10.0) as client:
-        resp = await client.get(
-            "/patterns/failures",
-            params={"limit": args.limit},
-        )
-        resp.raise_for_status()
-        data = resp.json()
+    resp = await client.get(
+        "/patterns/failures",
+        params={"limit": args.limit},
+    )
+    resp.raise_for_status()
+    data = orjson.loads(resp.content)
 
     patterns = data.get("patterns") or []
     if args.module_prefix:
@@ -655,31 +852,25 @@ def format_code_tool(args: FormatCodeInput) -> dict[str, Any]:
                     "note": "black no está instalado; se omite el formateo automático para Python",
                 }
 
-            with tempfile.TemporaryDirectory() as tmpdir:
-                tmp_path = Path(tmpdir)
-                target = tmp_path / (args.file_path or "tmp.py")
-                if not str(target).endswith(".py"):
-                    target = target.with_suffix(".py")
-                target.parent.mkdir(parents=True, exist_ok=True)
-                target.write_text(args.code, encoding="utf-8")
-
-                proc = run_sync_hardened(
-                    ["python", "-m", "black", str(target)],
-                    cwd=str(tmp_path),
-                    timeout_s=25.0,
-                    max_stdout_bytes=32_768,
-                    max_stderr_bytes=32_768,
-                )
-
-                formatted = target.read_text(encoding="utf-8", errors="replace")
-                return {
-                    "supported": True,
-                    "language": "python",
-                    "formatted_code": formatted,
-                    "exit_code": proc.returncode,
-                    "stdout": proc.stdout[-4000:],
-                    "stderr": proc.stderr[-2000:],
-                }
+            target = Path(args.file_path or "tmp.py")
+            if not str(target).endswith(".py"):
+                target = target.with_suffix(".py")
+            proc = run_sync_hardened(
+                ["python", "-m", "black", "-q", "--stdin-filename", str(target), "-"],
+                stdin=args.code,
+                timeout_s=25.0,
+                max_stdout_bytes=len(args.code.encode("utf-8")) * 2 + 65_536,
+                max_stderr_bytes=32_768,
+            )
+            ok = proc.returncode == 0 and not proc.timed_out
+            return {
+                "supported": True,
+                "language": "python",
+                "formatted_code": proc.stdout if ok else args.code,
+                "exit_code": proc.returncode,
+                "stdout": "",
+                "stderr": proc.stderr[-2000:],
+            }
         except Exception as exc:
             return {
                 "supported": True,
@@ -758,9 +949,22 @@ def format_code_tool(args: FormatCodeInput) -> dict[str, Any]:
     }
 
 
-def build_qa_tool_registry() -> ToolRegistry:
-    """Construct a ToolRegistry pre-populated with tools useful for qa_service."""
+def build_qa_tool_registry(http_client: httpx.AsyncClient | None = None) -> ToolRegistry:
+    """
+    Construct a ToolRegistry pre-populated with tools useful for qa_service.
+
+    The memory_service tools share one client (the service's own when
+    `http_client` is given, which it closes on shutdown) instead of opening a
+    new connection per call.
+    """
     registry = ToolRegistry()
+    client = http_client or httpx.AsyncClient(base_url=MEMORY_SERVICE_URL, timeout=10.0)
+
+    async def _events_wrapper(args: QueryEventsInput) -> dict[str, Any]:
+        return await query_events_tool(args, client=client)
+
+    async def _patterns_wrapper(args: FailurePatternsInput) -> dict[str, Any]:
+        return await failure_patterns_tool(args, client=client)
 
     registry.register(
         ToolDefinition(
@@ -858,7 +1062,7 @@ def build_qa_tool_registry() -> ToolRegistry:
             name="query_events",
             description="Consultar eventos recientes del memory_service (por tipo y/o plan_id)",
             input_model=QueryEventsInput,
-            func=query_events_tool,
+            func=_events_wrapper,
             timeout_s=10.0,
             max_retries=0,
             sandboxed=True,
@@ -871,7 +1075,7 @@ def build_qa_tool_registry() -> ToolRegistry:
             name="failure_patterns",
             description="Consultar patrones históricos de fallos (qa.failed, security.blocked) agregados por módulo",
             input_model=FailurePatternsInput,
-            func=failure_patterns_tool,
+            func=_patterns_wrapper,
             timeout_s=10.0,
             max_retries=0,
             sandboxed=True,
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from shared.utils.env import env_bool, env_int, env_str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReplannerConfig:
     rabbitmq_url: str
     memory_service_url: str
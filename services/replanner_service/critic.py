@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import logging
+import re
 from dataclasses import dataclass
 from typing import Any
 
@@ -25,11 +26,16 @@ from shared.observability.metrics import (
 from shared.prompt_locale import natural_language_rules_for_locale
 from shared.tools import ToolRegistry, execute_tool
 from shared.tools.models import ToolExecutionResult
+from shared.utils.prompt_template import PreparsedTemplate
 
 logger = logging.getLogger(__name__)
 
 SERVICE_NAME = "replanner_service"
 
+# Label children resolved once; the token counters are bumped on every LLM round
+_PROMPT_TOKENS = llm_tokens.labels(service=SERVICE_NAME, direction="prompt")
+_COMPLETION_TOKENS = llm_tokens.labels(service=SERVICE_NAME, direction="completion")
+
 ADMADC_TOOL_LOOP_MARKER = "[ADMADC_TOOL_LOOP]"
 
 _REPLANNER_TOOL_NAMES = ("semantic_outcome_memory", "failure_patterns")
@@ -48,26 +54,11 @@ REPLANNER_PROMPT = (
 """
     + REPLANNER_SENIOR_BAR
     + """
-Your goal:
-{agent_goal}
-
-You are analysing the outcome of a previous plan with id {plan_id}.
-
-You receive:
+You analyse the outcome of a previous plan. After these instructions you receive your goal, the plan id and:
 - The final QA and/or Security result.
 - A compact semantic memory window with past decisions and conclusions.
 - Aggregated historical failure patterns by module (qa.failed / security.blocked hot spots).
 
-RESPONSE LANGUAGE:
-{response_language_rules}
-
-MEMORY CONTEXT:
-{memory_context}
-
-CURRENT OUTCOME SUMMARY:
-{outcome_summary}
-{security_instruction}
-
 Your job:
 1. Decide whether the existing plan needs revision.
 2. If yes, propose the SMALLEST set of concrete, high-leverage adjustments.
@@ -82,6 +73,22 @@ REVISION_NEEDED: yes|no
 SUGGESTIONS:
 - <suggestion 1 (if any)>
 - <suggestion 2 (if any)>
+
+RESPONSE LANGUAGE:
+{response_language_rules}
+
+Your goal:
+{agent_goal}
+
+You are analysing the outcome of a previous plan with id {plan_id}.
+
+MEMORY CONTEXT:
+{memory_context}
+
+CURRENT OUTCOME SUMMARY:
+{outcome_summary}
+{security_instruction}
+Respond now in the exact format specified above.
 """
 )
 SECURITY_BLOCKED_INSTRUCTION = """
@@ -114,8 +121,12 @@ SUGGESTIONS:
 """
 )
 
+# Parsed once; rendered for every QA failure / security block the replanner sees
+_REPLANNER_TEMPLATE = PreparsedTemplate(REPLANNER_PROMPT)
+_REPLANNER_TOOL_LOOP_SYSTEM_TEMPLATE = PreparsedTemplate(REPLANNER_TOOL_LOOP_SYSTEM)
 
-@dataclass
+
+@dataclass(slots=True)
 class ReplanDecision:
     revision_needed: bool
     severity: str
@@ -137,7 +148,7 @@ async def analyse_outcome(
     security_instruction = (
         SECURITY_BLOCKED_INSTRUCTION if outcome_type == "security_blocked" else ""
     )
-    prompt = REPLANNER_PROMPT.format(
+    prompt = _REPLANNER_TEMPLATE.render(
         agent_goal=agent_goal,
         plan_id=plan_id,
         memory_context=memory_context.strip() or "None.",
@@ -210,7 +221,7 @@ async def analyse_outcome_with_tool_loop(
     security_instruction = (
         SECURITY_BLOCKED_INSTRUCTION if outcome_type == "security_blocked" else ""
     )
-    base_user = REPLANNER_PROMPT.format(
+    base_user = _REPLANNER_TEMPLATE.render(
         agent_goal=agent_goal,
         plan_id=plan_id,
         memory_context=memory_context.strip() or "None.",
@@ -224,7 +235,7 @@ async def analyse_outcome_with_tool_loop(
     messages: list[dict[str, Any]] = [
         {
             "role": "system",
-            "content": REPLANNER_TOOL_LOOP_SYSTEM.format(
+            "content": _REPLANNER_TOOL_LOOP_SYSTEM_TEMPLATE.render(
                 response_language_rules=system_rules,
             ),
         },
@@ -251,8 +262,8 @@ async def analyse_outcome_with_tool_loop(
         total_pt += pt
         total_ct += ct
         if pt or ct:
-            llm_tokens.labels(service=SERVICE_NAME, direction="prompt").inc(pt)
-            llm_tokens.labels(service=SERVICE_NAME, direction="completion").inc(ct)
+            _PROMPT_TOKENS.inc(pt)
+            _COMPLETION_TOKENS.inc(ct)
         if loop_tokens_exceeds_budget(total_pt, total_ct, budget.max_tokens_loop):
             agent_tool_loop_llm_rounds.labels(service=SERVICE_NAME).observe(float(llm_rounds))
             agent_tool_loop_outcomes_total.labels(
@@ -373,6 +384,12 @@ def _summarise_outcome(outcome: QAResultPayload | SecurityResultPayload) -> str:
     return "\n".join(lines)
 
 
+# Section headers recognised by _parse_replanner_response, matched case-insensitively
+_REPLANNER_HEADER_RE = re.compile(
+    r"(REASON|SEVERITY|REVISION_NEEDED|SUGGESTIONS):", re.IGNORECASE
+)
+
+
 def _parse_replanner_response(raw: str) -> ReplanDecision:
     revision_needed = False
     severity = "medium"
@@ -384,19 +401,20 @@ def _parse_replanner_response(raw: str) -> ReplanDecision:
 
     for line in lines:
         stripped = line.strip()
-        upper = stripped.upper()
+        heading = _REPLANNER_HEADER_RE.match(stripped)
+        header = heading.group(1).upper() if heading else ""
+        value = stripped[heading.end() :].strip() if heading else ""
 
-        if upper.startswith("REASON:"):
-            reason = stripped[len("REASON:") :].strip()
+        if header == "REASON":
+            reason = value
             in_suggestions = False
-        elif upper.startswith("SEVERITY:"):
-            severity = stripped[len("SEVERITY:") :].strip().lower() or "medium"
+        elif header == "SEVERITY":
+            severity = value.lower() or "medium"
             in_suggestions = False
-        elif upper.startswith("REVISION_NEEDED:"):
-            flag = stripped[len("REVISION_NEEDED:") :].strip().lower()
-            revision_needed = flag == "yes"
+        elif header == "REVISION_NEEDED":
+            revision_needed = value.lower() == "yes"
             in_suggestions = False
-        elif upper.startswith("SUGGESTIONS:"):
+        elif header == "SUGGESTIONS":
             in_suggestions = True
         elif in_suggestions and stripped.startswith("- "):
             suggestion = stripped.lstrip("- ").strip()
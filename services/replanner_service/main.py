@@ -15,6 +15,7 @@ from services.replanner_service.critic import (
 )
 from services.replanner_service.tools import build_replanner_tool_registry
 from shared.contracts.events import (
+    BaseEvent,
     EventType,
     PlanRevisionPayload,
     QAResultPayload,
@@ -29,9 +30,9 @@ from shared.observability.metrics import (
     agent_execution_time,
 )
 from shared.observability.routing import register_health_metrics_routes
-from shared.observability.tokens import emit_token_usage_event
+from shared.observability.tokens import token_usage_event
 from shared.tools import ToolRegistry, execute_tool
-from shared.utils import EventBus, store_event, subscribe_typed_event
+from shared.utils import EventBus, store_events, subscribe_typed_event
 from shared.utils.lifecycle import connect_event_bus, shutdown_runtime
 from shared.utils.path_grouping import infer_group_id
 
@@ -187,14 +188,11 @@ async def _analyse_and_emit_revision(
                     user_locale=user_locale,
                 )
 
-            await emit_token_usage_event(
+            tok_event = token_usage_event(
                 service_name=SERVICE_NAME,
                 plan_id=plan_id,
                 prompt_tokens=prompt_tokens,
                 completion_tokens=completion_tokens,
-                http_client=http_client,
-                logger=logger,
-                error_message="Failed to store replanner event %s",
             )
     except Exception:
         logger.exception(
@@ -205,18 +203,23 @@ async def _analyse_and_emit_revision(
         )
         return
 
+    # The token usage event is held back so a revision is stored with it in one
+    # bulk POST instead of two round trips to memory_service
+    to_store = [tok_event] if tok_event is not None else []
     if not result.revision_needed:
         logger.info(
             "Replanner decided no revision needed for plan %s (severity=%s)",
             plan_id[:8],
             result.severity,
         )
+        await _store_replanner_events(to_store)
         return
     if _replan_suggested_for_plan.get(plan_id):
         logger.info(
             "Replanner already emitted a plan.revision_suggested for plan %s; skipping.",
             plan_id[:8],
         )
+        await _store_replanner_events(to_store)
         return
 
     revision_payload = PlanRevisionPayload(
@@ -231,12 +234,7 @@ async def _analyse_and_emit_revision(
     )
     event = plan_revision_suggested(SERVICE_NAME, revision_payload)
     await event_bus.publish(event)
-    await store_event(
-        http_client,
-        event,
-        logger=logger,
-        error_message="Failed to store replanner event %s",
-    )
+    await _store_replanner_events([*to_store, event])
 
     logger.info(
         "Emitted plan.revision_suggested for original plan %s (new_plan_id=%s, severity=%s)",
@@ -247,6 +245,15 @@ async def _analyse_and_emit_revision(
     _replan_suggested_for_plan[plan_id] = True
 
 
+async def _store_replanner_events(events: list[BaseEvent]) -> None:
+    await store_events(
+        http_client,
+        events,
+        logger=logger,
+        error_message="Failed to store replanner event %s",
+    )
+
+
 async def _fetch_memory_context(plan_id: str, limit: int = 5) -> str:
     """
     Retrieve semantic memory focused on this plan id to provide context
@@ -3,9 +3,11 @@ from __future__ import annotations
 from typing import Any
 
 import httpx
+import orjson
 from pydantic import Field
 
 from shared.tools import ToolDefinition, ToolInput, ToolRegistry
+from shared.utils import post_json
 
 
 class SemanticOutcomeInput(ToolInput):
@@ -42,9 +44,10 @@ async def semantic_outcome_memory_tool(
     en resultados de pipeline, fallos de QA y bloqueos de seguridad.
     """
     async with httpx.AsyncClient(base_url=base_url, timeout=10.0) as client:
-        resp = await client.post(
+        resp = await post_json(
+            client,
             "/semantic/search",
-            json={
+            {
                 "query": f"Outcome summary and reasoning for plan {args.plan_id}",
                 "plan_id": args.plan_id,
                 "event_types": [
@@ -56,7 +59,7 @@ async def semantic_outcome_memory_tool(
             },
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
     return {"results": data.get("results", [])}
 
 
@@ -74,7 +77,7 @@ async def failure_patterns_tool(
             params={"limit": args.limit},
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
 
     patterns = data.get("patterns") or []
     if args.module_prefix:
@@ -12,18 +12,23 @@ SECURITY_RULES: list[tuple[str, re.Pattern[str]]] = [
     ("hardcoded_password", re.compile(r'(?i)(password|passwd|pwd)\s*=\s*["\'][^"\']{4,}["\']')),
     ("hardcoded_token", re.compile(r'(?i)(token|secret)\s*=\s*["\'][A-Za-z0-9_\-]{16,}["\']')),
 
-    ("dangerous_eval", re.compile(r'\beval\s*\(')),
-    ("dangerous_exec", re.compile(r'\bexec\s*\(')),
+    # Literal first, word boundary re-checked by the lookbehind (same as a leading \b):
+    # a pattern that starts with a literal lets sre jump between its occurrences
+    # instead of trying every position of the file.
+    ("dangerous_eval", re.compile(r'eval(?<=\beval)\s*\(')),
+    ("dangerous_exec", re.compile(r'exec(?<=\bexec)\s*\(')),
 
-    ("pickle_deserialize", re.compile(r'\bpickle\.loads\s*\(')),
-    ("marshal_deserialize", re.compile(r'\bmarshal\.loads\s*\(')),
+    ("pickle_deserialize", re.compile(r'pickle\.loads(?<=\bpickle\.loads)\s*\(')),
+    ("marshal_deserialize", re.compile(r'marshal\.loads(?<=\bmarshal\.loads)\s*\(')),
 
     ("path_traversal", re.compile(r'\.\./')),
 
-    ("shell_injection_os", re.compile(r'\bos\.system\s*\(')),
-    ("shell_injection_subprocess", re.compile(r'\bsubprocess\.(call|Popen|run)\s*\(.*shell\s*=\s*True')),
+    ("shell_injection_os", re.compile(r'os\.system(?<=\bos\.system)\s*\(')),
+    # The gap before the flag stops at the next call (that call's own match covers the
+    # rest), so repeated calls without the flag cost one pass instead of one per call.
+    ("shell_injection_subprocess", re.compile(r'subprocess\.(?<=\bsubprocess\.)(call|Popen|run)\s*\((?:(?!\bsubprocess\.(?:call|Popen|run)\s*\().)*shell\s*=\s*True')),
 
-    ("sql_injection_risk", re.compile(r'(?i)(execute|executemany)\s*\(\s*["\'].*%s')),
+    ("sql_injection_risk", re.compile(r'(?i)(execute|executemany)\s*\(\s*["\'](?:(?!(?:execute|executemany)\s*\(\s*["\']).)*%s')),
 
     ("java_runtime_exec", re.compile(r'Runtime\.getRuntime\(\)\.exec\s*\(')),
     ("java_processbuilder_exec", re.compile(r'new\s+ProcessBuilder\s*\(')),
@@ -31,13 +36,38 @@ SECURITY_RULES: list[tuple[str, re.Pattern[str]]] = [
 
     ("sql_concat_plus", re.compile(r'(?i)("(SELECT|UPDATE|DELETE|INSERT)[^"]*"\s*\+\s*\w+)')),
 
-    ("flask_debug_true", re.compile(r'\bapp\.run\([^)]*debug\s*=\s*True')),
-    ("django_debug_true", re.compile(r'\bDEBUG\s*=\s*True')),
+    ("flask_debug_true", re.compile(r'app\.run\((?<=\bapp\.run\()(?:(?!\bapp\.run\()[^)])*debug\s*=\s*True')),
+    ("django_debug_true", re.compile(r'DEBUG(?<=\bDEBUG)\s*=\s*True')),
 
     ("cors_allow_all_header", re.compile(r'Access-Control-Allow-Origin["\']?\s*[:=]\s*["\*]["\']')),
     ("express_cors_all", re.compile(r'cors\(\s*\{\s*origin\s*:\s*["\']\*["\']')),
 ]
 
+# Substrings every match of the rule must contain (any one of them). A file that
+# has none of them cannot trigger the rule, so its regex is not run at all.
+# Compared lowercased for case-insensitive rules.
+SECURITY_RULE_LITERALS: dict[str, tuple[str, ...]] = {
+    "hardcoded_api_key": ("api_key", "apikey"),
+    "hardcoded_password": ("passw", "pwd"),
+    "hardcoded_token": ("token", "secret"),
+    "dangerous_eval": ("eval",),
+    "dangerous_exec": ("exec",),
+    "pickle_deserialize": ("pickle.loads",),
+    "marshal_deserialize": ("marshal.loads",),
+    "path_traversal": ("../",),
+    "shell_injection_os": ("os.system",),
+    "shell_injection_subprocess": ("subprocess.",),
+    "sql_injection_risk": ("execute",),
+    "java_runtime_exec": ("Runtime.getRuntime()",),
+    "java_processbuilder_exec": ("ProcessBuilder",),
+    "node_child_process_exec": ("child_process.",),
+    "sql_concat_plus": ("select", "update", "delete", "insert"),
+    "flask_debug_true": ("app.run(",),
+    "django_debug_true": ("DEBUG",),
+    "cors_allow_all_header": ("Access-Control-Allow-Origin",),
+    "express_cors_all": ("cors(",),
+}
+
 
 @dataclass(frozen=True)
 class SecurityConfig:
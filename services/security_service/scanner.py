@@ -16,16 +16,25 @@ from __future__ import annotations
 
 import json
 import logging
+import re
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from services.security_service.config import SECURITY_RULES, SecurityConfig
+from services.security_service.config import (
+    SECURITY_RULE_LITERALS,
+    SECURITY_RULES,
+    SecurityConfig,
+)
 from shared.agent_subprocess import run_sync_hardened
 
 logger = logging.getLogger(__name__)
 
+# bandit/semgrep run as subprocesses per file; threads overlap those waits
+_SCAN_MAX_WORKERS = 8
+
 
 @dataclass
 class ScanResult:
@@ -47,19 +56,29 @@ def scan_files(files: list[dict], cfg: SecurityConfig) -> ScanResult:
     Returns:
         ScanResult whose `reasoning` is the full pipeline conclusion.
     """
-    all_violations: list[str] = []
-    files_scanned = 0
-
-    for file_entry in files:
-        file_path = file_entry.get("file_path", "<unknown>")
-        code = file_entry.get("code", "")
-        language = str(file_entry.get("language", "") or "").lower()
-        if not code:
-            continue
-
-        files_scanned += 1
-        file_violations = _scan_single_file(file_path, code, language, cfg)
-        all_violations.extend(file_violations)
+    entries = [
+        (
+            file_entry.get("file_path", "<unknown>"),
+            file_entry.get("code", ""),
+            str(file_entry.get("language", "") or "").lower(),
+        )
+        for file_entry in files
+        if file_entry.get("code", "")
+    ]
+    files_scanned = len(entries)
+
+    def _scan(entry: tuple[str, str, str]) -> list[str]:
+        return _scan_single_file(*entry, cfg)
+
+    # The regex rules alone hold the GIL, so threads only pay off with external tools
+    if len(entries) > 1 and (cfg.enable_bandit or cfg.enable_semgrep):
+        with ThreadPoolExecutor(
+            max_workers=min(_SCAN_MAX_WORKERS, len(entries))
+        ) as pool:
+            per_file = list(pool.map(_scan, entries))
+    else:
+        per_file = [_scan(entry) for entry in entries]
+    all_violations = [v for file_violations in per_file for v in file_violations]
 
     approved = len(all_violations) == 0
     rules_checked = len(SECURITY_RULES)
@@ -149,8 +168,13 @@ def _scan_single_file(
     cfg: SecurityConfig,
 ) -> list[str]:
     violations: list[str] = []
+    # Lowercasing is only equivalent to re.IGNORECASE for ASCII (sre also folds
+    # e.g. "ſ" to "s"), so non-ASCII code runs the case-insensitive rules as-is
+    lowered = code.lower() if code.isascii() else None
 
     for rule_name, pattern in SECURITY_RULES:
+        if not _may_match(rule_name, pattern, code, lowered):
+            continue
         if pattern.search(code):
             violations.append(
                 f"[{file_path}] Rule '{rule_name}': pattern matched"
@@ -173,6 +197,19 @@ def _scan_single_file(
     return violations
 
 
+def _may_match(
+    rule_name: str, pattern: re.Pattern[str], code: str, lowered: str | None
+) -> bool:
+    literals = SECURITY_RULE_LITERALS.get(rule_name)
+    if not literals:
+        return True
+    if not pattern.flags & re.IGNORECASE:
+        return any(lit in code for lit in literals)
+    if lowered is None:
+        return True
+    return any(lit in lowered for lit in literals)
+
+
 def _run_bandit_security_checks(file_path: str, code: str) -> list[str]:
     """
     Ejecuta bandit sobre el código Python y devuelve violaciones formateadas
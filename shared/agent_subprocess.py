@@ -204,9 +204,11 @@ def run_sync_hardened(
     max_stdout_bytes: int | None = None,
     max_stderr_bytes: int | None = None,
     env: Mapping[str, str] | None = None,
+    stdin: str | None = None,
 ) -> SubprocessResult:
     """
     subprocess.run sin shell, con timeout y recorte de salida.
+    `stdin` se pasa como texto a la entrada estándar del proceso.
     """
     argv_list = [str(x) for x in argv]
     if not argv_list:
@@ -227,6 +229,7 @@ def run_sync_hardened(
             timeout=t,
             env=env_dict,
             shell=False,
+            input=stdin,
         )
         return SubprocessResult(
             int(completed.returncode if completed.returncode is not None else -1),
@@ -9,6 +9,12 @@ import httpx
 
 from shared.correlation import correlation_http_headers
 
+try:
+    import h2  # noqa: F401  (httpx needs it to negotiate HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 
 def _inject_correlation_request_header(request: httpx.Request) -> None:
     for name, value in correlation_http_headers().items():
@@ -22,11 +28,17 @@ def create_async_http_client(
     default_timeout: float = 120.0,
     timeout_env_var: str | None = None,
     inject_correlation_headers: bool = True,
+    connect_timeout: float | None = None,
+    http2: bool = False,
     **kwargs: Any,
 ) -> httpx.AsyncClient:
     """
     Build an AsyncClient. If `timeout_env_var` is set, read timeout from that env
     (fallback `default_timeout`). Otherwise use `default_timeout`.
+    `connect_timeout` optionally caps connection setup below that timeout.
+
+    `http2=True` multiplexes requests over one connection when the `h2`
+    package is installed, and silently stays on HTTP/1.1 otherwise.
 
     When `inject_correlation_headers` is True (default), merges X-ADMADC-* from
     contextvars into each outgoing request (see shared.correlation).
@@ -38,7 +50,13 @@ def create_async_http_client(
         timeout = default_timeout
 
     hooks_in: dict[str, list] = dict(kwargs.pop("event_hooks", None) or {})
-    client_kw: dict[str, Any] = {"timeout": timeout, **kwargs}
+    client_kw: dict[str, Any] = {
+        "timeout": timeout
+        if connect_timeout is None
+        else httpx.Timeout(timeout, connect=connect_timeout),
+        "http2": http2 and HTTP2_AVAILABLE,
+        **kwargs,
+    }
     if base_url:
         client_kw["base_url"] = base_url
 
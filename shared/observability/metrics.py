@@ -1,7 +1,11 @@
+import os
+import time
+
 from fastapi import Response
 from prometheus_client import (
     CONTENT_TYPE_LATEST,
     Counter,
+    Gauge,
     Histogram,
     generate_latest,
 )
@@ -82,9 +86,30 @@ approvals_access_denied = Counter(
     ["service", "reason", "action"],
 )
 
+redis_pool_connections = Gauge(
+    "redis_pool_connections",
+    "Redis client pool connections by state (in_use|available)",
+    ["service", "state"],
+)
+
+
+_METRICS_CACHE_TTL_SEC = float(os.environ.get("METRICS_CACHE_TTL_SEC", "1.0"))
+
+_metrics_cache: tuple[float, bytes] = (float("-inf"), b"")
+
 
 def metrics_response() -> Response:
+    """
+    Exposition of the default registry, reused for `METRICS_CACHE_TTL_SEC` seconds
+    so bursty or duplicated scrapes do not each walk every collector.
+    """
+    global _metrics_cache
+    now = time.monotonic()
+    built_at, body = _metrics_cache
+    if now - built_at >= _METRICS_CACHE_TTL_SEC:
+        body = generate_latest()
+        _metrics_cache = (now, body)
     return Response(
-        content=generate_latest(),
+        content=body,
         media_type=CONTENT_TYPE_LATEST,
     )
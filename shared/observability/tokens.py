@@ -2,24 +2,21 @@ from __future__ import annotations
 
 import logging
 
-from shared.contracts.events import TokensUsedPayload, metrics_tokens_used
+from shared.contracts.events import BaseEvent, TokensUsedPayload, metrics_tokens_used
 from shared.utils import store_event
 
 
-async def emit_token_usage_event(
+def token_usage_event(
     *,
     service_name: str,
     plan_id: str,
     prompt_tokens: int,
     completion_tokens: int,
-    http_client,
-    logger: logging.Logger,
-    error_message: str = "Failed to store event %s",
-) -> None:
-    """Persist a metrics.tokens_used event when token counters are non-zero."""
+) -> BaseEvent | None:
+    """Build the metrics.tokens_used event, or None when both counters are zero."""
     if not (prompt_tokens or completion_tokens):
-        return
-    tok_event = metrics_tokens_used(
+        return None
+    return metrics_tokens_used(
         service_name,
         TokensUsedPayload(
             plan_id=plan_id,
@@ -28,6 +25,27 @@ async def emit_token_usage_event(
             completion_tokens=completion_tokens,
         ),
     )
+
+
+async def emit_token_usage_event(
+    *,
+    service_name: str,
+    plan_id: str,
+    prompt_tokens: int,
+    completion_tokens: int,
+    http_client,
+    logger: logging.Logger,
+    error_message: str = "Failed to store event %s",
+) -> None:
+    """Persist a metrics.tokens_used event when token counters are non-zero."""
+    tok_event = token_usage_event(
+        service_name=service_name,
+        plan_id=plan_id,
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+    )
+    if tok_event is None:
+        return
     await store_event(
         http_client,
         tok_event,
@@ -5,6 +5,19 @@ from __future__ import annotations
 import hashlib
 from typing import Any
 
+try:
+    import blake3
+except ImportError:  # blake3 is in shared/requirements.txt; keep dev setups working
+    blake3 = None  # type: ignore[assignment]
+
+
+def _digest(parts: list[str]) -> bytes:
+    """Raw 128-bit key; these are in-process dict keys, so skip SHA-256 and hex encoding."""
+    material = "|".join(parts).encode("utf-8")
+    if blake3 is not None:
+        return blake3.blake3(material).digest(length=16)
+    return hashlib.blake2b(material, digest_size=16).digest()
+
 
 def _norm_mode(raw: str) -> str:
     x = (raw or "normal").strip().lower()
@@ -15,7 +28,7 @@ def _norm_mode(raw: str) -> str:
     return "normal"
 
 
-def plan_idempotency_key_gateway(body: dict[str, Any]) -> str:
+def plan_idempotency_key_gateway(body: dict[str, Any]) -> bytes:
     """Key from the full client body proxied to meta_planner."""
     from shared.prompt_locale import normalize_user_locale
 
@@ -28,11 +41,10 @@ def plan_idempotency_key_gateway(body: dict[str, Any]) -> str:
         (str(body.get("replanner_aggressiveness") or "1")).strip(),
         (str(body.get("llm_provider") or "default")).strip().lower(),
     ]
-    material = "|".join(parts)
-    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+    return _digest(parts)
 
 
-def plan_idempotency_key_meta_planner(body: dict[str, Any]) -> str:
+def plan_idempotency_key_meta_planner(body: dict[str, Any]) -> bytes:
     """Key from fields that affect planner output (PlanRequest / model_dump)."""
     from shared.prompt_locale import normalize_user_locale
 
@@ -43,5 +55,4 @@ def plan_idempotency_key_meta_planner(body: dict[str, Any]) -> str:
         _norm_mode(str(body.get("mode") or "normal")),
         normalize_user_locale(str(body.get("user_locale") or "") or None),
     ]
-    material = "|".join(parts)
-    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+    return _digest(parts)
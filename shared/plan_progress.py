@@ -0,0 +1,73 @@
+"""
+Contador de tareas aprobadas por QA por plan, en Redis (opcional).
+
+meta_planner registra cuántas tareas tiene el plan al crearlo; qa_service añade
+cada task_id aprobado a un set. Mientras el set no alcance el total, QA sabe que
+el plan no puede estar listo para PR sin consultar memory_service.
+Las funciones reciben el cliente Redis (con pool) del servicio que las llama.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_TTL_SEC = int(os.environ.get("ADMADC_PLAN_PROGRESS_TTL_SEC", "604800"))
+
+
+def _total_key(plan_id: str) -> str:
+    return f"admadc:plan:{plan_id}:task_total"
+
+
+def _passed_key(plan_id: str) -> str:
+    return f"admadc:plan:{plan_id}:qa_passed"
+
+
+def plan_progress_client(redis_url: str | None) -> Any | None:
+    """Cliente Redis con pool para un servicio sin otro cliente que compartir."""
+    if not redis_url:
+        return None
+    try:
+        import redis.asyncio as aioredis
+    except ImportError:
+        return None
+    return aioredis.from_url(redis_url, decode_responses=True)
+
+
+async def set_plan_task_total(redis: Any | None, plan_id: str, total: int) -> None:
+    """Registra el número de tareas del plan. Sin redis: no hace nada."""
+    if redis is None or not plan_id or total <= 0:
+        return
+    try:
+        await redis.set(_total_key(plan_id), total, ex=_TTL_SEC)
+    except Exception:
+        logger.exception("set_plan_task_total falló para el plan %s", plan_id[:8])
+
+
+async def mark_task_qa_passed(redis: Any | None, plan_id: str, task_id: str) -> bool | None:
+    """
+    Marca la tarea como aprobada y dice si ya lo están todas las del plan.
+
+    Devuelve None cuando no se puede saber (sin redis, plan sin total registrado
+    o error): el llamante debe comprobar el estado completo en memory_service.
+    Es idempotente por task_id, así que reentregas no inflan la cuenta.
+    """
+    if redis is None or not plan_id or not task_id:
+        return None
+    try:
+        passed_key = _passed_key(plan_id)
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.sadd(passed_key, task_id)
+            pipe.expire(passed_key, _TTL_SEC)
+            pipe.scard(passed_key)
+            pipe.get(_total_key(plan_id))
+            _, _, passed, total = await pipe.execute()
+        if total is None:
+            return None
+        return int(passed) >= int(total)
+    except Exception:
+        logger.exception("mark_task_qa_passed falló para el plan %s", plan_id[:8])
+        return None
@@ -1,7 +1,10 @@
+import asyncio
 import logging
 import time
 from typing import Any
 
+import orjson
+
 from shared.utils.event_consumer import maybe_agent_delay, subscribe_typed_event
 from shared.utils.memory_window import (
     build_short_term_memory_window,
@@ -20,11 +23,33 @@ __all__ = [
     "subscribe_typed_event",
     "publish_and_store",
     "store_event",
+    "store_events",
+    "post_json",
     "infer_framework_hint",
     "guarded_http_get",
 ]
 
 
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
+async def post_json(http_client, path: str, body: Any):
+    # orjson writes bytes straight away and is much cheaper than httpx's json.dumps;
+    # OPT_NON_STR_KEYS keeps json.dumps' tolerance for int keys in event payloads
+    content = orjson.dumps(body, option=orjson.OPT_NON_STR_KEYS)
+    return await http_client.post(path, content=content, headers=_JSON_HEADERS)
+
+
+def _event_body(event) -> dict[str, Any]:
+    return {
+        "event_id": event.event_id,
+        "event_type": event.event_type.value,
+        "producer": event.producer,
+        "idempotency_key": event.idempotency_key,
+        "payload": event.payload,
+    }
+
+
 async def store_event(
     http_client,
     event,
@@ -39,16 +64,7 @@ async def store_event(
     if http_client is None:
         return
     try:
-        await http_client.post(
-            "/events",
-            json={
-                "event_id": event.event_id,
-                "event_type": event.event_type.value,
-                "producer": event.producer,
-                "idempotency_key": event.idempotency_key,
-                "payload": event.payload,
-            },
-        )
+        await post_json(http_client, "/events", _event_body(event))
     except Exception:
         if logger is not None:
             if not error_message:
@@ -58,6 +74,39 @@ async def store_event(
             logger.exception(error_message, short_id)
 
 
+async def store_events(
+    http_client,
+    events: list,
+    logger: logging.Logger | None = None,
+    error_message: str | None = None,
+) -> None:
+    """
+    Persist several events with one `POST /events/bulk` to memory_service.
+
+    Falls back to concurrent `store_event` calls when the memory_service in
+    front of us predates the bulk endpoint (404/405).
+    """
+    if http_client is None or not events:
+        return
+    try:
+        resp = await post_json(
+            http_client, "/events/bulk", [_event_body(e) for e in events]
+        )
+    except Exception:
+        if logger is not None:
+            logger.exception("Failed to store %d events in bulk", len(events))
+        return
+    if resp.status_code in (404, 405):
+        await asyncio.gather(
+            *(
+                store_event(
+                    http_client, e, logger=logger, error_message=error_message
+                )
+                for e in events
+            )
+        )
+
+
 async def publish_and_store(
     event_bus,
     http_client,
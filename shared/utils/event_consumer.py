@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 import os
 from collections.abc import Awaitable, Callable
 from typing import Any, Protocol, TypeVar
 
 from shared.contracts.events import BaseEvent
-from shared.utils.rabbitmq import EventBus, IdempotencyStore
+from shared.utils.rabbitmq import ClaimHeldError, EventBus, IdempotencyStore
+
+logger = logging.getLogger(__name__)
 
 PayloadT = TypeVar("PayloadT")
 
@@ -39,15 +42,45 @@ async def subscribe_typed_event(
     redis_url: str | None = None,
     idempotency_store: IdempotencyStore | None = None,
     max_retries: int = 3,
+    claim_ttl: int | None = None,
 ) -> None:
     """
     Subscribe to one event route and dispatch a validated payload.
+
+    With `claim_ttl`, each event is claimed in the idempotency store before
+    validation, so a concurrent redelivery (another replica, broker requeue)
+    does not run an expensive handler twice. While the claim is held the
+    redelivery is republished (ClaimHeldError) instead of counted as handled:
+    if the holder dies it runs once the claim expires, so `claim_ttl` should
+    only slightly exceed the handler's timeout. The claim is released if the handler fails so retries can run.
     """
     idem_store = idempotency_store or IdempotencyStore(redis_url=redis_url)
 
     async def handler(event: BaseEvent) -> None:
-        payload = payload_model.model_validate(event.payload)
-        await on_payload(payload)
+        if claim_ttl is None:
+            await on_payload(payload_model.model_validate(event.payload))
+            return
+        claim_key = f"{queue_name}:{event.idempotency_key}"
+        if not await idem_store.try_claim(claim_key, claim_ttl):
+            if await idem_store.is_seen(event.idempotency_key):
+                logger.info(
+                    "Skipping event %s already handled on %s", event.event_id[:8], queue_name
+                )
+                return
+            logger.info(
+                "Deferring event %s claimed by another consumer on %s",
+                event.event_id[:8],
+                queue_name,
+            )
+            raise ClaimHeldError(claim_key)
+        try:
+            await on_payload(payload_model.model_validate(event.payload))
+        except BaseException:
+            await idem_store.release_claim(claim_key)
+            raise
+        # Retry deliveries carry a suffixed key; record the event itself as done
+        # so copies deferred behind this claim are dropped instead of rerun
+        await idem_store.mark_seen(event.idempotency_key)
 
     await event_bus.subscribe(
         queue_name=queue_name,
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from shared.utils.rabbitmq import EventBus
+from shared.utils.rabbitmq import EventBus, IdempotencyStore
 
 
 async def connect_event_bus(rabbitmq_url: str) -> EventBus:
@@ -18,10 +18,13 @@ async def shutdown_runtime(
     logger: logging.Logger,
     event_bus: EventBus | None = None,
     http_client: Any = None,
+    idempotency_store: IdempotencyStore | None = None,
 ) -> None:
-    """Close EventBus and HTTP client in standard service shutdown order."""
+    """Close EventBus, idempotency store and HTTP client in standard service shutdown order."""
     logger.info("Shutting down")
     if event_bus:
         await event_bus.close()
+    if idempotency_store:
+        await idempotency_store.close()
     if http_client:
         await http_client.aclose()
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import io
 import os
 from collections import defaultdict
+from collections.abc import Callable
 from typing import Any
 
 from shared.contracts.events import EventType
@@ -89,6 +91,41 @@ def _quality_pattern_rollout(events: list[dict[str, Any]]) -> str:
     return "\n".join(chunks)
 
 
+def _summary_reasoning(payload: dict[str, Any]) -> str:
+    return str(payload.get("reasoning", ""))[:200]
+
+
+def _summary_code_generated(payload: dict[str, Any]) -> str:
+    return f"{payload.get('file_path', '')}"
+
+
+def _summary_spec_generated(payload: dict[str, Any]) -> str:
+    fp = str(payload.get("file_path", "") or "")
+    st = str(payload.get("spec_text", "") or "").strip().split("\n", 1)[0][:140]
+    return f"{fp}" + (f" :: {st}" if st else "")
+
+
+def _summary_task_assigned(payload: dict[str, Any]) -> str:
+    task = payload.get("task")
+    fp = ""
+    if isinstance(task, dict):
+        fp = str(task.get("file_path", "") or "")
+    return fp[:200]
+
+
+# One-line summary per event type shown in the window; other types get none
+_EVENT_SUMMARIES: dict[str, Callable[[dict[str, Any]], str]] = {
+    EventType.PLAN_CREATED.value: _summary_reasoning,
+    EventType.CODE_GENERATED.value: _summary_code_generated,
+    EventType.SPEC_GENERATED.value: _summary_spec_generated,
+    EventType.QA_PASSED.value: _summary_reasoning,
+    EventType.QA_FAILED.value: _summary_reasoning,
+    EventType.SECURITY_APPROVED.value: _summary_reasoning,
+    EventType.SECURITY_BLOCKED.value: _summary_reasoning,
+    EventType.TASK_ASSIGNED.value: _summary_task_assigned,
+}
+
+
 def build_short_term_memory_window(
     events: list[dict[str, Any]],
     limit: int = 15,
@@ -102,11 +139,27 @@ def build_short_term_memory_window(
     if not events:
         return ""
 
+    buf = io.StringIO()
+    used = 0
+
+    def _append(line: str) -> bool:
+        """Write one line within the char budget; False once the window is full."""
+        nonlocal used
+        piece = f"\n{line}" if used else line
+        room = max_chars - used
+        if len(piece) >= room:
+            buf.write(piece[:room])
+            used = max_chars
+            return False
+        buf.write(piece)
+        used += len(piece)
+        return True
+
     rollout = _quality_pattern_rollout(events)
-    lines: list[str] = []
-    if rollout:
-        lines.append("QUALITY PATTERNS (aggregated in this window):")
-        lines.append(rollout)
+    if rollout and not (
+        _append("QUALITY PATTERNS (aggregated in this window):") and _append(rollout)
+    ):
+        return buf.getvalue()
 
     for evt in events[:limit]:
         etype = evt.get("event_type", "")
@@ -114,36 +167,15 @@ def build_short_term_memory_window(
         created_at = evt.get("created_at", "")
         payload = evt.get("payload") or {}
 
-        summary = ""
-        if etype == EventType.PLAN_CREATED.value:
-            summary = str(payload.get("reasoning", ""))[:200]
-        elif etype == EventType.CODE_GENERATED.value:
-            summary = f"{payload.get('file_path', '')}"
-        elif etype == EventType.SPEC_GENERATED.value:
-            fp = str(payload.get("file_path", "") or "")
-            st = str(payload.get("spec_text", "") or "").strip().split("\n", 1)[0][:140]
-            summary = f"{fp}" + (f" :: {st}" if st else "")
-        elif etype in (
-            EventType.QA_PASSED.value,
-            EventType.QA_FAILED.value,
-            EventType.SECURITY_APPROVED.value,
-            EventType.SECURITY_BLOCKED.value,
-        ):
-            summary = str(payload.get("reasoning", ""))[:200]
-        elif etype == EventType.TASK_ASSIGNED.value:
-            task = payload.get("task")
-            fp = ""
-            if isinstance(task, dict):
-                fp = str(task.get("file_path", "") or "")
-            summary = fp[:200]
+        summarize = _EVENT_SUMMARIES.get(etype)
+        summary = summarize(payload) if summarize is not None else ""
 
         line = f"[{etype}] from {producer} at {created_at}"
         if summary:
             line += f" :: {summary}"
-        lines.append(line)
+        # Later events would only be sliced off, so stop formatting them
+        if not _append(line):
+            break
 
-    window = "\n".join(lines)
-    if len(window) > max_chars:
-        window = window[:max_chars]
-    return window
+    return buf.getvalue()
 
@@ -0,0 +1,35 @@
+"""Prompt templates parsed once instead of on every `str.format` call."""
+
+from __future__ import annotations
+
+from string import Formatter
+
+
+class PreparsedTemplate:
+    """
+    A `str.format` template with plain `{name}` fields, split into chunks at import.
+
+    `render(**values)` gives the same text as `template.format(**values)` but only
+    joins the precomputed literal chunks with the values, so large prompts are not
+    rescanned for placeholders per request. Format specs, conversions and
+    attribute/index lookups are rejected up front.
+    """
+
+    __slots__ = ("_chunks", "fields")
+
+    def __init__(self, template: str) -> None:
+        chunks: list[tuple[str, str | None]] = []
+        for literal, field, spec, conversion in Formatter().parse(template):
+            if field is not None and (spec or conversion or not field.isidentifier()):
+                raise ValueError(f"unsupported template field {field!r}")
+            chunks.append((literal, field))
+        self._chunks = tuple(chunks)
+        self.fields = frozenset(f for _, f in chunks if f is not None)
+
+    def render(self, **values: str) -> str:
+        parts: list[str] = []
+        for literal, field in self._chunks:
+            parts.append(literal)
+            if field is not None:
+                parts.append(str(values[field]))
+        return "".join(parts)
@@ -11,11 +11,13 @@ Phase 2 additions:
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import time
 from collections.abc import Awaitable, Callable
+from typing import Any
 
 import aio_pika
+import orjson
 from aio_pika import ExchangeType, Message
 from aio_pika.abc import (
     AbstractChannel,
@@ -41,6 +43,17 @@ CONNECT_INITIAL_BACKOFF = 1.0
 
 DEFAULT_MSG_MAX_RETRIES = 3
 DEFAULT_RETRY_DELAY_BASE = 1.0
+DEFAULT_CLAIM_RETRY_DELAY = 5.0
+
+# In-memory claims are swept of expired entries once the map reaches this size
+_CLAIM_SWEEP_MIN = 1024
+
+
+class ClaimHeldError(Exception):
+    """
+    Another consumer holds the event's claim. Not a success: the delivery is
+    republished without being marked seen, so it still runs if the holder dies.
+    """
 
 
 class IdempotencyStore:
@@ -53,6 +66,8 @@ class IdempotencyStore:
 
     def __init__(self, redis_url: str | None = None, ttl: int = 86400) -> None:
         self._memory: set[str] = set()
+        self._claims: dict[str, float] = {}
+        self._claims_sweep_at = _CLAIM_SWEEP_MIN
         self._redis = None
         self._ttl = ttl
 
@@ -63,6 +78,11 @@ class IdempotencyStore:
             except ImportError:
                 logger.warning("redis package not available; falling back to in-memory idempotency")
 
+    @property
+    def redis(self) -> Any | None:
+        """The store's Redis client (None when in-memory), for callers that share its pool."""
+        return self._redis
+
     async def is_seen(self, key: str) -> bool:
         if self._redis:
             return bool(await self._redis.exists(f"idem:msg:{key}"))
@@ -74,6 +94,37 @@ class IdempotencyStore:
         else:
             self._memory.add(key)
 
+    async def try_claim(self, key: str, ttl: int) -> bool:
+        """
+        Atomically claim `key` for `ttl` seconds (Redis SET NX EX).
+
+        Returns False while another delivery holds the claim, so a redelivered
+        message can bail out before doing expensive work.
+        """
+        if self._redis:
+            return bool(await self._redis.set(f"idem:claim:{key}", "1", nx=True, ex=ttl))
+        now = time.monotonic()
+        expires_at = self._claims.get(key)
+        if expires_at is not None and expires_at > now:
+            return False
+        if len(self._claims) >= self._claims_sweep_at:
+            self._claims = {k: exp for k, exp in self._claims.items() if exp > now}
+            self._claims_sweep_at = max(_CLAIM_SWEEP_MIN, 2 * len(self._claims))
+        self._claims[key] = now + ttl
+        return True
+
+    async def release_claim(self, key: str) -> None:
+        if self._redis:
+            await self._redis.delete(f"idem:claim:{key}")
+        else:
+            self._claims.pop(key, None)
+
+    async def close(self) -> None:
+        """Close the Redis connection pool, if any; the in-memory store has none."""
+        if self._redis:
+            await self._redis.aclose()
+            self._redis = None
+
 
 def consumer_idempotency_key(event: BaseEvent, retry_count: int) -> str:
     """
@@ -149,6 +200,34 @@ class EventBus:
         if not self._exchange:
             raise RuntimeError("EventBus not connected. Call connect() first.")
 
+        routing_key = event.event_type.value
+        await self._exchange.publish(self._message(event), routing_key=routing_key)
+        logger.debug("Published %s [%s]", routing_key, event.event_id[:8])
+
+    async def publish_batch(self, events: list[BaseEvent]) -> None:
+        """
+        Publish several events and wait for all broker confirms together.
+
+        Messages are written to the channel in list order, so consumers see
+        them in that order; only the confirm waits overlap, turning N
+        confirm round-trips into roughly one.
+        """
+        if not self._exchange:
+            raise RuntimeError("EventBus not connected. Call connect() first.")
+        if not events:
+            return
+
+        exchange = self._exchange
+        await asyncio.gather(
+            *(
+                exchange.publish(self._message(event), routing_key=event.event_type.value)
+                for event in events
+            )
+        )
+        logger.debug("Published batch of %d events", len(events))
+
+    @staticmethod
+    def _message(event: BaseEvent) -> Message:
         body = event.model_dump_json().encode()
         base_headers = {
             "idempotency_key": event.idempotency_key,
@@ -164,9 +243,7 @@ class EventBus:
             delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
             headers=headers,
         )
-        routing_key = event.event_type.value
-        await self._exchange.publish(message, routing_key=routing_key)
-        logger.debug("Published %s [%s]", routing_key, event.event_id[:8])
+        return message
 
     async def subscribe(
         self,
@@ -176,6 +253,7 @@ class EventBus:
         idempotency_store: IdempotencyStore | None = None,
         max_retries: int = DEFAULT_MSG_MAX_RETRIES,
         retry_delay_base: float = DEFAULT_RETRY_DELAY_BASE,
+        claim_retry_delay: float = DEFAULT_CLAIM_RETRY_DELAY,
     ) -> None:
         """
         Declare a durable queue + paired DLQ, bind them, and start consuming.
@@ -187,6 +265,8 @@ class EventBus:
             idempotency_store: Deduplication backend (in-memory default).
             max_retries: Max delivery attempts before message goes to DLQ.
             retry_delay_base: Base for exponential backoff (actual = base * 2^n).
+            claim_retry_delay: Seconds a delivery whose handler raised
+                ClaimHeldError waits before being republished (no retry is used up).
         """
         if not self._channel or not self._exchange or not self._dlx_exchange:
             raise RuntimeError("EventBus not connected. Call connect() first.")
@@ -246,7 +326,7 @@ class EventBus:
                 retry_count = 0
             try:
                 async with message.process(requeue=False, ignore_processed=True):
-                    data = json.loads(message.body.decode())
+                    data = orjson.loads(message.body)
                     event = BaseEvent.model_validate(data)
                     effective_key = consumer_idempotency_key(event, retry_count)
                     if await idempotency_store.is_seen(effective_key):
@@ -262,6 +342,13 @@ class EventBus:
                     )
                     try:
                         await handler(event)
+                    except ClaimHeldError:
+                        # Not seen and no retry used up: a copy goes to the back of
+                        # the queue before this one is acked, so if the holder dies
+                        # the event still runs once its claim expires
+                        await asyncio.sleep(claim_retry_delay)
+                        await _republish_for_retry(message, retry_count)
+                        return
                     finally:
                         reset_correlation_tokens(corr_tokens)
                     await idempotency_store.mark_seen(effective_key)
@@ -0,0 +1,61 @@
+"""Small in-process cache bounded by entry count and age."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    String-keyed cache that keeps at most `maxsize` entries younger than `ttl` seconds.
+
+    Entries are kept in write order, so overflow and expiry are both swept from the
+    head on every write; reads drop an expired entry lazily.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = max(1, maxsize)
+        self.ttl = ttl
+        self._clock = clock
+        self._data: OrderedDict[str, tuple[V, float]] = OrderedDict()
+
+    def __setitem__(self, key: str, value: V) -> None:
+        now = self._clock()
+        self._data[key] = (value, now)
+        self._data.move_to_end(key)
+        while self._data:
+            written_at = next(iter(self._data.values()))[1]
+            if len(self._data) <= self.maxsize and now - written_at < self.ttl:
+                break
+            self._data.popitem(last=False)
+
+    def _live(self, key: str) -> tuple[V, float] | None:
+        entry = self._data.get(key)
+        if entry is not None and self._clock() - entry[1] >= self.ttl:
+            del self._data[key]
+            return None
+        return entry
+
+    def get(self, key: str, default: V | None = None) -> V | None:
+        entry = self._live(key)
+        return default if entry is None else entry[0]
+
+    def pop(self, key: str, default: V | None = None) -> V | None:
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[0]
+
+    def __contains__(self, key: str) -> bool:
+        return self._live(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -80,3 +80,13 @@ def test_run_sync_hardened_missing_cmd() -> None:
     )
     assert r.returncode == -1
     assert "agent_subprocess" in r.stderr or r.stderr
+
+
+def test_run_sync_hardened_feeds_stdin() -> None:
+    r = run_sync_hardened(
+        [sys.executable, "-c", "import sys; print(sys.stdin.read().upper())"],
+        timeout_s=10.0,
+        stdin="código",
+    )
+    assert r.returncode == 0
+    assert r.stdout.strip() == "CÓDIGO"
@@ -1,8 +1,23 @@
 """Claves de deduplicación del consumidor RabbitMQ."""
 from __future__ import annotations
 
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import Any
+
+import orjson
+import pytest
+
 from shared.contracts.events import BaseEvent, EventType
-from shared.utils.rabbitmq import consumer_idempotency_key
+from shared.utils import rabbitmq
+from shared.utils.event_consumer import subscribe_typed_event
+from shared.utils.rabbitmq import (
+    ClaimHeldError,
+    EventBus,
+    IdempotencyStore,
+    consumer_idempotency_key,
+)
 
 
 def _evt(key: str) -> BaseEvent:
@@ -24,3 +39,185 @@ def test_key_retry() -> None:
     e = _evt("abc")
     assert consumer_idempotency_key(e, 1) == "abc:retry:1"
     assert consumer_idempotency_key(e, 2) == "abc:retry:2"
+
+
+def test_claim_is_exclusive_until_released() -> None:
+    store = IdempotencyStore()
+
+    async def _run() -> list[bool]:
+        first = await store.try_claim("k", ttl=60)
+        second = await store.try_claim("k", ttl=60)
+        await store.release_claim("k")
+        third = await store.try_claim("k", ttl=60)
+        return [first, second, third]
+
+    assert asyncio.run(_run()) == [True, False, True]
+
+
+class _CapturingBus:
+    async def subscribe(self, *, handler, **_kwargs) -> None:
+        self.handler = handler
+
+
+def test_subscribe_claims_before_handling_and_releases_on_failure() -> None:
+    bus = _CapturingBus()
+    calls: list[dict] = []
+
+    async def on_payload(payload: dict) -> None:
+        calls.append(payload)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+
+    class _Model:
+        @classmethod
+        def model_validate(cls, value):
+            return value
+
+    async def _run() -> None:
+        await subscribe_typed_event(
+            event_bus=bus,  # type: ignore[arg-type]
+            queue_name="q",
+            routing_keys=["x"],
+            payload_model=_Model,
+            on_payload=on_payload,
+            claim_ttl=60,
+        )
+        with pytest.raises(RuntimeError):
+            await bus.handler(_evt("abc"))
+        await bus.handler(_evt("abc"))
+        await bus.handler(_evt("abc"))
+
+    asyncio.run(_run())
+    # failed attempt released the claim; the retry ran; the duplicate was skipped
+    assert calls == [{"x": 1}, {"x": 1}]
+
+
+def test_close_releases_redis_pool_once() -> None:
+    closed: list[bool] = []
+
+    class _Redis:
+        async def aclose(self) -> None:
+            closed.append(True)
+
+    store = IdempotencyStore()
+    store._redis = _Redis()
+
+    async def _run() -> None:
+        await store.close()
+        await store.close()
+
+    asyncio.run(_run())
+    assert closed == [True]
+
+
+class _Model:
+    @classmethod
+    def model_validate(cls, value: Any) -> Any:
+        return value
+
+
+def test_redelivery_runs_after_dead_holders_claim_expires(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    clock = [0.0]
+    monkeypatch.setattr(rabbitmq, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    bus, store = _CapturingBus(), IdempotencyStore()
+    calls: list[Any] = []
+
+    async def on_payload(payload: Any) -> None:
+        calls.append(payload)
+
+    async def _run() -> None:
+        await subscribe_typed_event(
+            event_bus=bus,  # type: ignore[arg-type]
+            queue_name="q",
+            routing_keys=["x"],
+            payload_model=_Model,
+            on_payload=on_payload,
+            idempotency_store=store,
+            claim_ttl=60,
+        )
+        # A consumer claimed the event and was killed before finishing
+        assert await store.try_claim("q:abc", ttl=60)
+        with pytest.raises(ClaimHeldError):
+            await bus.handler(_evt("abc"))
+        assert not await store.is_seen("abc")
+        clock[0] = 61.0
+        await bus.handler(_evt("abc"))
+
+    asyncio.run(_run())
+    assert calls == [{"x": 1}]
+
+
+def test_memory_claims_are_swept_once_expired(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = [0.0]
+    monkeypatch.setattr(rabbitmq, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    store = IdempotencyStore()
+
+    async def _run() -> None:
+        for i in range(5000):
+            clock[0] = float(i)
+            assert await store.try_claim(f"k{i}", ttl=10)
+
+    asyncio.run(_run())
+    assert len(store._claims) < 2 * rabbitmq._CLAIM_SWEEP_MIN
+
+
+class _FakeMessage:
+    def __init__(self, event: BaseEvent) -> None:
+        self.body = orjson.dumps(event.model_dump(mode="json"))
+        self.headers: dict[str, Any] = {}
+        self.message_id = event.event_id
+        self.content_type = "application/json"
+        self.routing_key = "x"
+        self.acked = False
+
+    @asynccontextmanager
+    async def process(self, **_: Any) -> Any:
+        yield
+        self.acked = True
+
+
+class _FakeQueue:
+    async def bind(self, *_: Any, **__: Any) -> None:
+        return None
+
+    async def consume(self, callback: Any) -> None:
+        self.callback = callback
+
+
+class _FakeChannel:
+    def __init__(self) -> None:
+        self.queue = _FakeQueue()
+
+    async def declare_queue(self, *_: Any, **__: Any) -> _FakeQueue:
+        return self.queue
+
+
+class _FakeExchange:
+    def __init__(self) -> None:
+        self.published: list[Any] = []
+
+    async def publish(self, message: Any, routing_key: str) -> None:
+        self.published.append(message)
+
+
+def test_bus_republishes_claim_held_delivery_without_marking_seen() -> None:
+    bus = EventBus("amqp://unused")
+    channel, exchange = _FakeChannel(), _FakeExchange()
+    bus._channel, bus._exchange, bus._dlx_exchange = channel, exchange, _FakeExchange()  # type: ignore[assignment]
+    store = IdempotencyStore()
+    event = _evt("abc")
+    message = _FakeMessage(event)
+
+    async def handler(_: BaseEvent) -> None:
+        raise ClaimHeldError("q:abc")
+
+    async def _run() -> None:
+        await bus.subscribe("q", ["x"], handler, idempotency_store=store, claim_retry_delay=0)
+        await channel.queue.callback(message)
+        assert not await store.is_seen("abc")
+
+    asyncio.run(_run())
+    assert message.acked
+    assert [m.headers["x-retry-count"] for m in exchange.published] == [0]
@@ -0,0 +1,45 @@
+"""EventBus.publish_batch: orden, routing keys y bus no conectado."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from shared.contracts.events import BaseEvent, EventType
+from shared.utils.rabbitmq import EventBus
+
+
+class _FakeExchange:
+    def __init__(self) -> None:
+        self.published: list[tuple[str, str | None]] = []
+
+    async def publish(self, message, routing_key: str) -> None:
+        self.published.append((routing_key, message.message_id))
+        await asyncio.sleep(0)
+
+
+def _evt(event_type: EventType) -> BaseEvent:
+    return BaseEvent(event_type=event_type, producer="t", payload={"plan_id": "p"})
+
+
+def test_publish_batch_keeps_order_and_routing_keys() -> None:
+    bus = EventBus("amqp://unused")
+    exchange = _FakeExchange()
+    bus._exchange = exchange  # type: ignore[assignment]
+    events = [
+        _evt(EventType.PLAN_CREATED),
+        _evt(EventType.TASK_ASSIGNED),
+        _evt(EventType.TASK_ASSIGNED),
+    ]
+
+    asyncio.run(bus.publish_batch(events))
+
+    assert exchange.published == [
+        (e.event_type.value, e.event_id) for e in events
+    ]
+
+
+def test_publish_batch_requires_connection() -> None:
+    bus = EventBus("amqp://unused")
+    with pytest.raises(RuntimeError):
+        asyncio.run(bus.publish_batch([_evt(EventType.PLAN_CREATED)]))
@@ -0,0 +1,20 @@
+"""Tests de parsing REASONING/CODE de la salida LLM del dev_service."""
+
+from __future__ import annotations
+
+from services.dev_service.generator import _parse_response
+
+
+def test_fenced_code_block() -> None:
+    res = _parse_response("REASONING: r\nCODE:\n```python\nprint(1)\n```")
+    assert res.reasoning == "r"
+    assert res.code == "print(1)"
+
+
+def test_fence_line_without_body() -> None:
+    assert _parse_response("```python").code == ""
+
+
+def test_reasoning_only_and_plain_code() -> None:
+    assert _parse_response("REASONING: only").code == ""
+    assert _parse_response("plain code").code == "plain code"
@@ -51,3 +51,17 @@ def test_create_async_http_client_fallback_default(monkeypatch: pytest.MonkeyPat
             expected=12.5,
         )
     )
+
+
+def test_create_async_http_client_connect_timeout_and_http2() -> None:
+    async def _run() -> None:
+        async with create_async_http_client(
+            default_timeout=10.0,
+            connect_timeout=2.0,
+            http2=True,
+            inject_correlation_headers=False,
+        ) as client:
+            assert client.timeout.connect == pytest.approx(2.0)
+            assert client.timeout.read == pytest.approx(10.0)
+
+    asyncio.run(_run())
@@ -15,6 +15,7 @@ from services.gateway_service.plan_aggregate import (
     _build_plan_detail_json,
     _compute_pipeline_health,
     _count_replans_for_plan,
+    _safe_fetch_plan_overview,
     aggregate_plan_metrics,
 )
 from services.gateway_service.runtime import GatewayRuntime
@@ -278,3 +279,41 @@ def test_aggregate_plan_metrics_returns_502_when_token_fetch_fails() -> None:
     out = asyncio.run(aggregate_plan_metrics(rt, "any-plan-id"))
     assert isinstance(out, JSONResponse)
     assert out.status_code == 502
+
+
+class _FakeOverviewClient:
+    __slots__ = ("_resp", "urls")
+
+    def __init__(self, resp: _FakeResp) -> None:
+        self._resp = resp
+        self.urls: list[str] = []
+
+    async def get(self, url: str, params: dict[str, Any] | None = None) -> _FakeResp:
+        self.urls.append(url)
+        return self._resp
+
+
+def test_safe_fetch_plan_overview_splits_tasks_and_events() -> None:
+    client = _FakeOverviewClient(
+        _FakeResp(200, {"plan_id": "p1", "tasks": [{"task_id": "t1"}], "events": [{"event_type": "x"}]})
+    )
+    rt = GatewayRuntime(
+        event_bus=MagicMock(),
+        http_client=client,  # type: ignore[arg-type]
+        cfg=_gateway_cfg(),
+        manager=MagicMock(),
+    )
+    tasks, events = asyncio.run(_safe_fetch_plan_overview(rt, "p1"))
+    assert client.urls == ["http://memory.test/plan/p1/overview"]
+    assert tasks == [{"task_id": "t1"}]
+    assert events == [{"event_type": "x"}]
+
+
+def test_safe_fetch_plan_overview_empty_on_error_status() -> None:
+    rt = GatewayRuntime(
+        event_bus=MagicMock(),
+        http_client=_FakeOverviewClient(_FakeResp(503, {"error": "db down"})),  # type: ignore[arg-type]
+        cfg=_gateway_cfg(),
+        manager=MagicMock(),
+    )
+    assert asyncio.run(_safe_fetch_plan_overview(rt, "p1")) == ([], [])
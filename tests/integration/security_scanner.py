@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
+import time
+
 import pytest
 
+from services.security_service import scanner
 from services.security_service.config import SecurityConfig
 from services.security_service.scanner import scan_files
 
 pytestmark = [pytest.mark.integration]
 
 
-def _cfg_no_subprocess() -> SecurityConfig:
+def _cfg_no_subprocess(enable_bandit: bool = False) -> SecurityConfig:
     return SecurityConfig(
         rabbitmq_url="amqp://unused",
         memory_service_url="http://unused",
@@ -19,7 +22,7 @@ def _cfg_no_subprocess() -> SecurityConfig:
         agent_name="test",
         agent_goal="test",
         strategy="test",
-        enable_bandit=False,
+        enable_bandit=enable_bandit,
         enable_semgrep=False,
     )
 
@@ -73,3 +76,23 @@ def test_scan_passes_safe_stub_code() -> None:
     r = scan_files(files, cfg)
     assert r.approved is True
     assert r.violations == []
+
+
+def test_scan_runs_external_checks_concurrently_in_file_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def slow_bandit(file_path: str, code: str) -> list[str]:
+        time.sleep(0.2)
+        return [f"[{file_path}] bandit"]
+
+    monkeypatch.setattr(scanner, "_run_bandit_security_checks", slow_bandit)
+    files = [
+        {"file_path": f"m{i}.py", "code": "x = 1\n", "language": "python", "reasoning": ""}
+        for i in range(4)
+    ]
+    files.insert(2, {"file_path": "empty.py", "code": "", "language": "python"})
+    start = time.perf_counter()
+    r = scan_files(files, _cfg_no_subprocess(enable_bandit=True))
+    assert time.perf_counter() - start < 0.6
+    assert r.files_scanned == 4
+    assert r.violations == [f"[m{i}.py] bandit" for i in range(4)]
@@ -0,0 +1,229 @@
+"""MemoryStore: helpers puros de payload, hash de eventos, vectores y caché de embeddings."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import math
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+from services.memory_service.database import _EVENT_ID_HASH_SQL, event_id_hash
+from services.memory_service.main import app
+from services.memory_service.store import (
+    _PAYLOAD_READERS,
+    _ZSTD_MAGIC,
+    EMBEDDING_DIM,
+    MemoryStore,
+    _decode_payload,
+    _encode_payload,
+)
+
+
+class _FakePipeline:
+    def __init__(self, redis: _FakeRedis) -> None:
+        self._redis = redis
+
+    async def __aenter__(self) -> _FakePipeline:
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        return None
+
+    def set(self, key: str, value: bytes, ex: int) -> None:
+        self._redis.data[key] = value
+
+    async def execute(self) -> None:
+        return None
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+
+    async def mget(self, keys: list[str]) -> list[bytes | None]:
+        return [self.data.get(k) for k in keys]
+
+    def pipeline(self, transaction: bool) -> _FakePipeline:
+        return _FakePipeline(self)
+
+
+class _FailingEmbeddings:
+    async def create(self, **_: Any) -> Any:
+        raise RuntimeError("embeddings API down")
+
+
+class _FailingClient:
+    embeddings = _FailingEmbeddings()
+
+
+class _Embeddings:
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    async def create(self, input: list[str], **_: Any) -> Any:
+        self.calls.append(input)
+        data = [
+            SimpleNamespace(index=i, embedding=[1.0] + [0.0] * (EMBEDDING_DIM - 1))
+            for i in range(len(input))
+        ]
+        return SimpleNamespace(data=data)
+
+
+class _Client:
+    def __init__(self) -> None:
+        self.embeddings = _Embeddings()
+
+
+def _store(redis: _FakeRedis, client: Any) -> MemoryStore:
+    store = MemoryStore.__new__(MemoryStore)
+    store._redis = redis
+    store._embed_client = client
+    store._embed_model = "test-embed"
+    store._embed_cache_prefix = "emb:test:"
+    store._embed_pending = []
+    store._embed_timer = None
+    store._embed_batches = set()
+    return store
+
+
+_PAYLOAD = {"task_id": "t1", "issues": ["línea larga"] * 20, "passed": False}
+
+
+def test_payload_is_stored_as_zstd_and_round_trips() -> None:
+    stored = _encode_payload(_PAYLOAD)
+    assert stored[:4] == _ZSTD_MAGIC
+    assert len(stored) < len(orjson.dumps(_PAYLOAD))
+    assert _decode_payload(stored) == _PAYLOAD
+
+
+def test_payload_raw_json_is_stored_verbatim() -> None:
+    raw = b'{"b":1,"a":2}'
+    assert _PAYLOAD_READERS["text"](_encode_payload({"ignored": True}, raw)) == raw.decode()
+
+
+def test_legacy_plain_json_rows_still_decode() -> None:
+    legacy = orjson.dumps(_PAYLOAD)
+    assert _decode_payload(legacy) == _PAYLOAD
+    assert _PAYLOAD_READERS["text"](legacy) == legacy.decode("utf-8")
+
+
+@pytest.mark.parametrize("stored", [_encode_payload(_PAYLOAD), orjson.dumps(_PAYLOAD)])
+def test_payload_readers_agree(stored: bytes) -> None:
+    assert _PAYLOAD_READERS["dict"](stored) == _PAYLOAD
+    assert orjson.loads(_PAYLOAD_READERS["text"](stored)) == _PAYLOAD
+    wrapped = orjson.dumps({"payload": _PAYLOAD_READERS["fragment"](stored)})
+    assert orjson.loads(wrapped) == {"payload": _PAYLOAD}
+
+
+def _sql_event_id_hash(event_id: str) -> int:
+    """Python model of `_EVENT_ID_HASH_SQL`: 16 hex chars -> bit(64) -> signed bigint."""
+    hex16 = hashlib.md5(event_id.encode("utf-8")).hexdigest()[:16]
+    value = int(hex16, 16)
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def test_event_id_hash_matches_sql_backfill() -> None:
+    assert "substr(md5(event_id), 1, 16))::bit(64)::bigint" in _EVENT_ID_HASH_SQL
+    ids = ["", "evt-1", "ñandú", *(f"{i:064x}" for i in range(200))]
+    hashes = [event_id_hash(i) for i in ids]
+    assert hashes == [_sql_event_id_hash(i) for i in ids]
+    assert any(h < 0 for h in hashes) and any(h > 0 for h in hashes)
+    assert all(-(1 << 63) <= h < 1 << 63 for h in hashes)
+
+
+def test_resize_vector_downsamples_upsamples_and_pads() -> None:
+    vec = [float(i) for i in range(10)]
+    assert MemoryStore._resize_vector(vec, 4) == [vec[int(i * 10 / 4)] for i in range(4)]
+    assert MemoryStore._resize_vector([1.0, 2.0, 3.0], 7) == [1.0, 2.0, 3.0, 1.0, 2.0, 3.0, 1.0]
+    assert MemoryStore._resize_vector(vec, 10) is vec
+    assert MemoryStore._resize_vector([], 3) == [0.0, 0.0, 0.0]
+
+
+def _point(pid: str, score: float, **payload: Any) -> Any:
+    return SimpleNamespace(id=pid, score=score, payload=payload)
+
+
+def test_rank_points_matches_scalar_heuristic() -> None:
+    now = time.time()
+    points = [
+        _point("plain", 0.80),
+        _point("important", 0.70, importance=1.0, impact=0.5),
+        _point("recent", 0.75, created_at_epoch=now, access_count=20),
+        _point("tie", 0.80),
+    ]
+    ranked = _store(_FakeRedis(), None)._rank_points(points)
+
+    def scalar(score: float, p: dict[str, Any]) -> float:
+        # Per-point formula the vectorized ranking replaced
+        recency = 0.0
+        if "created_at_epoch" in p:
+            recency = 1.0 / (1.0 + max(now - p["created_at_epoch"], 0.0) / 3600.0)
+        freq = min(1.0, math.log1p(p.get("access_count", 0)) / 3.0)
+        boost = 1.0 + 0.4 * p.get("importance", 0.5) + 0.3 * p.get("impact", 0.0)
+        return score * boost + 0.2 * recency + 0.1 * freq
+
+    assert [r["id"] for r in ranked] == ["recent", "important", "plain", "tie"]
+    by_id = {point.id: point for point in points}
+    for r in ranked:
+        point = by_id[r["id"]]
+        assert r["heuristic_score"] == pytest.approx(scalar(point.score, point.payload))
+    assert _store(_FakeRedis(), None)._rank_points([]) == []
+
+
+def test_concurrent_embed_calls_share_one_api_request() -> None:
+    client = _Client()
+    store = _store(_FakeRedis(), client)
+
+    async def _run() -> list[list[float]]:
+        return list(await asyncio.gather(*(store._embed_text(f"t{i}") for i in range(5))))
+
+    vectors = asyncio.run(_run())
+    assert client.embeddings.calls == [[f"t{i}" for i in range(5)]]
+    assert len(vectors) == 5 and all(len(v) == EMBEDDING_DIM for v in vectors)
+
+
+def test_hash_fallback_vectors_are_not_cached() -> None:
+    redis = _FakeRedis()
+    store = _store(redis, _FailingClient())
+    vectors = asyncio.run(store._embed_texts(["fix login", "add tests"]))
+    assert vectors == [
+        MemoryStore._hash_to_vector("fix login", EMBEDDING_DIM),
+        MemoryStore._hash_to_vector("add tests", EMBEDDING_DIM),
+    ]
+    assert redis.data == {}
+
+
+def test_api_vectors_are_cached_and_reused() -> None:
+    redis = _FakeRedis()
+    first = asyncio.run(_store(redis, _Client())._embed_texts(["fix login"]))
+    assert len(redis.data) == 1
+    again = asyncio.run(_store(redis, _FailingClient())._embed_texts(["fix login"]))
+    assert again == first
+
+
+@pytest.mark.parametrize(("batch_size", "parallel"), [(0, 4), (-5, 4), (256, 0)])
+def test_bulk_reindex_rejects_bad_sizes_before_pausing_indexing(
+    batch_size: int, parallel: int
+) -> None:
+    paused: list[Any] = []
+
+    class _Qdrant:
+        async def update_collection(self, **kwargs: Any) -> None:
+            paused.append(kwargs)
+
+    store = _store(_FakeRedis(), None)
+    store._qdrant = _Qdrant()  # type: ignore[assignment]
+    with pytest.raises(ValueError):
+        asyncio.run(store.bulk_reindex_events(batch_size=batch_size, parallel=parallel))
+    assert paused == []
+
+
+@pytest.mark.parametrize("query", ["batch_size=0", "batch_size=-3", "parallel=0", "parallel=100"])
+def test_reindex_endpoint_rejects_out_of_range_params(query: str) -> None:
+    # Without the lifespan no store exists: a 422 proves validation ran first
+    assert TestClient(app).post(f"/semantic/reindex?{query}").status_code == 422
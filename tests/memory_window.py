@@ -111,3 +111,18 @@ def test_window_truncated_to_max_chars() -> None:
     ]
     out = build_short_term_memory_window(events, limit=50, max_chars=120)
     assert len(out) <= 120
+
+
+def test_window_truncated_to_max_chars_like_a_slice() -> None:
+    events = [
+        {
+            "event_type": EventType.CODE_GENERATED.value,
+            "producer": "dev",
+            "created_at": f"t{i}",
+            "payload": {"file_path": f"pkg/mod_{i}.py"},
+        }
+        for i in range(50)
+    ]
+    full = build_short_term_memory_window(events, limit=50, max_chars=100_000)
+    cut = build_short_term_memory_window(events, limit=50, max_chars=120)
+    assert cut == full[:120]
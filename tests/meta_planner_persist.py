@@ -0,0 +1,68 @@
+"""Meta Planner: tokens_used se encola con plan.created/task.assigned, sin POST en la petición."""
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from services.meta_planner import main
+from services.meta_planner.planner import PlanResult
+from shared.contracts.events import BaseEvent, TaskSpec
+
+
+class _FailOnPostClient:
+    async def post(self, *_: Any, **__: Any) -> Any:
+        raise AssertionError("memory_service must not be called on the request path")
+
+
+class _FakeBus:
+    def __init__(self) -> None:
+        self.published: list[BaseEvent] = []
+
+    async def publish_batch(self, events: list[BaseEvent]) -> None:
+        self.published.extend(events)
+
+
+def _run(monkeypatch: pytest.MonkeyPatch, tokens: tuple[int, int]) -> list[BaseEvent]:
+    tasks = [TaskSpec(description="a", file_path="svc/a.py")]
+
+    async def fake_decompose(*_: Any, **__: Any) -> tuple[PlanResult, int, int]:
+        return PlanResult(tasks=tasks, reasoning="r"), *tokens
+
+    async def no_memory(prompt: str) -> str:
+        return ""
+
+    monkeypatch.setattr(
+        main, "cfg", SimpleNamespace(enable_tool_loop=False, redis_url=None)
+    )
+    monkeypatch.setattr(main, "_get_llm", lambda: None)
+    monkeypatch.setattr(main, "decompose_tasks", fake_decompose)
+    monkeypatch.setattr(main, "_fetch_memory_context", no_memory)
+    monkeypatch.setattr(main, "http_client", _FailOnPostClient())
+    monkeypatch.setattr(main, "event_bus", _FakeBus())
+    monkeypatch.setattr(main, "plan_progress_redis", None)
+
+    async def _go() -> list[BaseEvent]:
+        queue: asyncio.Queue[list[BaseEvent]] = asyncio.Queue()
+        monkeypatch.setattr(main, "_persist_queue", queue)
+        await main._execute_plan("build it", "proj", "")
+        assert queue.qsize() == 1
+        return queue.get_nowait()
+
+    return asyncio.run(_go())
+
+
+def test_token_usage_queued_with_plan_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+    batch = _run(monkeypatch, (120, 30))
+    assert [e.event_type.value for e in batch] == [
+        "metrics.tokens_used",
+        "plan.created",
+        "task.assigned",
+    ]
+
+
+def test_no_token_event_without_usage(monkeypatch: pytest.MonkeyPatch) -> None:
+    batch = _run(monkeypatch, (0, 0))
+    assert [e.event_type.value for e in batch] == ["plan.created", "task.assigned"]
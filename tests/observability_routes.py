@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from shared.observability import metrics
 from shared.observability.routing import register_health_metrics_routes
 
 
@@ -21,3 +23,20 @@ def test_register_health_metrics_exposes_ok_and_metrics() -> None:
         m = client.get("/metrics")
         assert m.status_code == 200
         assert "text/plain" in (m.headers.get("content-type") or "").lower()
+
+
+def test_metrics_body_reused_within_cache_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[int] = []
+
+    def _generate() -> bytes:
+        calls.append(1)
+        return f"scrape {len(calls)}\n".encode()
+
+    monkeypatch.setattr(metrics, "generate_latest", _generate)
+    monkeypatch.setattr(metrics, "_metrics_cache", (float("-inf"), b""))
+    monkeypatch.setattr(metrics, "_METRICS_CACHE_TTL_SEC", 60.0)
+    assert metrics.metrics_response().body == b"scrape 1\n"
+    assert metrics.metrics_response().body == b"scrape 1\n"
+
+    monkeypatch.setattr(metrics, "_METRICS_CACHE_TTL_SEC", 0.0)
+    assert metrics.metrics_response().body == b"scrape 2\n"
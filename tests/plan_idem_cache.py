@@ -0,0 +1,35 @@
+"""Caché de idempotencia de POST /plan en meta_planner: tope LRU y barrido por TTL."""
+from __future__ import annotations
+
+import pytest
+
+import services.meta_planner.main as planner_main
+
+_NS = 1_000_000_000
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(planner_main, "_IDEM_CACHE_MAX", 3)
+    monkeypatch.setattr(planner_main, "_IDEM_TTL_NS", 30 * _NS)
+    planner_main._plan_idem_cache.clear()
+    yield
+    planner_main._plan_idem_cache.clear()
+
+
+def _remember(key: bytes, now: int) -> None:
+    planner_main._remember_plan(key, f"plan-{key.decode()}", b"{}", now)
+
+
+def test_cache_capped_evicts_least_recently_used() -> None:
+    for i, key in enumerate((b"a", b"b", b"c")):
+        _remember(key, i * _NS)
+    planner_main._plan_idem_cache.move_to_end(b"a")
+    _remember(b"d", 3 * _NS)
+    assert list(planner_main._plan_idem_cache) == [b"c", b"a", b"d"]
+
+
+def test_expired_entries_swept_on_insert() -> None:
+    _remember(b"old", 0)
+    _remember(b"new", 31 * _NS)
+    assert list(planner_main._plan_idem_cache) == [b"new"]
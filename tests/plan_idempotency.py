@@ -101,3 +101,9 @@ def test_mode_ahorro_normalized_like_save_meta() -> None:
         }
     )
     assert a == b
+
+
+def test_keys_are_raw_128_bit_digests() -> None:
+    body = {"prompt": "x", "project_name": "p"}
+    assert isinstance(plan_idempotency_key_meta_planner(body), bytes)
+    assert len(plan_idempotency_key_gateway(body)) == 16
@@ -0,0 +1,68 @@
+"""Contador Redis de tareas aprobadas por plan (sin servidor: Redis simulado)."""
+from __future__ import annotations
+
+import asyncio
+
+from shared.plan_progress import mark_task_qa_passed, set_plan_task_total
+
+
+class _FakePipeline:
+    def __init__(self, redis: _FakeRedis) -> None:
+        self._redis = redis
+        self._ops: list[tuple[str, tuple]] = []
+
+    async def __aenter__(self) -> _FakePipeline:
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    def __getattr__(self, name: str):
+        return lambda *args, **_kw: self._ops.append((name, args))
+
+    async def execute(self) -> list:
+        return [await getattr(self._redis, name)(*args) for name, args in self._ops]
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.sets: dict[str, set[str]] = {}
+
+    async def set(self, key: str, value, ex: int | None = None) -> None:
+        self.values[key] = str(value)
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def sadd(self, key: str, member: str) -> int:
+        self.sets.setdefault(key, set()).add(member)
+        return 1
+
+    async def scard(self, key: str) -> int:
+        return len(self.sets.get(key, set()))
+
+    async def expire(self, key: str, ttl: int) -> None:
+        return None
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+
+def test_ready_only_when_every_task_passed_once() -> None:
+    redis = _FakeRedis()
+
+    async def _run() -> list[bool | None]:
+        await set_plan_task_total(redis, "plan", 2)
+        return [
+            await mark_task_qa_passed(redis, "plan", "t1"),
+            await mark_task_qa_passed(redis, "plan", "t1"),
+            await mark_task_qa_passed(redis, "plan", "t2"),
+        ]
+
+    assert asyncio.run(_run()) == [False, False, True]
+
+
+def test_unknown_without_total_or_redis() -> None:
+    assert asyncio.run(mark_task_qa_passed(_FakeRedis(), "other", "t1")) is None
+    assert asyncio.run(mark_task_qa_passed(None, "plan", "t1")) is None
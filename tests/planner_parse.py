@@ -112,3 +112,16 @@ def test_task_defaults(missing_key: str, expected_default: str) -> None:
         assert t0.file_path == expected_default
     else:
         assert t0.language == expected_default
+
+
+def test_fence_without_language_and_trailing_text() -> None:
+    raw = 'REASONING: Plain fence.\nTASKS:\n```\n[{"description": "y", "file_path": "b.py"}]\n```\n\n'
+    r, tasks, ok = _parse(raw)
+    assert r == "Plain fence." and ok
+    assert [t.file_path for t in tasks] == ["b.py"]
+
+
+def test_empty_tasks_section_falls_back() -> None:
+    r, tasks, ok = _parse("REASONING: nothing after marker TASKS:")
+    assert r == "nothing after marker" and not ok
+    assert tasks[0].file_path == "src/main.py"
@@ -0,0 +1,31 @@
+"""Prompt de planificación precompilado: mismo texto que PLANNING_PROMPT_TEMPLATE.format."""
+from __future__ import annotations
+
+import asyncio
+
+from services.meta_planner import planner
+from shared.llm_adapter import LLMResponse
+from shared.prompt_locale import natural_language_rules_for_locale
+
+
+class _CapturingLLM:
+    def __init__(self) -> None:
+        self.prompts: list[str] = []
+
+    async def generate_text(self, prompt: str) -> LLMResponse:
+        self.prompts.append(prompt)
+        return LLMResponse(
+            content='REASONING: r\nTASKS: [{"description": "d", "file_path": "a.py"}]', model="m"
+        )
+
+
+def test_planning_prompt_matches_format() -> None:
+    llm = _CapturingLLM()
+    asyncio.run(planner.decompose_tasks(llm, "Add {braces} API", "  past runs  ", "es"))  # type: ignore[arg-type]
+    assert llm.prompts == [
+        planner.PLANNING_PROMPT_TEMPLATE.format(
+            prompt="Add {braces} API",
+            memory_context="past runs",
+            response_language_rules=natural_language_rules_for_locale("es"),
+        )
+    ]
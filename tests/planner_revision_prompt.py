@@ -0,0 +1,40 @@
+"""Prompt aumentado del meta_planner al replanificar (plan.revision_confirmed)."""
+
+from __future__ import annotations
+
+from services.meta_planner.main import _build_revision_prompt
+from shared.contracts.events import PlanRevisionPayload
+
+
+def test_revision_prompt_golden() -> None:
+    payload = PlanRevisionPayload(
+        original_plan_id="abcdefgh-1234",
+        new_plan_id="n",
+        reason="QA kept failing",
+        suggestions=["split module", "add tests"],
+        severity="high",
+        target_group_ids=["api"],
+    )
+    assert _build_revision_prompt(" Build API \n", "old reasoning", payload) == (
+        "Build API\n"
+        "\n"
+        "---\n"
+        "A replanning agent analysed the previous execution of plan abcdefgh "
+        "and suggested revising the plan.\n"
+        "Severity: high\n"
+        "Scope limitation:\n"
+        "Only replan the following modules/groups; keep the rest of the project "
+        "and tasks unchanged as much as possible:\n"
+        "- api\n"
+        "Replanner reason: QA kept failing\n"
+        "Original planner reasoning (for context, may be outdated): old reasoning\n"
+        "\n"
+        "Replanner suggestions:\n"
+        "- split module\n"
+        "- add tests"
+    )
+
+
+def test_revision_prompt_minimal() -> None:
+    payload = PlanRevisionPayload(original_plan_id="p" * 12, new_plan_id="n", severity="")
+    assert _build_revision_prompt("x", "", payload).endswith("Severity: medium")
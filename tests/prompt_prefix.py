@@ -0,0 +1,21 @@
+"""Prompts QA/replanner: instrucciones estáticas antes de cualquier campo dinámico."""
+from __future__ import annotations
+
+import pytest
+
+from services.qa_service.prompts import QA_REVIEW_PROMPT, QA_REVIEW_PROMPT_NO_PRIOR
+from services.replanner_service.critic import REPLANNER_PROMPT
+
+
+@pytest.mark.parametrize(
+    ("template", "format_marker"),
+    [
+        (QA_REVIEW_PROMPT, "OPTIONAL_IMPROVEMENTS: none"),
+        (QA_REVIEW_PROMPT_NO_PRIOR, "OPTIONAL_IMPROVEMENTS: none"),
+        (REPLANNER_PROMPT, "- <suggestion 2 (if any)>"),
+    ],
+    ids=["qa", "qa_no_prior", "replanner"],
+)
+def test_format_spec_precedes_first_field(template: str, format_marker: str) -> None:
+    # Providers reuse cached prompt prefixes; every field must come after the static spec
+    assert template.index(format_marker) < template.index("{")
@@ -0,0 +1,35 @@
+"""PreparsedTemplate: mismo resultado que str.format con plantillas preparseadas."""
+
+from __future__ import annotations
+
+import pytest
+
+from services.qa_service.prompts import QA_REVIEW_PROMPT
+from services.replanner_service.critic import (
+    REPLANNER_PROMPT,
+    REPLANNER_TOOL_LOOP_SYSTEM,
+)
+from shared.utils.prompt_template import PreparsedTemplate
+
+
+def test_render_matches_str_format_with_repeated_fields() -> None:
+    values = {field: f"<{field} {{x}}>" for field in PreparsedTemplate(QA_REVIEW_PROMPT).fields}
+    assert PreparsedTemplate(QA_REVIEW_PROMPT).render(**values) == QA_REVIEW_PROMPT.format(
+        **values
+    )
+
+
+def test_escaped_braces_kept_literal() -> None:
+    assert PreparsedTemplate("{{a}} {b}").render(b="x") == "{a} x"
+
+
+@pytest.mark.parametrize("template", ["{a:>5}", "{a!r}", "{a.b}", "{0}"])
+def test_rejects_non_plain_fields(template: str) -> None:
+    with pytest.raises(ValueError):
+        PreparsedTemplate(template)
+
+
+def test_replanner_templates_match_str_format() -> None:
+    for prompt in (REPLANNER_PROMPT, REPLANNER_TOOL_LOOP_SYSTEM):
+        values = {field: f"<{field}>" for field in PreparsedTemplate(prompt).fields}
+        assert PreparsedTemplate(prompt).render(**values) == prompt.format(**values)
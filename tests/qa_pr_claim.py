@@ -0,0 +1,73 @@
+"""QA: dos comprobaciones concurrentes del plan publican un único pr.requested."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+import orjson
+
+from services.qa_service.handlers import QADeps, _check_plan_ready_for_pr
+from shared.contracts.events import EventType
+from shared.utils import IdempotencyStore
+from shared.utils.ttl_cache import TTLCache
+
+_TASKS = [
+    {"task_id": "t1", "status": "qa_passed", "file_path": "a.py", "code": "a = 1"},
+    {"task_id": "t2", "status": "qa_passed", "file_path": "b.py", "code": "b = 2"},
+]
+
+
+class _Resp:
+    def __init__(self, body: Any) -> None:
+        self.status_code = 200
+        self.content = orjson.dumps(body)
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+class _FakeClient:
+    async def get(self, path: str, params: dict[str, Any] | None = None) -> _Resp:
+        await asyncio.sleep(0)
+        return _Resp(_TASKS if path.startswith("/tasks/") else [])
+
+    async def post(self, path: str, content: bytes, headers: dict[str, str]) -> _Resp:
+        return _Resp({})
+
+
+class _FakeBus:
+    def __init__(self) -> None:
+        self.published: list[Any] = []
+
+    async def publish(self, event: Any) -> None:
+        self.published.append(event)
+
+
+def _deps(bus: _FakeBus, store: IdempotencyStore) -> QADeps:
+    return QADeps(
+        logger=logging.getLogger("test"),
+        cfg=None,  # type: ignore[arg-type]
+        http_client=_FakeClient(),  # type: ignore[arg-type]
+        event_bus=bus,  # type: ignore[arg-type]
+        tool_registry=None,
+        dev_reasoning_cache=TTLCache(16, 60),
+        qa_reasoning_cache=TTLCache(16, 60),
+        pr_requested_plan_ids=set(),
+        pr_claim_store=store,
+    )
+
+
+def test_concurrent_replicas_publish_pr_once() -> None:
+    bus = _FakeBus()
+    store = IdempotencyStore()
+
+    async def _run() -> None:
+        await asyncio.gather(
+            _check_plan_ready_for_pr("plan", _deps(bus, store)),
+            _check_plan_ready_for_pr("plan", _deps(bus, store)),
+        )
+
+    asyncio.run(_run())
+    assert [e.event_type for e in bus.published] == [EventType.PR_REQUESTED]
+    assert len(bus.published[0].payload["files"]) == 2
@@ -0,0 +1,84 @@
+"""Caché de veredictos QA por código y tarea idénticos (QA_RESPONSE_CACHE)."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import orjson
+
+from services.qa_service.review_cache import (
+    get_cached_review,
+    review_cache_key,
+    store_cached_review,
+)
+from services.qa_service.reviewer import ReviewResult
+from shared.utils.ttl_cache import TTLCache
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: bytes, ex: int) -> None:
+        self.data[key] = value
+
+
+def _key(**overrides: Any) -> str:
+    parts: dict[str, Any] = {
+        "code": "x = 1\n",
+        "file_path": "a.py",
+        "language": "python",
+        "task_description": "Generate python code for a.py",
+        "dev_reasoning": "simple",
+        "user_locale": "en",
+        "mode": "normal",
+        "is_hot_module": False,
+    }
+    parts.update(overrides)
+    return review_cache_key(**parts)
+
+
+def test_key_changes_with_any_input_and_field_boundaries() -> None:
+    assert _key() == _key()
+    assert _key(code="x = 2\n") != _key()
+    assert _key(user_locale="es") != _key()
+    assert _key(is_hot_module=True) != _key()
+    assert _key(mode="strict") != _key()
+    assert _key(code="ab", file_path="c") != _key(code="a", file_path="bc")
+
+
+def test_store_then_get_without_redis() -> None:
+    local: TTLCache[ReviewResult] = TTLCache(8, 60)
+    result = ReviewResult(passed=False, issues=["[error|security] x"], reasoning="r")
+
+    async def _run() -> tuple[ReviewResult | None, ReviewResult | None]:
+        miss = await get_cached_review(_key(), local, None)
+        await store_cached_review(_key(), result, local, None, ttl=60)
+        return miss, await get_cached_review(_key(), local, None)
+
+    assert asyncio.run(_run()) == (None, result)
+
+
+def test_redis_payload_round_trips() -> None:
+    result = ReviewResult(
+        passed=True,
+        reasoning="ok",
+        structured_feedback={"style": [{"severity": "info"}]},
+        optional_improvements=["docstring"],
+    )
+    assert ReviewResult(**orjson.loads(orjson.dumps(result))) == result
+
+
+def test_shared_redis_client_serves_other_replicas() -> None:
+    redis = _FakeRedis()
+    result = ReviewResult(passed=True, reasoning="ok")
+
+    async def _run() -> ReviewResult | None:
+        await store_cached_review(_key(), result, TTLCache(8, 60), redis, ttl=60)
+        return await get_cached_review(_key(), TTLCache(8, 60), redis)
+
+    assert asyncio.run(_run()) == result
+    assert list(redis.data) == [_key()]
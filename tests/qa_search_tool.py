@@ -0,0 +1,145 @@
+"""search_in_repo_tool de QA: ripgrep --json cuando existe, recorrido en Python si no."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import orjson
+import pytest
+
+from services.qa_service import tools
+from shared.agent_subprocess import SubprocessResult
+
+
+def _repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "a.py").write_text("x = 1\n  def foo():\n    return x\n")
+    (tmp_path / "pkg" / "b.py").write_text("foo = 2\n")
+    monkeypatch.setattr(tools, "REPO_ROOT", tmp_path)
+    return tmp_path
+
+
+def test_search_python_fallback_without_rg(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _repo(tmp_path, monkeypatch)
+    monkeypatch.setattr(tools, "_RG_BIN", None)
+    out = tools.search_in_repo_tool(tools.SearchInRepoInput(pattern=r"def foo\(", directory="pkg"))
+    assert out["matches"] == [{"file": "pkg/a.py", "line": 2, "snippet": "def foo():"}]
+
+
+def test_search_parses_rg_json(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    root = _repo(tmp_path, monkeypatch)
+    events = [
+        {"type": "begin", "data": {"path": {"text": str(root / "pkg/a.py")}}},
+        {
+            "type": "match",
+            "data": {
+                "path": {"text": str(root / "pkg/a.py")},
+                "lines": {"text": "  def foo():\n"},
+                "line_number": 2,
+            },
+        },
+        {
+            "type": "match",
+            "data": {
+                "path": {"text": str(root / "pkg/b.py")},
+                "lines": {"text": "foo = 2\n"},
+                "line_number": 1,
+            },
+        },
+        {"type": "summary", "data": {}},
+    ]
+    stdout = "\n".join(orjson.dumps(e).decode() for e in events) + "\n"
+    seen: list[list[str]] = []
+
+    def fake_run(argv: list[str], **_: object) -> SubprocessResult:
+        seen.append(argv)
+        return SubprocessResult(0, stdout, "", False)
+
+    monkeypatch.setattr(tools, "_RG_BIN", "rg")
+    monkeypatch.setattr(tools, "run_sync_hardened", fake_run)
+    out = tools.search_in_repo_tool(
+        tools.SearchInRepoInput(pattern="foo", directory="pkg", max_results=1)
+    )
+    assert seen[0][:2] == ["rg", "--json"]
+    assert out["matches"] == [{"file": "pkg/a.py", "line": 2, "snippet": "def foo():"}]
+
+
+def test_search_falls_back_when_rg_rejects_pattern(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _repo(tmp_path, monkeypatch)
+    monkeypatch.setattr(tools, "_RG_BIN", "rg")
+    monkeypatch.setattr(
+        tools,
+        "run_sync_hardened",
+        lambda argv, **_: SubprocessResult(2, "", "regex parse error", False),
+    )
+    out = tools.search_in_repo_tool(tools.SearchInRepoInput(pattern="foo(", directory="pkg"))
+    assert {m["file"] for m in out["matches"]} == {"pkg/a.py"}
+
+
+def test_search_python_fallback_stays_line_based(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _repo(tmp_path, monkeypatch)
+    (tmp_path / "pkg" / "c.txt").write_text("foo\nbar foo foo\r\nbaz\n")
+    (tmp_path / "pkg" / "d.bin").write_bytes(b"\0foo\n")
+    (tmp_path / "pkg" / "e.txt").write_text("")
+    monkeypatch.setattr(tools, "_RG_BIN", None)
+    out = tools.search_in_repo_tool(
+        tools.SearchInRepoInput(pattern=r"foo$|foo\s+baz", directory="pkg")
+    )
+    hits = sorted((m["file"], m["line"], m["snippet"]) for m in out["matches"])
+    assert hits == [("pkg/c.txt", 1, "foo"), ("pkg/c.txt", 2, "bar foo foo")]
+
+
+def test_search_python_fallback_literal_and_empty_patterns(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _repo(tmp_path, monkeypatch)
+    monkeypatch.setattr(tools, "_RG_BIN", None)
+    literal = tools.search_in_repo_tool(tools.SearchInRepoInput(pattern="return x", directory="pkg"))
+    assert [(m["file"], m["line"]) for m in literal["matches"]] == [("pkg/a.py", 3)]
+    every_line = tools.search_in_repo_tool(tools.SearchInRepoInput(pattern="", directory="pkg"))
+    assert sorted((m["file"], m["line"]) for m in every_line["matches"]) == [
+        ("pkg/a.py", 1),
+        ("pkg/a.py", 2),
+        ("pkg/a.py", 3),
+        ("pkg/b.py", 1),
+    ]
+
+
+def test_search_python_fallback_prunes_vendor_and_cache_dirs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _repo(tmp_path, monkeypatch)
+    for skipped in ("pkg/.git/objects", "pkg/node_modules/lib", "pkg/__pycache__"):
+        (tmp_path / skipped).mkdir(parents=True)
+        (tmp_path / skipped / "hit.js").write_text("foo\n")
+    (tmp_path / "pkg" / "notes.pyc").write_text("foo\n")
+    monkeypatch.setattr(tools, "_RG_BIN", None)
+    out = tools.search_in_repo_tool(tools.SearchInRepoInput(pattern="foo", directory="pkg"))
+    assert {m["file"] for m in out["matches"]} == {"pkg/a.py", "pkg/b.py"}
+
+
+@pytest.mark.parametrize("pattern", ['caf."', r"na\wve", "(?i)CAFÉ", r"caf\S", r"\bnaïve\b"])
+def test_search_python_fallback_unicode_patterns(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, pattern: str
+) -> None:
+    _repo(tmp_path, monkeypatch)
+    (tmp_path / "pkg" / "u.py").write_text('x = "café"\ny = "naïve"\n', encoding="utf-8")
+    monkeypatch.setattr(tools, "_RG_BIN", None)
+    out = tools.search_in_repo_tool(tools.SearchInRepoInput(pattern=pattern, directory="pkg"))
+    assert [m["file"] for m in out["matches"]] == ["pkg/u.py"]
+
+
+@pytest.mark.parametrize("pattern", ["import os$", r"os\s*$", "^import os"])
+def test_search_python_fallback_crlf_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, pattern: str
+) -> None:
+    _repo(tmp_path, monkeypatch)
+    (tmp_path / "pkg" / "w.py").write_bytes(b"import os\r\nimport sys\r\n")
+    monkeypatch.setattr(tools, "_RG_BIN", None)
+    out = tools.search_in_repo_tool(tools.SearchInRepoInput(pattern=pattern, directory="pkg"))
+    assert out["matches"] == [{"file": "pkg/w.py", "line": 1, "snippet": "import os"}]
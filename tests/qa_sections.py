@@ -36,3 +36,14 @@ OPTIONAL_IMPROVEMENTS: none
 """
     r = _parse_review_response(raw)
     assert r.required_changes == ["Use pathlib for paths"]
+
+
+def test_headers_match_any_case() -> None:
+    raw = """Reasoning: Looks fine.
+verdict: pass
+Issues: none
+"""
+    r = _parse_review_response(raw)
+    assert r.passed
+    assert r.reasoning == "Looks fine."
+    assert r.issues == []
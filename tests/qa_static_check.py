@@ -0,0 +1,23 @@
+"""Chequeo estático de patrones peligrosos del reviewer QA."""
+
+from __future__ import annotations
+
+from services.qa_service.reviewer import _static_check
+
+
+def test_dangerous_patterns_reported_once_in_config_order() -> None:
+    code = "pickle.loads(b)\nx = eval(s)\ny = eval(t)\nos.system(cmd)\n"
+    assert _static_check(code) == [
+        "Dangerous pattern detected: `eval(`",
+        "Dangerous pattern detected: `os.system(`",
+        "Dangerous pattern detected: `pickle.loads(`",
+    ]
+
+
+def test_clean_code_has_no_static_issues() -> None:
+    assert _static_check("def add(a, b):\n    return a + b\n") == []
+
+
+def test_heuristic_markers_case_insensitive_and_overlapping() -> None:
+    issues = _static_check("data = URLOPEN(url)\nkey = API_KEY\n")
+    assert len(issues) == 3  # network, fs ("open(" inside urlopen) and secrets
@@ -0,0 +1,35 @@
+"""Herramientas de memoria de QA: reutilizan el cliente HTTP del servicio."""
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import orjson
+
+from services.qa_service.tools import build_qa_tool_registry
+from shared.tools.executor import execute_tool
+
+
+def test_memory_tools_share_service_client() -> None:
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        if request.url.path == "/events":
+            return httpx.Response(200, content=orjson.dumps([{"event_type": "qa.failed"}]))
+        return httpx.Response(200, content=orjson.dumps({"patterns": [{"module": "svc/a"}]}))
+
+    async def _run() -> None:
+        client = httpx.AsyncClient(
+            base_url="http://memory", transport=httpx.MockTransport(handler)
+        )
+        registry = build_qa_tool_registry(client)
+        events = await execute_tool(registry, "query_events", {"limit": 5})
+        patterns = await execute_tool(registry, "failure_patterns", {"module_prefix": "svc"})
+        assert events.success and events.output == {"events": [{"event_type": "qa.failed"}]}
+        assert patterns.success and patterns.output == {"patterns": [{"module": "svc/a"}]}
+        assert not client.is_closed
+        await client.aclose()
+
+    asyncio.run(_run())
+    assert seen == ["/events", "/patterns/failures"]
@@ -0,0 +1,83 @@
+"""Replanner: tokens_used y plan.revision_suggested se guardan en un único POST bulk."""
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import orjson
+import pytest
+
+from services.replanner_service import main
+from services.replanner_service.critic import ReplanDecision
+from shared.contracts.events import QAResultPayload
+
+
+class _Resp:
+    status_code = 200
+
+
+class _FakeClient:
+    def __init__(self) -> None:
+        self.posts: list[tuple[str, Any]] = []
+
+    async def post(self, path: str, content: bytes, headers: dict[str, str]) -> _Resp:
+        self.posts.append((path, orjson.loads(content)))
+        return _Resp()
+
+
+class _FakeBus:
+    def __init__(self) -> None:
+        self.published: list[Any] = []
+
+    async def publish(self, event: Any) -> None:
+        self.published.append(event)
+
+
+def _run(monkeypatch: pytest.MonkeyPatch, revision_needed: bool) -> _FakeClient:
+    client, bus = _FakeClient(), _FakeBus()
+    decision = ReplanDecision(revision_needed, "high", "tests keep failing", ["add tests"])
+
+    async def fake_analyse(**_: Any) -> tuple[ReplanDecision, int, int]:
+        return decision, 120, 30
+
+    async def no_memory(plan_id: str) -> str:
+        return ""
+
+    monkeypatch.setattr(
+        main,
+        "cfg",
+        SimpleNamespace(llm_provider="mock", enable_tool_loop=False, agent_goal="g"),
+    )
+    monkeypatch.setattr(main, "http_client", client)
+    monkeypatch.setattr(main, "event_bus", bus)
+    monkeypatch.setattr(main, "analyse_outcome", fake_analyse)
+    monkeypatch.setattr(main, "_fetch_memory_context", no_memory)
+    monkeypatch.setattr(main, "_replan_suggested_for_plan", {})
+    outcome = QAResultPayload(
+        task_id="t",
+        plan_id="p",
+        passed=False,
+        issues=["boom"],
+        code="x = 1",
+        file_path="svc/a.py",
+        qa_attempt=1,
+    )
+    asyncio.run(main._analyse_and_emit_revision("p", outcome, "qa_failed"))
+    assert len(bus.published) == int(revision_needed)
+    return client
+
+
+def test_revision_and_tokens_stored_in_one_bulk_post(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _run(monkeypatch, revision_needed=True)
+    assert [path for path, _ in client.posts] == ["/events/bulk"]
+    assert [e["event_type"] for e in client.posts[0][1]] == [
+        "metrics.tokens_used",
+        "plan.revision_suggested",
+    ]
+
+
+def test_tokens_still_stored_without_revision(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _run(monkeypatch, revision_needed=False)
+    assert [path for path, _ in client.posts] == ["/events/bulk"]
+    assert [e["event_type"] for e in client.posts[0][1]] == ["metrics.tokens_used"]
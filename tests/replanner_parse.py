@@ -78,3 +78,20 @@ SUGGESTIONS:
     assert d.reason.startswith("Lowercase")
     assert d.severity == "high"
     assert d.revision_needed
+
+
+def test_headers_any_case_and_indented() -> None:
+    raw = """  reason: Hot module keeps failing.
+Severity: HIGH
+revision_needed: Yes
+suggestions:
+  - Add validation tests for services/foo
+- n/a
+"""
+    d = _parse_replanner_response(raw)
+    assert d == ReplanDecision(
+        revision_needed=True,
+        severity="high",
+        reason="Hot module keeps failing.",
+        suggestions=["Add validation tests for services/foo"],
+    )
@@ -0,0 +1,85 @@
+"""SECURITY_RULES: casos positivos y negativos por regla (límites de palabra incluidos)."""
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from services.security_service.config import (
+    SECURITY_RULE_LITERALS,
+    SECURITY_RULES,
+    SecurityConfig,
+)
+from services.security_service.scanner import _scan_single_file
+
+_RULES = dict(SECURITY_RULES)
+
+
+@pytest.mark.parametrize(
+    ("rule", "code", "expected"),
+    [
+        ("dangerous_eval", "x = eval (data)", True),
+        ("dangerous_eval", "x = safe_eval(data)", False),
+        ("dangerous_exec", "exec(code)", True),
+        ("dangerous_exec", "cursor.executemany(q)", False),
+        ("pickle_deserialize", "obj = pickle.loads(raw)", True),
+        ("pickle_deserialize", "obj = cpickle.loads(raw)", False),
+        ("marshal_deserialize", "marshal.loads(b)", True),
+        ("shell_injection_os", "os.system('ls')", True),
+        ("shell_injection_os", "pos.system('ls')", False),
+        ("shell_injection_subprocess", "subprocess.run(cmd, shell=True)", True),
+        ("shell_injection_subprocess", "mysubprocess.run(cmd, shell=True)", False),
+        ("shell_injection_subprocess", "subprocess.run(cmd)\nshell=True", False),
+        ("flask_debug_true", "app.run(host='0.0.0.0', debug=True)", True),
+        ("flask_debug_true", "webapp.run(debug=True)", False),
+        ("django_debug_true", "DEBUG = True", True),
+        ("django_debug_true", "APP_DEBUG = True", False),
+        ("hardcoded_password", "PassWord = 'hunter22'", True),
+        ("sql_concat_plus", 'q = "Select * from t where id=" + uid', True),
+        ("shell_injection_subprocess", "subprocess.run(a); subprocess.call(b, shell=True)", True),
+        ("sql_injection_risk", "cur.execute('x'); cur.execute('y %s', v)", True),
+        ("flask_debug_true", "app.run(\n  port=1,\n  debug=True)", True),
+        ("flask_debug_true", "app.run(port=1)\nconfig(debug=True)", False),
+    ],
+)
+def test_rule_matches(rule: str, code: str, expected: bool) -> None:
+    assert bool(_RULES[rule].search(code)) is expected
+
+
+@pytest.mark.parametrize(
+    ("rule", "head"),
+    [
+        ("shell_injection_subprocess", "subprocess.run("),
+        ("sql_injection_risk", "execute('"),
+        ("flask_debug_true", "app.run("),
+    ],
+)
+def test_repeated_calls_without_flag_scan_in_linear_time(rule: str, head: str) -> None:
+    # Each unmatched call used to rescan to the end of the line/file (seconds here)
+    start = time.perf_counter()
+    assert _RULES[rule].search(head * 20_000) is None
+    assert time.perf_counter() - start < 2.0
+
+
+def test_every_rule_has_prescreen_literals() -> None:
+    assert set(SECURITY_RULE_LITERALS) == set(_RULES)
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "PassWord = 'hunter22'",
+        "paſsword = 'hunter22'",
+        'q = "SELECT * FROM t WHERE id=" + uid',
+        "subprocess.run(cmd, shell=True); eval(x)",
+        "print('clean')",
+    ],
+)
+def test_prescreen_does_not_change_violations(code: str) -> None:
+    cfg = SecurityConfig("", "", "INFO", "", "", "", "", False, False)
+    expected = [
+        f"[f.py] Rule '{name}': pattern matched"
+        for name, pattern in SECURITY_RULES
+        if pattern.search(code)
+    ]
+    assert _scan_single_file("f.py", code, "python", cfg) == expected
@@ -0,0 +1,58 @@
+"""store_events: un único POST /events/bulk y fallback a /events uno a uno."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import orjson
+
+from shared.contracts.events import BaseEvent, EventType
+from shared.utils import store_events
+
+
+class _Resp:
+    def __init__(self, status_code: int) -> None:
+        self.status_code = status_code
+
+
+class _FakeClient:
+    def __init__(self, bulk_status: int) -> None:
+        self.bulk_status = bulk_status
+        self.posts: list[tuple[str, Any]] = []
+
+    async def post(self, path: str, content: bytes, headers: dict[str, str]) -> _Resp:
+        assert headers["content-type"] == "application/json"
+        self.posts.append((path, orjson.loads(content)))
+        return _Resp(self.bulk_status if path == "/events/bulk" else 200)
+
+
+def _evts() -> list[BaseEvent]:
+    return [
+        BaseEvent(event_type=EventType.PLAN_CREATED, producer="t", payload={"plan_id": "p"}),
+        BaseEvent(event_type=EventType.TASK_ASSIGNED, producer="t", payload={"plan_id": "p"}),
+    ]
+
+
+def test_store_events_single_bulk_post() -> None:
+    client = _FakeClient(200)
+    events = _evts()
+    asyncio.run(store_events(client, events))
+    assert [path for path, _ in client.posts] == ["/events/bulk"]
+    body = client.posts[0][1]
+    assert [b["event_id"] for b in body] == [e.event_id for e in events]
+    assert body[1]["event_type"] == EventType.TASK_ASSIGNED.value
+
+
+def test_store_events_falls_back_without_bulk_endpoint() -> None:
+    client = _FakeClient(404)
+    events = _evts()
+    asyncio.run(store_events(client, events))
+    assert [path for path, _ in client.posts] == ["/events/bulk", "/events", "/events"]
+    assert {b["event_id"] for _, b in client.posts[1:]} == {e.event_id for e in events}
+
+
+def test_store_events_noop_without_client_or_events() -> None:
+    asyncio.run(store_events(None, _evts()))
+    client = _FakeClient(200)
+    asyncio.run(store_events(client, []))
+    assert client.posts == []
@@ -0,0 +1,42 @@
+"""TTLCache: tope de entradas, expiración por antigüedad y pop."""
+
+from __future__ import annotations
+
+from shared.utils.ttl_cache import TTLCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_oldest_entries_evicted_over_maxsize() -> None:
+    cache: TTLCache[str] = TTLCache(maxsize=2, ttl=60, clock=_Clock())
+    cache["a"] = "1"
+    cache["b"] = "2"
+    cache["c"] = "3"
+    assert "a" not in cache
+    assert cache.get("b") == "2"
+    assert len(cache) == 2
+
+
+def test_expired_entries_dropped_on_read_and_write() -> None:
+    clock = _Clock()
+    cache: TTLCache[str] = TTLCache(maxsize=10, ttl=30, clock=clock)
+    cache["old"] = "x"
+    clock.now = 31
+    assert cache.get("old", "") == ""
+    cache["kept"] = "y"
+    clock.now = 45
+    cache["new"] = "z"
+    assert len(cache) == 2
+
+
+def test_pop_returns_value_once() -> None:
+    cache: TTLCache[str] = TTLCache(maxsize=10, ttl=30, clock=_Clock())
+    cache["t"] = "reasoning"
+    assert cache.pop("t") == "reasoning"
+    assert cache.pop("t", "") == ""